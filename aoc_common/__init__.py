@@ -0,0 +1 @@
+"""Helpers shared by the day modules and the problem runner."""
@@ -0,0 +1,81 @@
+"""
+On-disk cache of answers, for the day modules' problem_dispatch.
+
+Entries are keyed by a hash of the problem code section of the solver's source file, a
+hash of the aoc_common modules that file imports (as for the parse cache), a hash of the
+input file's contents, and the part number. Edits outside the problem code section, like
+to the CLI or dispatch code, keep existing answers, while an edit to a shared helper
+retires them.
+"""
+
+import hashlib
+import os
+import pickle
+
+from pathlib import Path
+
+from aoc_common.input_cache import common_digest, file_digest
+
+CACHE_FOLDER = Path(__file__).parent.parent / "answer_cache"
+CACHE_SUFFIX = ".pickle"
+CODE_START = "# ---=== PROBLEM CODE BELOW ===---"
+CODE_END = "# ---=== PROBLEM CODE ABOVE ===---"
+
+
+def problem_code_digest(source_path: Path) -> str:
+    """
+    Returns the sha256 hex digest of the problem code section of a source file.
+    Files without the section markers are hashed whole.
+    """
+    source = Path(source_path).read_text()
+    start = source.find(CODE_START)
+    end = source.find(CODE_END, start)
+    if start != -1 and end != -1:
+        source = source[start:end]
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def answer_key(solver, data_path: Path, part: int) -> str:
+    """
+    Builds the cache key for solving part of data_path with solver. The solver's name is
+    part of the key, so each engine's answers are cached separately.
+    """
+    source_path = Path(solver.__code__.co_filename)
+    code_digest = problem_code_digest(source_path)
+    dependency_digest = common_digest(source_path)
+    input_digest = file_digest(data_path)
+    key = (
+        f"{code_digest}:{dependency_digest}:{input_digest}:{part}:{solver.__qualname__}"
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def clear_cache(cache_folder: Path = CACHE_FOLDER) -> None:
+    """Removes every cached answer."""
+    for entry in cache_folder.glob(f"*{CACHE_SUFFIX}"):
+        entry.unlink(missing_ok=True)
+
+
+def cached_answer(
+    solver, loader, data_path: Path, part: int, cache_folder: Path = CACHE_FOLDER
+):
+    """
+    Returns solver(loader(data_path)), loading it from the on-disk cache when possible.
+    On a hit, the input isn't loaded at all. Answers that raise aren't cached.
+    """
+    entry = cache_folder / f"{answer_key(solver, data_path, part)}{CACHE_SUFFIX}"
+    try:
+        with open(entry, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except FileNotFoundError:
+        pass
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        entry.unlink(missing_ok=True)
+
+    answer = solver(loader(data_path))
+    cache_folder.mkdir(parents=True, exist_ok=True)
+    temp_entry = entry.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_entry, "wb") as cache_file:
+        pickle.dump(answer, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_entry, entry)
+    return answer
@@ -0,0 +1,113 @@
+import pytest
+
+from aoc_common import answer_cache, input_cache
+
+calls = []
+
+
+def load_lines(data_path):
+    with open(data_path, "r") as raw_input:
+        return [l.strip() for l in raw_input.readlines()]
+
+
+def count_lines(input_data):
+    calls.append(input_data)
+    return len(input_data)
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("a\nb\nc\n")
+    calls.clear()
+    return path
+
+
+def test_cached_answer_reuses_entry(data_path, tmp_path):
+    """
+    Checks that a second solve of the same part and input is served from the cache.
+    """
+    cache = tmp_path / "cache"
+    first = answer_cache.cached_answer(
+        count_lines, load_lines, data_path, 1, cache_folder=cache
+    )
+    second = answer_cache.cached_answer(
+        count_lines, load_lines, data_path, 1, cache_folder=cache
+    )
+    assert first == second == 3
+    assert len(calls) == 1
+
+
+def test_cached_answer_keys_on_part_and_input(data_path, tmp_path):
+    """Checks that another part, or a changed input, is solved again."""
+    cache = tmp_path / "cache"
+    answer_cache.cached_answer(
+        count_lines, load_lines, data_path, 1, cache_folder=cache
+    )
+    answer_cache.cached_answer(
+        count_lines, load_lines, data_path, 2, cache_folder=cache
+    )
+    data_path.write_text("d\n")
+    assert (
+        answer_cache.cached_answer(
+            count_lines, load_lines, data_path, 1, cache_folder=cache
+        )
+        == 1
+    )
+    assert len(calls) == 3
+
+
+def test_cached_answer_keys_on_solver(data_path, tmp_path):
+    """
+    Checks that another engine's solver for the same part doesn't reuse the answer.
+    """
+    cache = tmp_path / "cache"
+
+    def count_lines_again(input_data):
+        calls.append(input_data)
+        return len(input_data)
+
+    answer_cache.cached_answer(
+        count_lines, load_lines, data_path, 1, cache_folder=cache
+    )
+    answer_cache.cached_answer(
+        count_lines_again, load_lines, data_path, 1, cache_folder=cache
+    )
+    assert len(calls) == 2
+
+
+def test_problem_code_digest_ignores_code_outside_section(tmp_path):
+    """Checks that only the problem code section affects the digest."""
+    source = tmp_path / "problem.py"
+    body = (
+        f"{answer_cache.CODE_START}\n"
+        "def part_1(x):\n    return x\n"
+        f"{answer_cache.CODE_END}\n"
+    )
+    source.write_text("import sys\n" + body)
+    digest = answer_cache.problem_code_digest(source)
+    source.write_text("import os\n" + body + "print()\n")
+    assert answer_cache.problem_code_digest(source) == digest
+    source.write_text(body.replace("return x", "return -x"))
+    assert answer_cache.problem_code_digest(source) != digest
+
+
+def test_answer_key_follows_common_modules(data_path, tmp_path, monkeypatch):
+    """
+    Checks that editing a common module the solver's file imports retires its answers.
+    """
+    common = tmp_path / "aoc_common"
+    common.mkdir()
+    (common / "helper.py").write_text("def size(x): return len(x)\n")
+    monkeypatch.setattr(
+        answer_cache,
+        "common_digest",
+        lambda path: input_cache.common_digest(path, common),
+    )
+    source = tmp_path / "problem.py"
+    source.write_text("from aoc_common import helper\ndef part_1(x):\n    return x\n")
+    namespace = {}
+    exec(compile("def part_1(x):\n    return x\n", str(source), "exec"), namespace)
+    key = answer_cache.answer_key(namespace["part_1"], data_path, 1)
+    (common / "helper.py").write_text("def size(x): return len(x) + 1\n")
+    assert answer_cache.answer_key(namespace["part_1"], data_path, 1) != key
@@ -0,0 +1,48 @@
+"""
+Growth exponent fitting for the runner's complexity command.
+
+A part is run on generated inputs of geometrically increasing size, and a straight line
+is fitted to log(cost) against log(size). The slope is the exponent k in cost ~ size^k,
+where size is in the generator's own units (lines, races, grid width, etc.).
+"""
+
+import math
+
+
+def geometric_sizes(largest: int, factor: float, steps: int) -> list:
+    """
+    steps sizes, each factor times the one before, ending at largest. Duplicates are
+    dropped.
+    """
+    sizes = [max(1, round(largest / factor**i)) for i in range(steps)]
+    return sorted(set(sizes))
+
+
+def fit_exponent(sizes: list, costs: list) -> tuple:
+    """
+    Least squares fit of log(cost) = k * log(size) + c. Returns (k, r_squared). Costs
+    are clamped to a tiny positive value before taking logs.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(cost, 1e-12)) for cost in costs]
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    if sxx == 0:
+        return 0.0, 0.0
+    slope = sxy / sxx
+    r_squared = sxy * sxy / (sxx * syy) if syy else 1.0
+    return slope, r_squared
+
+
+def big_o(exponent: float) -> str:
+    """A rough big-O label, rounding the exponent to the nearest half."""
+    rounded = round(exponent * 2) / 2
+    if rounded <= 0:
+        return "O(1)"
+    if rounded == 1:
+        return "O(n)"
+    return f"O(n^{rounded:g})"
@@ -0,0 +1,29 @@
+import pytest
+
+from aoc_common import complexity
+
+
+def test_geometric_sizes():
+    """Checks that sizes grow by the factor and end at the largest size."""
+    assert complexity.geometric_sizes(800, 2, 4) == [100, 200, 400, 800]
+    assert complexity.geometric_sizes(2, 2, 4) == [1, 2]
+
+
+@pytest.mark.parametrize("exponent", [0.0, 1.0, 2.0, 3.0])
+def test_fit_exponent_recovers_power_law(exponent):
+    """
+    Checks that an exact power law is fitted with its exponent and a perfect r squared.
+    """
+    sizes = [10, 20, 40, 80, 160]
+    slope, r_squared = complexity.fit_exponent(
+        sizes, [5 * size**exponent for size in sizes]
+    )
+    assert slope == pytest.approx(exponent)
+    assert r_squared == pytest.approx(1.0)
+
+
+def test_big_o():
+    assert complexity.big_o(0.1) == "O(1)"
+    assert complexity.big_o(1.1) == "O(n)"
+    assert complexity.big_o(1.6) == "O(n^1.5)"
+    assert complexity.big_o(2.2) == "O(n^2)"
@@ -0,0 +1,188 @@
+"""
+Differential testing of a day's solver engines against its reference engine.
+
+An engine's part is solved alongside the reference on generated inputs of increasing
+size, several seeds per size, each solver on its own fresh parse. Answers must match
+exactly, and an exception only matches the same exception type. On the first mismatch
+the failing input is minimized, by deleting runs of lines while the engines still
+disagree, so the report shows the smallest input found that reproduces it. Solve times
+are summed per size along the way, after one untimed solve with each, to show the
+engine's speed relative to the reference as inputs grow.
+"""
+
+import time
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc_common.complexity import geometric_sizes
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+
+DEFAULT_SEEDS = 20
+DEFAULT_STEPS = 6
+MAX_MINIMIZE_CHECKS = 500
+
+
+@dataclass
+class Mismatch:
+    size: int
+    seed: int
+    reference: tuple
+    variant: tuple
+    input_text: str
+
+
+@dataclass
+class Report:
+    part: int
+    engine: str
+    cases: int = 0
+    timings: list = field(default_factory=list)
+    mismatch: Mismatch = None
+
+    def describe(self) -> str:
+        lines = [f"part {self.part} {self.engine}: {self.cases} inputs checked"]
+        for row in self.timings:
+            lines.append(
+                f"  size {row['size']:>8}:"
+                f" reference {row['reference_s'] * 1000:.3f} ms,"
+                f" {self.engine} {row['variant_s'] * 1000:.3f} ms ({speedup(row):.2f}x)"
+            )
+        if self.mismatch is not None:
+            mismatch = self.mismatch
+            lines.append(
+                f"  mismatch at size {mismatch.size} seed {mismatch.seed}: "
+                f"reference {outcome_text(mismatch.reference)}, "
+                f"{self.engine} {outcome_text(mismatch.variant)}, on minimized input:"
+            )
+            lines.append(mismatch.input_text)
+        return "\n".join(lines)
+
+
+def default_sizes(puzzle_size: int, steps: int = DEFAULT_STEPS) -> list:
+    """Sizes doubling up to the puzzle's own size."""
+    return geometric_sizes(puzzle_size, 2, steps)
+
+
+def speedup(row: dict) -> float:
+    """How many times faster the engine was than the reference, in one timings row."""
+    return row["reference_s"] / row["variant_s"] if row["variant_s"] else float("inf")
+
+
+def outcome_text(outcome: tuple) -> str:
+    status, value = outcome
+    return repr(value) if status == "ok" else f"raised {value}"
+
+
+def solve(module, solver, data_path: Path) -> tuple:
+    """
+    Parses data_path and solves it. Returns (("ok", answer) or ("error", exception type
+    name), seconds spent solving).
+    """
+    input_data = module.parse_input(data_path)
+    start = time.perf_counter()
+    try:
+        outcome = ("ok", solver(input_data))
+    except Exception as exc:
+        outcome = ("error", type(exc).__name__)
+    return outcome, time.perf_counter() - start
+
+
+def disagree(module, reference, variant, data_path: Path) -> tuple:
+    """
+    Solves data_path with both solvers. Returns (differ, reference outcome, variant
+    outcome).
+    """
+    expected, _ = solve(module, reference, data_path)
+    actual, _ = solve(module, variant, data_path)
+    return expected != actual, expected, actual
+
+
+def minimize(lines: list, still_fails, max_checks: int = MAX_MINIMIZE_CHECKS) -> list:
+    """
+    Greedily removes runs of lines, halving the run length whenever no run can be
+    removed, while still_fails(lines) stays true. Stops early after max_checks calls.
+    """
+    chunk = max(1, len(lines) // 2)
+    checks = 0
+    while checks < max_checks:
+        start = 0
+        removed = False
+        while start < len(lines) and checks < max_checks:
+            candidate = lines[:start] + lines[start + chunk :]
+            checks += 1
+            if candidate and still_fails(candidate):
+                lines = candidate
+                removed = True
+            else:
+                start += chunk
+        if not removed:
+            if chunk == 1:
+                break
+            chunk //= 2
+    return lines
+
+
+def minimize_input(module, reference, variant, text: str, data_path: Path) -> str:
+    """The smallest set of text's lines found on which the solvers still disagree."""
+
+    def still_fails(lines):
+        data_path.write_text("\n".join(lines) + "\n")
+        try:
+            differ, expected, _ = disagree(module, reference, variant, data_path)
+        except Exception:
+            return False
+        return differ and expected[0] == "ok"
+
+    lines = minimize(text.splitlines(), still_fails)
+    return "\n".join(lines) + "\n"
+
+
+def check_engine(
+    module,
+    generator,
+    part: int,
+    engine: str,
+    folder: Path,
+    sizes: list = None,
+    seeds: int = DEFAULT_SEEDS,
+) -> Report:
+    """
+    Checks an engine's part against the reference on seeds generated inputs of each size
+    (default: doubling up to the puzzle size), writing them to folder. Stops at the
+    first mismatch, which is minimized.
+    """
+    if sizes is None:
+        sizes = default_sizes(generator.PUZZLE_SIZE)
+    reference = solvers(module.ENGINES, DEFAULT_ENGINE)[part]
+    variant = solvers(module.ENGINES, engine)[part]
+    data_path = Path(folder) / f"differential_part_{part}_{engine}.txt"
+    report = Report(part, engine)
+    if sizes:
+        # One untimed solve each first, so one-time costs like a lazy NumPy import don't
+        # land in the first size's timings.
+        data_path.write_text(generator.generate(sizes[0], seed=0))
+        solve(module, reference, data_path)
+        solve(module, variant, data_path)
+    for size in sizes:
+        row = {"size": size, "cases": 0, "reference_s": 0.0, "variant_s": 0.0}
+        report.timings.append(row)
+        for seed in range(seeds):
+            text = generator.generate(size, seed=seed)
+            data_path.write_text(text)
+            expected, reference_s = solve(module, reference, data_path)
+            actual, variant_s = solve(module, variant, data_path)
+            report.cases += 1
+            row["cases"] += 1
+            row["reference_s"] += reference_s
+            row["variant_s"] += variant_s
+            if expected != actual:
+                if expected[0] == "ok":
+                    text = minimize_input(module, reference, variant, text, data_path)
+                    data_path.write_text(text)
+                    _, expected, actual = disagree(
+                        module, reference, variant, data_path
+                    )
+                report.mismatch = Mismatch(size, seed, expected, actual, text)
+                return report
+    return report
@@ -0,0 +1,93 @@
+import time
+
+from types import SimpleNamespace
+
+from aoc_common import differential
+
+
+def parse_input(data_path):
+    return [int(l) for l in data_path.read_text().split()]
+
+
+def generate(size, seed=0):
+    return "\n".join(str((seed * 7 + i * 3) % 11) for i in range(size)) + "\n"
+
+
+def capped_sum(input_data):
+    """Wrong whenever a value above 8 is present."""
+    return sum(min(n, 8) for n in input_data)
+
+
+def module_with(variant):
+    return SimpleNamespace(
+        parse_input=parse_input,
+        ENGINES={"python": {1: sum, 2: max}, "variant": {1: variant}},
+    )
+
+
+GENERATOR = SimpleNamespace(generate=generate, PUZZLE_SIZE=16)
+
+
+def test_check_engine_agreeing_variant(tmp_path):
+    """Checks that a correct variant passes every input, with a timing row per size."""
+    report = differential.check_engine(
+        module_with(lambda data: sum(reversed(data))),
+        GENERATOR,
+        1,
+        "variant",
+        tmp_path,
+        seeds=5,
+    )
+    assert report.mismatch is None
+    assert [row["size"] for row in report.timings] == [1, 2, 4, 8, 16]
+    assert report.cases == 25
+
+
+def test_check_engine_warms_up_before_timing(tmp_path):
+    """
+    Checks that a one-time cost on an engine's first call stays out of the timings.
+    """
+    calls = []
+
+    def slow_first_call(data):
+        if not calls:
+            time.sleep(0.5)
+        calls.append(data)
+        return sum(data)
+
+    report = differential.check_engine(
+        module_with(slow_first_call),
+        GENERATOR,
+        1,
+        "variant",
+        tmp_path,
+        sizes=[4],
+        seeds=1,
+    )
+    assert len(calls) == 2
+    assert report.timings[0]["variant_s"] < 0.25
+
+
+def test_check_engine_minimizes_mismatch(tmp_path):
+    """Checks that a mismatch is reported on a single line that still shows it."""
+    report = differential.check_engine(
+        module_with(capped_sum), GENERATOR, 1, "variant", tmp_path, seeds=5
+    )
+    mismatch = report.mismatch
+    assert mismatch is not None
+    assert len(mismatch.input_text.splitlines()) == 1
+    assert int(mismatch.input_text) > 8
+    assert mismatch.reference != mismatch.variant
+    assert "mismatch at size" in report.describe()
+
+
+def test_check_engine_compares_exceptions(tmp_path):
+    """Checks that a variant raising where the reference doesn't is a mismatch."""
+    report = differential.check_engine(
+        module_with(lambda data: 1 / 0), GENERATOR, 1, "variant", tmp_path, seeds=1
+    )
+    assert report.mismatch.variant == ("error", "ZeroDivisionError")
+
+
+def test_minimize():
+    assert differential.minimize(list(range(20)), lambda lines: 13 in lines) == [13]
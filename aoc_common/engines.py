@@ -0,0 +1,24 @@
+"""
+Solver engine selection for the day modules.
+
+Each day module has an ENGINES dict, mapping an engine name to the parts it implements:
+
+    ENGINES = {
+        "python": {1: part_1, 2: part_2},
+        "numpy": {1: part_1_numpy, 2: part_2_numpy},
+    }
+
+The "python" engine is the readable reference, and every day has it. Other engines may
+implement only some parts; the rest fall back to the reference.
+"""
+
+DEFAULT_ENGINE = "python"
+
+
+def solvers(engines: dict, name: str = DEFAULT_ENGINE) -> dict:
+    """The part number to solver mapping for the named engine."""
+    if name not in engines:
+        raise ValueError(
+            f"unknown engine {name!r}, choose from {', '.join(sorted(engines))}"
+        )
+    return {**engines[DEFAULT_ENGINE], **engines[name]}
@@ -0,0 +1,16 @@
+import pytest
+
+from aoc_common import engines
+
+ENGINES = {"python": {1: sum, 2: max}, "fast": {2: min}}
+
+
+def test_solvers_falls_back_to_reference():
+    """Checks that parts an engine doesn't implement come from the reference engine."""
+    assert engines.solvers(ENGINES) == {1: sum, 2: max}
+    assert engines.solvers(ENGINES, "fast") == {1: sum, 2: min}
+
+
+def test_solvers_rejects_unknown_engine():
+    with pytest.raises(ValueError, match="fast, python"):
+        engines.solvers(ENGINES, "gpu")
@@ -0,0 +1,43 @@
+"""
+Shared command line handling for the per-day synthetic input generators.
+
+Each day folder has an aoc_2023_day_XX_generator.py defining generate(size, seed) -> str
+and PUZZLE_SIZE, the size of the real puzzle input in that day's units.
+"""
+
+import argparse
+import sys
+
+from pathlib import Path
+
+
+def write_input(text: str, output_path: Path) -> None:
+    with open(output_path, "w") as output_file:
+        output_file.write(text)
+
+
+def generator_cli(generate, puzzle_size: int) -> None:
+    """
+    Parses generator arguments, then writes the generated input to a file or stdout.
+    """
+    parser = argparse.ArgumentParser()
+    size_group = parser.add_mutually_exclusive_group(required=True)
+    size_group.add_argument(
+        "size", type=int, nargs="?", help="size of the input to generate"
+    )
+    size_group.add_argument(
+        "--scale",
+        type=float,
+        help=f"size as a multiple of the puzzle size ({puzzle_size})",
+    )
+    parser.add_argument("--seed", type=int, default=0, required=False)
+    parser.add_argument(
+        "--output", type=Path, required=False, help="defaults to stdout"
+    )
+    args = parser.parse_args()
+    size = args.size if args.scale is None else max(1, round(puzzle_size * args.scale))
+    text = generate(size, seed=args.seed)
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        write_input(text, args.output)
@@ -0,0 +1,130 @@
+"""
+A character grid backed by a 2-D NumPy uint8 array, for the grid days.
+
+The grid is built in one pass over the raw file bytes, so a cell costs one byte rather
+than one Python object. Whole-grid questions (which cells hold these characters, which
+rows or columns hold nothing else, which cells touch a marked cell) are answered with
+array operations, and lookups near the edges are clipped to the grid rather than
+wrapping or raising. NumPy is imported on first use, so importing a day module stays
+cheap.
+"""
+
+from pathlib import Path
+
+NEWLINE = ord("\n")
+ORTHOGONAL = ((-1, 0), (0, -1), (0, 1), (1, 0))
+DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class Grid:
+    def __init__(self, cells):
+        self.cells = cells
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Grid":
+        """
+        Builds a grid from newline separated rows of equal width. Raises ValueError if
+        ragged.
+        """
+        import numpy as np
+
+        data = data.replace(b"\r", b"").strip(b"\n") + b"\n"
+        width = data.index(b"\n")
+        raw = np.frombuffer(data, dtype=np.uint8)
+        if raw.size % (width + 1):
+            raise ValueError("grid rows are not all the same width")
+        raw = raw.reshape(-1, width + 1)
+        if not (raw[:, width] == NEWLINE).all():
+            raise ValueError("grid rows are not all the same width")
+        return cls(np.ascontiguousarray(raw[:, :width]))
+
+    @classmethod
+    def from_file(cls, data_path: Path) -> "Grid":
+        with open(data_path, "rb") as raw_input:
+            return cls.from_bytes(raw_input.read())
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def __str__(self) -> str:
+        return "\n".join(self.row_text(row) for row in range(self.height))
+
+    def __repr__(self) -> str:
+        return f"Grid({self.height}x{self.width})"
+
+    def row_text(self, row: int) -> str:
+        return self.cells[row].tobytes().decode()
+
+    def at(self, row: int, col: int, default: str = ".") -> str:
+        """The character at (row, col), or default if that's off the grid."""
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return chr(self.cells[row, col])
+        return default
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def neighbors(self, row: int, col: int, diagonal: bool = True) -> list:
+        """The (row, col) of each cell next to (row, col) that is on the grid."""
+        offsets = ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL
+        return [
+            (row + dr, col + dc)
+            for dr, dc in offsets
+            if self.in_bounds(row + dr, col + dc)
+        ]
+
+    def span_neighbors(self, row: int, start: int, stop: int) -> list:
+        """
+        The (row, col) of each cell on the grid bordering the run of cells
+        row[start:stop], diagonals included, like the cells around a number written
+        across several columns.
+        """
+        cells = [(row, start - 1), (row, stop)]
+        for r in (row - 1, row + 1):
+            cells.extend((r, c) for c in range(start - 1, stop + 1))
+        return [(r, c) for r, c in cells if self.in_bounds(r, c)]
+
+    def mask(self, chars: str):
+        """A boolean array, True where the cell holds one of chars."""
+        import numpy as np
+
+        return np.isin(self.cells, np.frombuffer(chars.encode(), dtype=np.uint8))
+
+    def rows_all(self, chars: str):
+        """
+        A boolean array with an entry per row, True where the row holds only chars.
+        """
+        return self.mask(chars).all(axis=1)
+
+    def columns_all(self, chars: str):
+        """
+        A boolean array with an entry per column, True where the column holds only
+        chars.
+        """
+        return self.mask(chars).all(axis=0)
+
+    def coordinates(self, char: str):
+        """
+        An (n, 2) array of the (row, col) of every cell holding char, in reading order.
+        """
+        import numpy as np
+
+        return np.argwhere(self.cells == ord(char))
+
+    def adjacent_to(self, mask, diagonal: bool = True):
+        """A boolean array, True where a cell is next to a True cell of mask."""
+        import numpy as np
+
+        padded = np.pad(mask, 1)
+        adjacent = np.zeros(mask.shape, dtype=bool)
+        offsets = ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL
+        for dr, dc in offsets:
+            adjacent |= padded[
+                1 + dr : 1 + dr + self.height, 1 + dc : 1 + dc + self.width
+            ]
+        return adjacent
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from aoc_common.grid import Grid
+
+TEXT = b"#..\n.*.\n..#\n"
+
+
+@pytest.fixture
+def grid():
+    return Grid.from_bytes(TEXT)
+
+
+def test_from_bytes(grid):
+    """Checks that the grid keeps the file's characters, without newlines."""
+    assert (grid.height, grid.width) == (3, 3)
+    assert grid.cells.dtype == np.uint8
+    assert str(grid) == TEXT.decode().strip()
+
+
+def test_from_bytes_tolerates_line_endings():
+    assert str(Grid.from_bytes(b"ab\r\ncd")) == "ab\ncd"
+
+
+def test_from_bytes_rejects_ragged_rows():
+    with pytest.raises(ValueError):
+        Grid.from_bytes(b"abc\nde\n")
+
+
+def test_lookups_are_bounds_safe(grid):
+    """
+    Checks that lookups off the edge get the default, and neighbors stay on the grid.
+    """
+    assert grid.at(1, 1) == "*"
+    assert grid.at(-1, 0) == grid.at(0, 3) == "."
+    assert sorted(grid.neighbors(0, 0)) == [(0, 1), (1, 0), (1, 1)]
+    assert sorted(grid.neighbors(0, 0, diagonal=False)) == [(0, 1), (1, 0)]
+    assert sorted(grid.span_neighbors(0, 1, 3)) == [(0, 0), (1, 0), (1, 1), (1, 2)]
+
+
+def test_masks(grid):
+    assert grid.mask("#*").sum() == 3
+    assert grid.rows_all(".#").tolist() == [True, False, True]
+    assert grid.columns_all(".*").tolist() == [False, True, False]
+
+
+def test_coordinates(grid):
+    assert grid.coordinates("#").tolist() == [[0, 0], [2, 2]]
+
+
+def test_adjacent_to(grid):
+    """Checks that adjacency doesn't wrap around the edges."""
+    adjacent = grid.adjacent_to(grid.mask("#"))
+    assert adjacent.tolist() == [
+        [False, True, False],
+        [True, True, True],
+        [False, True, False],
+    ]
+    assert grid.adjacent_to(grid.mask("*"), diagonal=False).sum() == 4
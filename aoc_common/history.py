@@ -0,0 +1,198 @@
+"""
+Benchmark history, stored as one JSON object per line, and regression checks against it.
+
+Each run records the git revision, Python version and a machine fingerprint, plus the
+raw timing samples for every day and phase, so any two runs on the same machine can be
+compared.
+"""
+
+import hashlib
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+
+from pathlib import Path
+
+HISTORY_FILE = Path(__file__).parent.parent / "benchmark_history.jsonl"
+
+
+def git_revision(repo_folder: Path = HISTORY_FILE.parent) -> str:
+    """The current commit hash, with a -dirty suffix if tracked files have changed."""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_folder,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "diff", "--quiet", "HEAD"], cwd=repo_folder, capture_output=True
+        ).returncode
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{revision}-dirty" if dirty else revision
+
+
+def machine_fingerprint() -> str:
+    """A short, stable identifier for this machine's hardware and OS."""
+    details = "|".join(
+        [
+            platform.node(),
+            platform.system(),
+            platform.machine(),
+            platform.processor(),
+            str(os.cpu_count()),
+        ]
+    )
+    return hashlib.sha256(details.encode()).hexdigest()[:12]
+
+
+def build_record(results: dict, warmup: int, repeat: int) -> dict:
+    """
+    Wraps benchmark results ({day: {phase: samples or exception}}) in a history record.
+    Failed phases are stored as {"error": message}.
+    """
+    days = {}
+    for day, phases in results.items():
+        days[str(day)] = {
+            phase: (
+                {"error": f"{type(samples).__name__}: {samples}"}
+                if isinstance(samples, Exception)
+                else samples
+            )
+            for phase, samples in phases.items()
+        }
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "machine": machine_fingerprint(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "results": days,
+    }
+
+
+def append_run(record: dict, history_path: Path = HISTORY_FILE) -> None:
+    with open(history_path, "a") as history_file:
+        history_file.write(json.dumps(record) + "\n")
+
+
+def load_runs(history_path: Path = HISTORY_FILE) -> list:
+    if not history_path.exists():
+        return []
+    with open(history_path, "r") as history_file:
+        return [json.loads(line) for line in history_file if line.strip()]
+
+
+def find_run(
+    runs: list, revision: str = None, machine: str = None, python: str = None
+) -> dict:
+    """
+    The most recent run matching the given revision prefix, machine and Python version.
+    """
+    for run in reversed(runs):
+        if revision is not None and not run["revision"].startswith(revision):
+            continue
+        if machine is not None and run["machine"] != machine:
+            continue
+        if python is not None and run["python"] != python:
+            continue
+        return run
+    return None
+
+
+def mann_whitney_greater(baseline: list, candidate: list) -> float:
+    """
+    One-sided Mann-Whitney U test that candidate samples tend to be larger than
+    baseline. Uses the normal approximation with a tie correction. Returns the p-value.
+    """
+    n1, n2 = len(candidate), len(baseline)
+    combined = sorted(
+        [(value, 0) for value in candidate] + [(value, 1) for value in baseline]
+    )
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_speedup(
+    baseline: list,
+    candidate: list,
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> tuple:
+    """
+    The speedup of candidate over baseline, as the ratio of their medians (above 1 when
+    the candidate is faster), with a percentile bootstrap confidence interval.
+    Resampling uses a fixed seed, so a report is reproducible. Returns (speedup, low,
+    high).
+    """
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(resamples):
+        base_median = statistics.median(rng.choices(baseline, k=len(baseline)))
+        median = statistics.median(rng.choices(candidate, k=len(candidate)))
+        ratios.append(base_median / median if median else math.inf)
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    low = ratios[int(tail * (resamples - 1))]
+    high = ratios[int(math.ceil((1 - tail) * (resamples - 1)))]
+    median = statistics.median(candidate)
+    speedup = statistics.median(baseline) / median if median else math.inf
+    return speedup, low, high
+
+
+def compare_runs(
+    baseline: dict, candidate: dict, alpha: float, threshold: float
+) -> list:
+    """
+    Compares every day and phase timed in both runs. A phase is a regression when its
+    median slowed by more than threshold (a fraction) and the slowdown is significant at
+    level alpha. Returns a list of row dicts.
+    """
+    rows = []
+    for day, phases in candidate["results"].items():
+        for phase, samples in phases.items():
+            base_samples = baseline["results"].get(day, {}).get(phase)
+            if not isinstance(samples, list) or not isinstance(base_samples, list):
+                continue
+            base_median = statistics.median(base_samples)
+            median = statistics.median(samples)
+            ratio = median / base_median if base_median else math.inf
+            p_value = mann_whitney_greater(base_samples, samples)
+            rows.append(
+                {
+                    "day": int(day),
+                    "phase": phase,
+                    "baseline": base_median,
+                    "candidate": median,
+                    "ratio": ratio,
+                    "p_value": p_value,
+                    "regression": ratio > 1 + threshold and p_value < alpha,
+                }
+            )
+    return sorted(rows, key=lambda row: (row["day"], row["phase"]))
@@ -0,0 +1,54 @@
+from aoc_common import history
+
+
+def make_run(samples):
+    return {"results": {"5": {"part_2": samples}}}
+
+
+def test_mann_whitney_detects_shift():
+    """Checks that a clear slowdown gets a small p-value, and no change does not."""
+    baseline = [1.00, 1.01, 0.99, 1.02, 1.00, 0.98, 1.01]
+    assert history.mann_whitney_greater(baseline, [x + 0.5 for x in baseline]) < 0.01
+    assert history.mann_whitney_greater(baseline, baseline) > 0.4
+
+
+def test_bootstrap_speedup_interval():
+    """
+    Checks that a clear speedup excludes 1 from its interval, and no change includes it.
+    """
+    baseline = [1.00, 1.01, 0.99, 1.02, 1.00, 0.98, 1.01]
+    speedup, low, high = history.bootstrap_speedup(baseline, [x / 2 for x in baseline])
+    assert speedup == 2.0
+    assert 1 < low <= speedup <= high
+    _, low, high = history.bootstrap_speedup(baseline, list(reversed(baseline)))
+    assert low <= 1 <= high
+
+
+def test_compare_runs_flags_only_significant_slowdowns():
+    """
+    Checks that a phase is flagged only when it is both slower and significantly so.
+    """
+    baseline = make_run([1.00, 1.01, 0.99, 1.02, 1.00])
+    slower = make_run([1.50, 1.52, 1.49, 1.51, 1.50])
+    faster = make_run([0.50, 0.52, 0.49, 0.51, 0.50])
+    assert history.compare_runs(baseline, slower, alpha=0.05, threshold=0.05)[0][
+        "regression"
+    ]
+    assert not history.compare_runs(baseline, faster, alpha=0.05, threshold=0.05)[0][
+        "regression"
+    ]
+
+
+def test_history_round_trip(tmp_path):
+    """
+    Checks that recorded runs can be read back, and failed phases are kept as errors.
+    """
+    path = tmp_path / "history.jsonl"
+    record = history.build_record(
+        {7: {"parse": [0.1, 0.2], "part_1": ValueError("bad")}}, 0, 2
+    )
+    history.append_run(record, path)
+    (loaded,) = history.load_runs(path)
+    assert loaded["results"]["7"]["parse"] == [0.1, 0.2]
+    assert loaded["results"]["7"]["part_1"] == {"error": "ValueError: bad"}
+    assert history.find_run([loaded], revision=record["revision"][:7]) == loaded
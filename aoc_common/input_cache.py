@@ -0,0 +1,150 @@
+"""
+On-disk cache of parsed problem inputs.
+
+Entries are keyed by a hash of the input file's contents, a hash of the source file that
+defines the parser, and hashes of the aoc_common modules that file imports (directly,
+inside functions, or through other aoc_common modules), so editing any of them makes the
+old entry unreachable. CACHE_FORMAT is part of the key too, to retire every entry at
+once when what gets cached changes. The cache folder is kept under a size limit by
+evicting the least recently used entries. hashlib and pickle are imported on first use,
+as every day module imports this one at startup.
+"""
+
+import os
+
+from pathlib import Path
+
+CACHE_FOLDER = Path(__file__).parent.parent / "parse_cache"
+COMMON_FOLDER = Path(__file__).parent
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+CACHE_SUFFIX = ".pickle"
+CACHE_FORMAT = 2
+
+
+def file_digest(path: Path) -> str:
+    """Returns the sha256 hex digest of a file's contents."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as data_file:
+        for chunk in iter(lambda: data_file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _imported_modules(source_path: Path, package: str) -> set:
+    """
+    The names the source file's import statements could refer to as the package's
+    modules. A plain scan of the source text rather than a parse, as it runs for every
+    cache lookup.
+    """
+    import re
+
+    source = Path(source_path).read_text()
+    names = set(re.findall(rf"^\s*(?:from|import)\s+{package}\.(\w+)", source, re.M))
+    for imported in re.findall(
+        rf"^\s*from\s+{package}\s+import\s+(\([^)]*\)|[^\n]*)", source, re.M
+    ):
+        names.update(re.findall(r"\w+", imported))
+    return names
+
+
+def common_dependencies(source_path: Path, common_folder: Path = COMMON_FOLDER) -> list:
+    """
+    The source files of the common_folder modules that source_path imports, directly or
+    through each other, sorted. Imported names that aren't modules, like a class, are
+    skipped.
+    """
+    common_folder = Path(common_folder)
+    found = set()
+    pending = [Path(source_path)]
+    while pending:
+        for name in _imported_modules(pending.pop(), common_folder.name):
+            path = common_folder / f"{name}.py"
+            if path not in found and path.is_file():
+                found.add(path)
+                pending.append(path)
+    return sorted(found)
+
+
+def common_digest(source_path: Path, common_folder: Path = COMMON_FOLDER) -> str:
+    """
+    Returns a sha256 hex digest of the common_folder modules that source_path imports.
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    for path in common_dependencies(source_path, common_folder):
+        digest.update(f"{path.name}:{file_digest(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def cache_key(parse_func, data_path: Path) -> str:
+    """Builds the cache key for parsing data_path with parse_func."""
+    import hashlib
+
+    source_path = Path(parse_func.__code__.co_filename)
+    source_digest = file_digest(source_path)
+    dependency_digest = common_digest(source_path)
+    input_digest = file_digest(data_path)
+    key = (
+        f"{CACHE_FORMAT}:{parse_func.__qualname__}:{source_digest}:"
+        f"{dependency_digest}:{input_digest}"
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def evict(cache_folder: Path = CACHE_FOLDER, max_bytes: int = MAX_CACHE_BYTES) -> None:
+    """Removes least recently used entries until the cache folder fits in max_bytes."""
+    entries = []
+    for entry in cache_folder.glob(f"*{CACHE_SUFFIX}"):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries):
+        if total <= max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
+
+
+def clear_cache(cache_folder: Path = CACHE_FOLDER) -> None:
+    """Removes every cached entry."""
+    evict(cache_folder, max_bytes=0)
+
+
+def cached_parse(
+    parse_func,
+    data_path: Path,
+    cache_folder: Path = CACHE_FOLDER,
+    max_bytes: int = MAX_CACHE_BYTES,
+):
+    """
+    Returns parse_func(data_path), loading it from the on-disk cache when possible.
+    Cache misses are parsed, written to the cache, and trigger eviction.
+    An entry that can't be read back is treated as a miss.
+    """
+    import pickle
+
+    entry = cache_folder / f"{cache_key(parse_func, data_path)}{CACHE_SUFFIX}"
+    try:
+        with open(entry, "rb") as cache_file:
+            parsed = pickle.load(cache_file)
+        os.utime(entry)
+        return parsed
+    except FileNotFoundError:
+        pass
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        entry.unlink(missing_ok=True)
+
+    parsed = parse_func(data_path)
+    cache_folder.mkdir(parents=True, exist_ok=True)
+    temp_entry = entry.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_entry, "wb") as cache_file:
+        pickle.dump(parsed, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_entry, entry)
+    evict(cache_folder, max_bytes)
+    return parsed
@@ -0,0 +1,72 @@
+import pytest
+
+from aoc_common import input_cache
+
+calls = []
+
+
+def count_lines(data_path):
+    calls.append(data_path)
+    with open(data_path, "r") as raw_input:
+        return [l.strip() for l in raw_input.readlines()]
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("a\nb\nc\n")
+    calls.clear()
+    return path
+
+
+def test_cached_parse_reuses_entry(data_path, tmp_path):
+    """Checks that a second parse of an unchanged file is served from the cache."""
+    cache = tmp_path / "cache"
+    first = input_cache.cached_parse(count_lines, data_path, cache_folder=cache)
+    second = input_cache.cached_parse(count_lines, data_path, cache_folder=cache)
+    assert first == second == ["a", "b", "c"]
+    assert len(calls) == 1
+
+
+def test_cached_parse_invalidates_on_input_change(data_path, tmp_path):
+    """Checks that changing the input file's contents forces a re-parse."""
+    cache = tmp_path / "cache"
+    input_cache.cached_parse(count_lines, data_path, cache_folder=cache)
+    data_path.write_text("d\n")
+    assert input_cache.cached_parse(count_lines, data_path, cache_folder=cache) == ["d"]
+    assert len(calls) == 2
+
+
+def test_evict_keeps_cache_under_limit(data_path, tmp_path):
+    """Checks that eviction removes entries until the cache fits its size limit."""
+    cache = tmp_path / "cache"
+    for i in range(5):
+        data_path.write_text(f"{i}\n" * 100)
+        input_cache.cached_parse(
+            count_lines, data_path, cache_folder=cache, max_bytes=1000
+        )
+    total = sum(entry.stat().st_size for entry in cache.iterdir())
+    assert 0 < total <= 1000
+
+
+def test_common_digest_follows_imports(tmp_path):
+    """
+    Checks that editing an imported common module, even an indirect one, changes the
+    digest.
+    """
+    common = tmp_path / "aoc_common"
+    common.mkdir()
+    (common / "grid.py").write_text("from aoc_common.parsing import read_lines\n")
+    (common / "parsing.py").write_text("def read_lines(): pass\n")
+    (common / "unused.py").write_text("")
+    source = tmp_path / "day.py"
+    source.write_text(
+        "def parse_input():\n    from aoc_common import (\n        grid,\n    )\n"
+    )
+    deps = input_cache.common_dependencies(source, common)
+    assert [path.name for path in deps] == ["grid.py", "parsing.py"]
+    before = input_cache.common_digest(source, common)
+    (common / "unused.py").write_text("x = 1\n")
+    assert input_cache.common_digest(source, common) == before
+    (common / "parsing.py").write_text("def read_lines(): return []\n")
+    assert input_cache.common_digest(source, common) != before
@@ -0,0 +1,147 @@
+"""
+tracemalloc wrappers for the day modules' --memory option.
+
+Reports the peak and net Python allocations made by a single call, along with the source
+lines responsible for most of the memory live near the call's peak. tracemalloc can't
+snapshot the peak itself, so a background thread polls the traced total while the call
+runs and snapshots it each time it grows past the largest total snapshotted so far. That
+catches temporaries freed before the call returns (a list rebuilt per step, say), as
+long as they live for more than a poll interval.
+"""
+
+import contextlib
+import sys
+import threading
+import tracemalloc
+
+from dataclasses import dataclass, field
+
+TOP_SITES = 10
+SAMPLE_SECONDS = 0.001
+# A new snapshot is only taken once the traced total has grown by this factor, which
+# keeps the number of (slow) snapshots logarithmic in the peak.
+RESAMPLE_GROWTH = 1.1
+IGNORED_FILES = (
+    __file__,
+    tracemalloc.__file__,
+    "<frozen importlib._bootstrap>",
+    "<unknown>",
+)
+
+
+@dataclass
+class MemoryReport:
+    label: str
+    peak: int
+    net: int
+    peak_sites: list = field(default_factory=list)
+
+    def format(self) -> str:
+        lines = [
+            f"--- {self.label} ---",
+            f"peak: {format_bytes(self.peak)}  net: {format_bytes(self.net)}",
+        ]
+        if self.peak_sites:
+            lines.append("live at the largest sampled total, by line:")
+        for site, size, count in self.peak_sites:
+            lines.append(f"  {format_bytes(size):>10}  {count:>8} blocks  {site}")
+        return "\n".join(lines)
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class _PeakSampler:
+    """
+    Snapshots traced memory from a background thread whenever it reaches a new high,
+    once armed. Started before measuring, so the thread's own allocations aren't
+    counted.
+    """
+
+    def __init__(self, interval: float = SAMPLE_SECONDS):
+        self.interval = interval
+        self.armed = False
+        self.snapshot = None
+        self.size = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def arm(self) -> None:
+        with self.lock:
+            self.armed = True
+            self.size, _ = tracemalloc.get_traced_memory()
+
+    def sample(self, growth: float = RESAMPLE_GROWTH) -> None:
+        with self.lock:
+            current, _ = tracemalloc.get_traced_memory()
+            if self.armed and (self.snapshot is None or current > self.size * growth):
+                self.snapshot = tracemalloc.take_snapshot()
+                self.size = current
+
+    def __enter__(self) -> "_PeakSampler":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stopped.set()
+        self.thread.join()
+        self.sample(growth=1.0)
+
+
+def measure_memory(func, *args, label: str = "", top: int = TOP_SITES):
+    """
+    Runs func(*args) with tracemalloc tracing, and returns (result, MemoryReport). Peak
+    and net are relative to what was allocated before the call. With top, the report
+    lists that many lines by memory live at the largest total sampled during the call.
+    """
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+    sampler = _PeakSampler() if top else contextlib.nullcontext()
+    try:
+        with sampler:
+            before_snapshot = tracemalloc.take_snapshot() if top else None
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            if top:
+                sampler.arm()
+            result = func(*args)
+            after, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started_here:
+            tracemalloc.stop()
+
+    peak_sites = []
+    if top:
+        filters = [tracemalloc.Filter(False, name) for name in IGNORED_FILES]
+        differences = sampler.snapshot.filter_traces(filters).compare_to(
+            before_snapshot.filter_traces(filters), "lineno"
+        )
+        for diff in sorted(differences, key=lambda diff: diff.size_diff, reverse=True)[
+            :top
+        ]:
+            if diff.size_diff > 0:
+                frame = diff.traceback[0]
+                site = f"{frame.filename}:{frame.lineno}"
+                peak_sites.append((site, diff.size_diff, diff.count_diff))
+    return result, MemoryReport(label, peak - before, after - before, peak_sites)
+
+
+def memory_call(func, *args, label: str, top: int = TOP_SITES):
+    """
+    Runs func(*args) under measure_memory, prints the report to stderr, and returns the
+    result.
+    """
+    result, report = measure_memory(func, *args, label=label, top=top)
+    print(report.format(), file=sys.stderr)
+    return result
@@ -0,0 +1,29 @@
+import inspect
+import time
+
+from aoc_common.memory import measure_memory
+
+
+def allocate(count):
+    kept = [str(i) for i in range(count)]
+    temporary = [bytes(1000) for _ in range(count)]
+    time.sleep(0.05)
+    return kept
+
+
+KEPT_LINE = inspect.getsourcelines(allocate)[1] + 1
+
+
+def test_measure_memory_separates_peak_and_net():
+    """
+    Checks that memory freed before returning counts toward peak, and its line is
+    reported.
+    """
+    result, report = measure_memory(allocate, 1000, label="allocate")
+    assert len(result) == 1000
+    assert report.peak > 1000 * 1000
+    assert 0 < report.net < report.peak
+    sites = [site for site, _, _ in report.peak_sites]
+    assert sites[0].endswith(f":{KEPT_LINE + 1}")
+    assert any(site.endswith(f":{KEPT_LINE}") for site in sites)
+    assert "live at the largest sampled total" in report.format()
@@ -0,0 +1,36 @@
+"""
+Precompiled token patterns and bulk integer extraction for the day parsers.
+
+ints() pulls every integer out of a whole block of text with a single regex pass, rather
+than splitting it into lines first. int_array() does the same for a block that holds
+only integers, returning a NumPy int64 array, and raises on anything else. NumPy is
+imported on first use, so days that only use the pure Python helpers don't pay for it at
+startup.
+"""
+
+import re
+
+UNSIGNED = re.compile(r"\d+")
+SIGNED = re.compile(r"-?\d+")
+UPPER_WORD = re.compile(r"[A-Z]+")
+UPPER_TOKEN = re.compile(r"[0-9A-Z]+")
+
+
+def ints(text: str, signed: bool = False) -> list:
+    """Every integer in text, in order. Minus signs are ignored unless signed is set."""
+    return list(map(int, (SIGNED if signed else UNSIGNED).findall(text)))
+
+
+def words(text: str, pattern: re.Pattern = UPPER_WORD) -> list:
+    """Every match of pattern (by default, runs of capital letters) in text."""
+    return pattern.findall(text)
+
+
+def int_array(text: str):
+    """
+    Converts a block of whitespace- or comma-separated integers into an int64 array.
+    Raises ValueError if the block holds anything but integers and separators.
+    """
+    import numpy as np
+
+    return np.array(text.replace(",", " ").split(), dtype=np.int64)
@@ -0,0 +1,44 @@
+import pytest
+
+from aoc_common import parsing
+
+
+def test_ints_matches_findall():
+    """
+    Checks that ints gives the same numbers as a per-line findall and int conversion.
+    """
+    text = "seeds: 79 14 55 13\n\n50 98 2\n52 50 48\n"
+    expected = [
+        int(n) for line in text.splitlines() for n in parsing.UNSIGNED.findall(line)
+    ]
+    assert parsing.ints(text) == expected
+
+
+def test_ints_signed():
+    """Checks that minus signs are only kept when asked for."""
+    assert parsing.ints("0 -3 6") == [0, 3, 6]
+    assert parsing.ints("0 -3 6", signed=True) == [0, -3, 6]
+
+
+def test_words():
+    """Checks the default and alternative word patterns."""
+    line = "11A = (11B, XXX)"
+    assert parsing.words(line) == ["A", "B", "XXX"]
+    assert parsing.words(line, parsing.UPPER_TOKEN) == ["11A", "11B", "XXX"]
+
+
+@pytest.mark.parametrize("text", ["1 2 3\n4 5 6\n", "1,2,3,4,5,6", " -1\t2\n\n3 ", ""])
+def test_int_array_matches_ints(text):
+    """Checks that the NumPy path gives the same numbers as the pure Python one."""
+    np = pytest.importorskip("numpy")
+    array = parsing.int_array(text)
+    assert array.dtype == np.int64
+    assert array.tolist() == parsing.ints(text, signed=True)
+
+
+@pytest.mark.parametrize("text", ["1 2 x 3", "1 2.5 3", "Time: 7 15"])
+def test_int_array_rejects_other_text(text):
+    """Checks that a malformed block raises instead of being cut short."""
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        parsing.int_array(text)
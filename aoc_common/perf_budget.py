@@ -0,0 +1,66 @@
+"""
+Time and memory budgets for the perf test tier (pytest -m perf).
+
+Budgets come from config.toml [perf], with overrides in [perf.budgets] keyed by day
+("5") or by day and part ("5.2"); a part's own entry wins over its day's. Each day's
+test file checks both parts on the full puzzle input and on a generated input scaled
+from the puzzle's size.
+"""
+
+import time
+import tomli
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from aoc_common.memory import measure_memory
+
+CONFIG_FILE = Path(__file__).parent.parent / "config.toml"
+DEFAULT_TIME_S = 2.0
+DEFAULT_MEMORY_MIB = 64
+DEFAULT_GENERATED_SCALE = 1.0
+
+
+@dataclass
+class Budget:
+    time_s: float = DEFAULT_TIME_S
+    memory_mib: float = DEFAULT_MEMORY_MIB
+    generated_scale: float = DEFAULT_GENERATED_SCALE
+    skip_full: str = None
+
+
+@lru_cache(maxsize=None)
+def load_perf_config(config_path: Path = CONFIG_FILE) -> dict:
+    with open(config_path, "rb") as config_file:
+        return tomli.load(config_file).get("perf", {})
+
+
+def part_budget(day: int, part: int = None, config_path: Path = CONFIG_FILE) -> Budget:
+    """
+    The budget for one part of a day, with any per-day and per-part overrides applied.
+    Without a part, only the day's overrides are applied.
+    """
+    perf_config = load_perf_config(config_path)
+    overrides = perf_config.get("budgets", {})
+    settings = {k: v for k, v in perf_config.items() if k != "budgets"}
+    settings.update(overrides.get(str(day), {}))
+    settings.update(overrides.get(f"{day}.{part}", {}))
+    return Budget(**settings)
+
+
+def generated_size(puzzle_size: int, budget: Budget) -> int:
+    return max(1, round(puzzle_size * budget.generated_scale))
+
+
+def measure_part(solver, input_data) -> tuple:
+    """
+    Runs solver(input_data) twice: once timed, and once under tracemalloc, whose
+    overhead would skew the timing. Returns (seconds, peak MiB allocated during the
+    call).
+    """
+    start = time.perf_counter()
+    solver(input_data)
+    elapsed = time.perf_counter() - start
+    _, report = measure_memory(solver, input_data, top=0)
+    return elapsed, report.peak / (1024 * 1024)
@@ -0,0 +1,30 @@
+from aoc_common import perf_budget
+
+
+def test_part_budget_overrides(tmp_path):
+    """
+    Checks that part overrides win over day overrides, which win over the defaults.
+    """
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        "[perf]\ntime_s = 1.0\nmemory_mib = 10\n\n"
+        '[perf.budgets]\n"5" = { time_s = 3.0, generated_scale = 0.5 }\n'
+        '"5.2" = { time_s = 9.0 }\n'
+    )
+    assert perf_budget.part_budget(4, 1, config_path) == perf_budget.Budget(1.0, 10)
+    assert perf_budget.part_budget(5, 1, config_path) == perf_budget.Budget(
+        3.0, 10, 0.5
+    )
+    assert perf_budget.part_budget(5, 2, config_path) == perf_budget.Budget(
+        9.0, 10, 0.5
+    )
+    assert perf_budget.part_budget(5, config_path=config_path).time_s == 3.0
+
+
+def test_measure_part():
+    """Checks that both the time and the peak allocation of a call are measured."""
+    elapsed, peak_mib = perf_budget.measure_part(
+        lambda n: len(bytes(n)), 4 * 1024 * 1024
+    )
+    assert elapsed > 0
+    assert 4 <= peak_mib < 8
@@ -0,0 +1,82 @@
+"""
+cProfile wrappers for the day modules' --profile option.
+
+Each profiled call writes a .prof file (for pstats, snakeviz, etc.) and a .collapsed
+file of folded stacks (for flamegraph.pl, speedscope, etc.), and prints its top
+functions to stderr.
+"""
+
+import cProfile
+import pstats
+import sys
+
+from pathlib import Path
+
+PROFILE_FOLDER = Path(__file__).parent.parent / "profiles"
+TOP_FUNCTIONS = 20
+MIN_MICROSECONDS = 1
+
+
+def _frame_label(func: tuple) -> str:
+    file_name, line_number, func_name = func
+    return f"{Path(file_name).name}:{func_name}:{line_number}".replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict:
+    """
+    Rebuilds folded stacks from cProfile's caller/callee totals. cProfile only records
+    one level of callers, so time is split between the paths into a function in
+    proportion to each caller's share of it. Returns {stack: microseconds}.
+    """
+    callees = {func: {} for func in stats.stats}
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, edge_cumulative) in callers.items():
+            callees.setdefault(caller, {})[func] = edge_cumulative
+
+    folded = {}
+
+    def walk(func, stack, scale):
+        own_time = stats.stats[func][2] * scale * 1_000_000
+        if own_time >= MIN_MICROSECONDS:
+            key = ";".join(_frame_label(f) for f in stack)
+            folded[key] = folded.get(key, 0) + int(own_time)
+        for callee, edge_cumulative in callees.get(func, {}).items():
+            callee_cumulative = stats.stats[callee][3]
+            if callee in stack or not callee_cumulative:
+                continue
+            callee_scale = scale * edge_cumulative / callee_cumulative
+            if callee_cumulative * callee_scale * 1_000_000 >= MIN_MICROSECONDS:
+                walk(callee, stack + [callee], callee_scale)
+
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            walk(func, [func], 1.0)
+    return folded
+
+
+def profile_call(
+    func,
+    *args,
+    label: str,
+    output_folder: Path = PROFILE_FOLDER,
+    top: int = TOP_FUNCTIONS,
+    sort: str = "cumulative",
+):
+    """
+    Runs func(*args) under cProfile and returns its result.
+    Writes <label>.prof and <label>.collapsed to output_folder, and prints the top
+    functions to stderr, ordered by sort (any pstats sort key, default cumulative time).
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args)
+
+    output_folder.mkdir(parents=True, exist_ok=True)
+    stats = pstats.Stats(profiler, stream=sys.stderr)
+    stats.dump_stats(output_folder / f"{label}.prof")
+    with open(output_folder / f"{label}.collapsed", "w") as collapsed_file:
+        for stack, microseconds in sorted(collapsed_stacks(stats).items()):
+            collapsed_file.write(f"{stack} {microseconds}\n")
+
+    print(f"\n--- {label} ---", file=sys.stderr)
+    stats.sort_stats(sort).print_stats(top)
+    return result
@@ -0,0 +1,52 @@
+import pstats
+
+from aoc_common import profiling
+
+
+def square_sum(n):
+    return sum(i * i for i in range(n))
+
+
+def repeat_square_sum(n):
+    return [square_sum(n) for _ in range(5)]
+
+
+def test_profile_call_writes_outputs(tmp_path, capsys):
+    """
+    Checks that a profiled call returns its result and writes a .prof and folded stacks.
+    """
+    label = "day_99_part_1_solve"
+    result = profiling.profile_call(
+        repeat_square_sum, 1000, label=label, output_folder=tmp_path
+    )
+    assert result == [square_sum(1000)] * 5
+    stats = pstats.Stats(str(tmp_path / f"{label}.prof"))
+    assert any(func[2] == "square_sum" for func in stats.stats)
+    lines = (tmp_path / f"{label}.collapsed").read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, microseconds = line.rsplit(" ", 1)
+        assert int(microseconds) >= profiling.MIN_MICROSECONDS
+    assert any("repeat_square_sum" in stack and ";" in stack for stack in lines)
+    assert f"--- {label} ---" in capsys.readouterr().err
+
+
+def test_profile_call_top_and_sort(tmp_path, capsys):
+    """
+    Checks that the printed listing honours the sort key and is cut to top functions.
+    """
+    profiling.profile_call(
+        repeat_square_sum, 100, label="default", output_folder=tmp_path
+    )
+    assert "Ordered by: cumulative time" in capsys.readouterr().err
+    profiling.profile_call(
+        repeat_square_sum,
+        100,
+        label="sorted",
+        output_folder=tmp_path,
+        top=2,
+        sort="tottime",
+    )
+    printed = capsys.readouterr().err
+    assert "Ordered by: internal time" in printed
+    assert "due to restriction <2>" in printed
@@ -0,0 +1,111 @@
+"""
+Progress and throughput reporting for long-running solver loops.
+
+A loop asks for a Meter, and reports how many items it has processed every check_every
+iterations. The meter reads the clock then, and emits at most one report per interval:
+items done, items per second, and, when the total is known, percent done and ETA.
+
+    meter = progress.meter("part 2 seeds", total=seed_count)
+    check_every = meter.check_every
+    for done, seed in enumerate(seeds):
+        if check_every and done % check_every == 0:
+            meter.update(done)
+        ...
+    meter.finish(seed_count)
+
+Reporting is off unless the AOC_PROGRESS environment variable is set, to "stderr" for a
+status line, or to a file path to append JSON lines to. When it's off, check_every is 0,
+so a loop only pays for one check per iteration. AOC_PROGRESS_INTERVAL sets the seconds
+between reports (default 1).
+"""
+
+import json
+import os
+import sys
+import time
+
+DESTINATION_VARIABLE = "AOC_PROGRESS"
+INTERVAL_VARIABLE = "AOC_PROGRESS_INTERVAL"
+DEFAULT_INTERVAL = 1.0
+CHECK_EVERY = 4096
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return (
+        f"{hours}h{minutes:02d}m{seconds:02d}s"
+        if hours
+        else f"{minutes}m{seconds:02d}s"
+    )
+
+
+class Meter:
+    def __init__(
+        self,
+        label: str,
+        total: int = None,
+        destination: str = None,
+        interval: float = DEFAULT_INTERVAL,
+        check_every: int = CHECK_EVERY,
+    ):
+        self.label = label
+        self.total = total
+        self.destination = destination
+        self.interval = interval
+        self.check_every = check_every if destination else 0
+        self.start = time.perf_counter()
+        self.last_report = self.start
+
+    def snapshot(self, done: int) -> dict:
+        elapsed = time.perf_counter() - self.start
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total is not None and rate > 0:
+            eta = max(0.0, (self.total - done) / rate)
+        return {
+            "label": self.label,
+            "done": done,
+            "total": self.total,
+            "elapsed": elapsed,
+            "rate": rate,
+            "eta": eta,
+        }
+
+    def update(self, done: int) -> None:
+        """
+        Reports progress if at least interval seconds have passed since the last report.
+        """
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.emit(self.snapshot(done))
+
+    def finish(self, done: int) -> None:
+        """Reports the final count, if reporting is on."""
+        if self.destination:
+            self.emit(self.snapshot(done), final=True)
+
+    def emit(self, snapshot: dict, final: bool = False) -> None:
+        if self.destination == "stderr":
+            line = f"{self.label}: {snapshot['done']:,}"
+            if self.total is not None:
+                percent = 100 * snapshot["done"] / max(self.total, 1)
+                line += f" / {self.total:,} ({percent:.1f}%)"
+            line += f"  {snapshot['rate']:,.0f}/s"
+            if snapshot["eta"] is not None and not final:
+                line += f"  ETA {format_duration(snapshot['eta'])}"
+            print(f"\r{line}", end="\n" if final else "", file=sys.stderr, flush=True)
+        else:
+            with open(self.destination, "a") as metrics_file:
+                metrics_file.write(json.dumps({**snapshot, "final": final}) + "\n")
+
+
+def meter(label: str, total: int = None) -> Meter:
+    """A Meter configured from the AOC_PROGRESS environment variables."""
+    return Meter(
+        label,
+        total,
+        destination=os.environ.get(DESTINATION_VARIABLE) or None,
+        interval=float(os.environ.get(INTERVAL_VARIABLE, DEFAULT_INTERVAL)),
+    )
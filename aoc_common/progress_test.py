@@ -0,0 +1,40 @@
+import json
+
+from aoc_common import progress
+
+
+def test_meter_is_off_without_destination(monkeypatch):
+    """Checks that loops skip reporting entirely when AOC_PROGRESS isn't set."""
+    monkeypatch.delenv(progress.DESTINATION_VARIABLE, raising=False)
+    assert progress.meter("loop").check_every == 0
+
+
+def test_meter_writes_json_lines(monkeypatch, tmp_path):
+    """
+    Checks that reports go to a metrics file, with rate and ETA when the total is known.
+    """
+    metrics = tmp_path / "metrics.jsonl"
+    monkeypatch.setenv(progress.DESTINATION_VARIABLE, str(metrics))
+    monkeypatch.setenv(progress.INTERVAL_VARIABLE, "0")
+    meter = progress.meter("loop", total=100)
+    assert meter.check_every > 0
+    meter.update(25)
+    meter.finish(100)
+    reports = [json.loads(line) for line in metrics.read_text().splitlines()]
+    assert [report["done"] for report in reports] == [25, 100]
+    assert reports[0]["eta"] is not None and reports[0]["rate"] > 0
+    assert reports[-1]["final"]
+
+
+def test_meter_reports_at_most_once_per_interval(tmp_path):
+    """Checks that updates within the interval don't emit."""
+    metrics = tmp_path / "metrics.jsonl"
+    meter = progress.Meter("loop", destination=str(metrics), interval=60)
+    for done in range(1000):
+        meter.update(done)
+    assert not metrics.exists()
+
+
+def test_format_duration():
+    assert progress.format_duration(75) == "1m15s"
+    assert progress.format_duration(3725) == "1h02m05s"
@@ -0,0 +1,127 @@
+"""
+Publishing loaded inputs in shared memory, so worker processes can attach instead of
+parsing.
+
+The publishing process loads an input once, either as the raw file bytes or as whatever
+a day's parse_input returns, and copies it into a multiprocessing.shared_memory block.
+Workers get a small, picklable SharedInput handle and attach to the block by name:
+
+    with shared_input.published(module.parse_input(module.INPUT_PATH)) as handle:
+        pool.submit(task, handle)  # the task calls shared_input.attach(handle)
+
+Parsed inputs are pickled with protocol 5. The pickle goes at the start of the block,
+and every buffer it can pass out of band (NumPy arrays, and anything wrapped in a
+pickle.PickleBuffer) follows it, so a handle only holds the block's name and offsets,
+however large the input. Attaching rebuilds those arrays as read-only views of the
+block, without copying them. The rest of the structure (lists, strings, ints) is
+unpickled in each worker as usual, which is still much cheaper than reading and parsing
+the file again. Raw bytes attach as a read-only memoryview.
+
+A process keeps the blocks it attached to mapped until detach() is called, or it exits.
+"""
+
+import atexit
+import contextlib
+import pickle
+
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from pathlib import Path
+
+# Blocks this process has attached to, kept open while arrays still view them.
+_attached = {}
+
+
+@dataclass
+class SharedInput:
+    name: str
+    size: int
+    skeleton_size: int = None
+    spans: list = field(default_factory=list)
+
+
+def _create(size: int) -> shared_memory.SharedMemory:
+    # A block can't be empty, so an empty input still gets one byte.
+    return shared_memory.SharedMemory(create=True, size=max(size, 1))
+
+
+def publish_file(data_path: Path) -> tuple:
+    """
+    Reads a file straight into a new shared memory block.
+    Returns (the block, which the caller must close and unlink, and its SharedInput).
+    """
+    data_path = Path(data_path)
+    size = data_path.stat().st_size
+    block = _create(size)
+    with open(data_path, "rb") as raw_input:
+        raw_input.readinto(block.buf[:size])
+    return block, SharedInput(block.name, size)
+
+
+def publish(obj) -> tuple:
+    """
+    Copies a parsed input into a new shared memory block: its pickle, then its arrays.
+    Returns (the block, which the caller must close and unlink, and its SharedInput,
+    whose size counts the arrays' bytes). Raises whatever pickling obj raises.
+    """
+    buffers = []
+    skeleton = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    views = [buffer.raw() for buffer in buffers]
+    size = sum(view.nbytes for view in views)
+    block = _create(len(skeleton) + size)
+    block.buf[: len(skeleton)] = skeleton
+    spans = []
+    offset = len(skeleton)
+    for view in views:
+        block.buf[offset : offset + view.nbytes] = view
+        spans.append((offset, view.nbytes))
+        offset += view.nbytes
+    return block, SharedInput(block.name, size, len(skeleton), spans)
+
+
+@contextlib.contextmanager
+def published(obj=None, data_path: Path = None):
+    """
+    Publishes obj, or the raw bytes of data_path, for the duration of a with block, then
+    frees the shared memory. Yields the SharedInput to hand to workers.
+    """
+    block, handle = publish_file(data_path) if data_path is not None else publish(obj)
+    try:
+        yield handle
+    finally:
+        block.close()
+        block.unlink()
+
+
+def attach(handle: SharedInput):
+    """
+    The input a SharedInput refers to, viewing the shared block rather than copying it.
+    Attaching again to the same block in the same process reuses the mapping.
+    """
+    block = _attached.get(handle.name)
+    if block is None:
+        block = shared_memory.SharedMemory(name=handle.name)
+        _attached[handle.name] = block
+    data = block.buf.toreadonly()
+    if handle.skeleton_size is None:
+        return data[: handle.size]
+    buffers = [data[offset : offset + size] for offset, size in handle.spans]
+    return pickle.loads(data[: handle.skeleton_size], buffers=buffers)
+
+
+@atexit.register
+def detach() -> list:
+    """
+    Closes the blocks this process attached to. A block that attached arrays still view
+    stays open, and attached, until they are gone. Returns the names of the blocks
+    closed.
+    """
+    closed = []
+    for name, block in list(_attached.items()):
+        try:
+            block.close()
+        except BufferError:
+            continue
+        del _attached[name]
+        closed.append(name)
+    return closed
@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import pickle
+
+import numpy as np
+import pytest
+
+from aoc_common import shared_input
+from aoc_common.grid import Grid
+
+
+def total(handle):
+    data = shared_input.attach(handle)
+    return int(data["values"].sum()) + sum(data["extra"])
+
+
+def test_attach_views_arrays_without_copying():
+    """
+    Checks that attached arrays view the shared block, and can't be written through.
+    """
+    data = {"values": np.arange(1000, dtype=np.int64), "extra": [1, 2]}
+    with shared_input.published(data) as handle:
+        assert handle.size == 8000
+        attached = shared_input.attach(handle)
+        assert attached["extra"] == [1, 2]
+        assert np.array_equal(attached["values"], data["values"])
+        assert not attached["values"].flags.writeable
+        assert not attached["values"].flags.owndata
+
+
+def test_workers_attach_by_name():
+    data = {"values": np.arange(100), "extra": [5]}
+    with shared_input.published(data) as handle:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            assert list(pool.map(total, [handle] * 3)) == [4955] * 3
+
+
+def test_published_grid():
+    """Checks that a parsed Grid round trips, keeping its cells in the shared block."""
+    grid = Grid.from_bytes(b"#.\n.#\n")
+    with shared_input.published(grid) as handle:
+        assert handle.spans == [(handle.skeleton_size, 4)]
+        assert str(shared_input.attach(handle)) == str(grid)
+
+
+def test_handle_stays_small():
+    """Checks that a large parsed input stays in the block rather than in the handle."""
+    data = [list(range(row, row + 100)) for row in range(1000)]
+    with shared_input.published(data) as handle:
+        assert len(pickle.dumps(handle)) < 200
+        assert shared_input.attach(handle) == data
+
+
+def test_detach_closes_unused_blocks():
+    """
+    Checks that detach closes an attached block, but not while an array still views it.
+    """
+    with shared_input.published({"values": np.arange(10)}) as handle:
+        attached = shared_input.attach(handle)
+        assert handle.name not in shared_input.detach()
+        del attached
+        assert handle.name in shared_input.detach()
+        assert handle.name not in shared_input._attached
+
+
+def test_published_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"1 2 3\n")
+    with shared_input.published(data_path=path) as handle:
+        assert bytes(shared_input.attach(handle)) == b"1 2 3\n"
+
+
+def test_published_block_is_freed():
+    with shared_input.published([1, 2, 3]) as handle:
+        pass
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=handle.name)
@@ -0,0 +1,170 @@
+"""
+A long-lived solver process that serves solve requests over a Unix domain socket.
+
+The daemon imports every problem module once, and keeps recently parsed inputs in
+memory, so a request only pays for the solve itself. Requests and replies are single
+JSON lines:
+
+    {"day": 5, "mode": "solve", "part": 2, "input": null, "engine": "python"}
+    {"answer": "46", "parse_time": 0.0, "solve_time": 0.004, "cached_input": true}
+
+A request of {"command": "shutdown"} stops the daemon. Parses and solves run under any
+watchdog limits the daemon was given, in a forked child, so a runaway part can't hang
+the daemon. A day module whose source file changed since it was loaded is executed again
+before its next request, dropping its parsed inputs, and the reply then has "reloaded":
+true.
+"""
+
+import contextlib
+import json
+import os
+import socket
+import time
+
+from collections import OrderedDict
+from pathlib import Path
+
+from aoc_common import watchdog
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+
+MAX_PARSED_INPUTS = 32
+
+
+class SolverDaemon:
+    def __init__(
+        self, modules: dict, max_parsed: int = MAX_PARSED_INPUTS, limits: dict = None
+    ):
+        self.modules = modules
+        self.max_parsed = max_parsed
+        self.limits = limits or {}
+        self.parsed = OrderedDict()
+        self.stamps = {day: source_stamp(module) for day, module in modules.items()}
+
+    def input_path(self, module, mode: str, input_path: str = None) -> Path:
+        if input_path is not None:
+            return Path(input_path)
+        return {"check": module.SAMPLE_PATH, "solve": module.INPUT_PATH}[mode]
+
+    def refresh(self, day: int) -> bool:
+        """
+        Executes a day's module again if its source file changed since it was loaded,
+        and drops the inputs parsed by the old one. Returns whether it was reloaded.
+        """
+        from aoc_common.watch import load_source
+
+        module = self.modules[day]
+        stamp = source_stamp(module)
+        if stamp == self.stamps.get(day):
+            return False
+        self.modules[day] = load_source(module.__file__)
+        self.stamps[day] = stamp
+        for key in [key for key in self.parsed if key[0] == day]:
+            del self.parsed[key]
+        return True
+
+    def load(self, day: int, module, data_path: Path) -> tuple:
+        """
+        Returns (parsed input, whether it was already in memory). Entries are keyed on
+        the file's mtime and size, so an edited file is parsed again. Parsing runs under
+        the day's parse limits, if any.
+        """
+        stat = data_path.stat()
+        key = (day, str(data_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if key in self.parsed:
+            self.parsed.move_to_end(key)
+            return self.parsed[key], True
+        parse_limits = self.limits.get(day, {}).get("parse", watchdog.Limits())
+        parsed = watchdog.run_limited(
+            module.parse_input, data_path, limits=parse_limits
+        )
+        self.parsed[key] = parsed
+        while len(self.parsed) > self.max_parsed:
+            self.parsed.popitem(last=False)
+        return parsed, False
+
+    def solve(self, request: dict) -> dict:
+        """
+        Handles one solve request. Errors are returned in the reply rather than raised.
+        """
+        try:
+            day = int(request["day"])
+            part = int(request["part"])
+            reloaded = self.refresh(day)
+            module = self.modules[day]
+            solver = solvers(module.ENGINES, request.get("engine", DEFAULT_ENGINE))[
+                part
+            ]
+            data_path = self.input_path(
+                module, request.get("mode", "solve"), request.get("input")
+            )
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                start = time.perf_counter()
+                input_data, cached = self.load(day, module, data_path)
+                parsed = time.perf_counter()
+                part_limits = self.limits.get(day, {}).get(
+                    f"part_{part}", watchdog.Limits()
+                )
+                answer = watchdog.run_limited(solver, input_data, limits=part_limits)
+                solved = time.perf_counter()
+        except watchdog.LimitExceeded as exc:
+            return {"error": f"{type(exc).__name__}: {exc}", **exc.as_dict()}
+        except Exception as exc:
+            return {"error": f"{type(exc).__name__}: {exc}"}
+        reply = {
+            "answer": str(answer),
+            "parse_time": parsed - start,
+            "solve_time": solved - parsed,
+            "cached_input": cached,
+        }
+        if reloaded:
+            reply["reloaded"] = True
+        return reply
+
+    def serve(self, socket_path: Path) -> None:
+        """Serves requests on socket_path until a shutdown request arrives."""
+        import socketserver
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                request = json.loads(self.rfile.readline())
+                if request.get("command") == "shutdown":
+                    reply = {"stopped": True}
+                    self.server.stop_requested = True
+                else:
+                    reply = daemon.solve(request)
+                self.wfile.write((json.dumps(reply) + "\n").encode())
+
+        socket_path.unlink(missing_ok=True)
+        with socketserver.UnixStreamServer(str(socket_path), Handler) as server:
+            server.stop_requested = False
+            try:
+                while not server.stop_requested:
+                    server.handle_request()
+            finally:
+                socket_path.unlink(missing_ok=True)
+
+
+def source_stamp(module) -> tuple:
+    """The (mtime, size) of a module's source file, or None if it has none."""
+    source = getattr(module, "__file__", None)
+    if source is None:
+        return None
+    stat = os.stat(source)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def send_request(socket_path: Path, request: dict, timeout: float = None) -> dict:
+    """
+    Sends one request to a running daemon and returns its reply.
+    Raises FileNotFoundError or ConnectionRefusedError if no daemon is listening, and
+    TimeoutError if the daemon doesn't reply within timeout seconds.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        with client.makefile("rwb") as stream:
+            stream.write((json.dumps(request) + "\n").encode())
+            stream.flush()
+            return json.loads(stream.readline())
@@ -0,0 +1,125 @@
+import threading
+import time
+
+from types import SimpleNamespace
+
+import pytest
+
+from aoc_common.solver_daemon import SolverDaemon, send_request
+from aoc_common.watch import load_source
+from aoc_common.watchdog import Limits
+
+parse_calls = []
+
+
+def parse_input(data_path):
+    parse_calls.append(data_path)
+    return [int(l) for l in data_path.read_text().split()]
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    sample = tmp_path / "sample.txt"
+    sample.write_text("1\n2\n3\n")
+    module = SimpleNamespace(
+        SAMPLE_PATH=sample,
+        INPUT_PATH=tmp_path / "missing.txt",
+        parse_input=parse_input,
+        ENGINES={"python": {1: sum, 2: max}, "reversed": {2: min}},
+    )
+    parse_calls.clear()
+    return SolverDaemon({1: module})
+
+
+def test_solve_reuses_parsed_input(daemon):
+    """Checks that a second request for the same input skips parsing."""
+    first = daemon.solve({"day": 1, "mode": "check", "part": 1})
+    second = daemon.solve({"day": 1, "mode": "check", "part": 2})
+    assert (first["answer"], second["answer"]) == ("6", "3")
+    assert (first["cached_input"], second["cached_input"]) == (False, True)
+    assert len(parse_calls) == 1
+
+
+def test_solve_selects_engine(daemon):
+    """
+    Checks that a request can pick an engine, which falls back to the reference for
+    other parts.
+    """
+    request = {"day": 1, "mode": "check", "engine": "reversed"}
+    assert daemon.solve({**request, "part": 2})["answer"] == "1"
+    assert daemon.solve({**request, "part": 1})["answer"] == "6"
+    assert "ValueError" in daemon.solve({**request, "part": 1, "engine": "x"})["error"]
+
+
+def test_solve_reports_errors(daemon):
+    """Checks that failures come back in the reply instead of stopping the daemon."""
+    assert (
+        "FileNotFoundError"
+        in daemon.solve({"day": 1, "mode": "solve", "part": 1})["error"]
+    )
+    assert "KeyError" in daemon.solve({"day": 2, "mode": "check", "part": 1})["error"]
+
+
+def test_solve_enforces_limits(daemon):
+    """
+    Checks that a part over its time limit is stopped and reported, and the daemon
+    carries on.
+    """
+    module = daemon.modules[1]
+    module.ENGINES["python"][2] = lambda input_data: time.sleep(30)
+    daemon.limits = {1: {"part_2": Limits(time_s=0.2)}}
+    reply = daemon.solve({"day": 1, "mode": "check", "part": 2})
+    assert reply["status"] == "timeout"
+    assert daemon.solve({"day": 1, "mode": "check", "part": 1})["answer"] == "6"
+
+
+def test_solve_enforces_parse_limits(daemon):
+    """Checks that a parse over its time limit is stopped and reported too."""
+    daemon.modules[1].parse_input = lambda data_path: time.sleep(30)
+    daemon.limits = {1: {"parse": Limits(time_s=0.2)}}
+    assert daemon.solve({"day": 1, "mode": "check", "part": 1})["status"] == "timeout"
+
+
+def test_solve_reloads_edited_module(tmp_path):
+    """Checks that editing a day's source reloads it and drops its parsed inputs."""
+    sample = tmp_path / "sample.txt"
+    sample.write_text("1\n2\n3\n")
+    source = tmp_path / "daemon_reload_day.py"
+    template = (
+        "from pathlib import Path\n"
+        f"SAMPLE_PATH = INPUT_PATH = Path({str(sample)!r})\n"
+        "def parse_input(data_path):\n"
+        "    return [int(l) for l in data_path.read_text().split()]\n"
+        "ENGINES = {{'python': {{1: {solver}, 2: max}}}}\n"
+    )
+    source.write_text(template.format(solver="sum"))
+    daemon = SolverDaemon({1: load_source(source)})
+    assert daemon.solve({"day": 1, "mode": "check", "part": 1})["answer"] == "6"
+    source.write_text(template.format(solver="lambda rows: len(rows)"))
+    reply = daemon.solve({"day": 1, "mode": "check", "part": 1})
+    assert (reply["answer"], reply["reloaded"], reply["cached_input"]) == (
+        "3",
+        True,
+        False,
+    )
+    assert "reloaded" not in daemon.solve({"day": 1, "mode": "check", "part": 1})
+
+
+def test_serve_over_socket(daemon, tmp_path):
+    """Checks a request and a shutdown round trip over the Unix socket."""
+    socket_path = tmp_path / "solver.sock"
+    server = threading.Thread(target=daemon.serve, args=(socket_path,))
+    server.start()
+    try:
+        for _ in range(100):
+            if socket_path.exists():
+                break
+            threading.Event().wait(0.01)
+        reply = send_request(
+            socket_path, {"day": 1, "mode": "check", "part": 1}, timeout=5
+        )
+        assert reply["answer"] == "6"
+    finally:
+        send_request(socket_path, {"command": "shutdown"}, timeout=5)
+        server.join(5)
+    assert not socket_path.exists()
@@ -0,0 +1,58 @@
+"""
+Streaming, memory-mapped access to large input files.
+
+MappedLines gives the same lines parse_input would, but reads them one at a time from an
+mmap of the file, so only the current line is ever held as a Python string.
+"""
+
+import mmap
+
+from pathlib import Path
+
+
+def iter_line_views(data_path: Path):
+    """
+    Yields a memoryview of each line in the file, without its line ending.
+    Views are only valid until the next line is requested.
+    """
+    with open(data_path, "rb") as raw_input:
+        if raw_input.seek(0, 2) == 0:
+            return
+        with mmap.mmap(raw_input.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                start = 0
+                size = len(mapped)
+                while start < size:
+                    end = mapped.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    line = view[start:end]
+                    try:
+                        yield line
+                    finally:
+                        # Released even if the consumer stops early, so the mmap can
+                        # close.
+                        line.release()
+                    start = end + 1
+            finally:
+                view.release()
+
+
+class MappedLines:
+    """
+    Re-iterable sequence of the stripped lines of a file, read lazily through mmap. Can
+    stand in for the list returned by parse_input wherever the lines are only looped
+    over.
+    """
+
+    def __init__(self, data_path: Path, encoding: str = "utf-8"):
+        self.data_path = Path(data_path)
+        self.encoding = encoding
+
+    def __iter__(self):
+        for line in iter_line_views(self.data_path):
+            yield str(line, self.encoding).strip()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({str(self.data_path)!r})"
@@ -0,0 +1,38 @@
+import pytest
+
+from aoc_common.streaming import MappedLines, iter_line_views
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["a\nb\nc\n", "a\nb\nc", "a \r\n b\n\n", "\n", ""],
+)
+def test_mapped_lines_match_readlines(tmp_path, text):
+    """Checks that streamed lines match the list parse_input would build."""
+    path = tmp_path / "input.txt"
+    path.write_bytes(text.encode())
+    with open(path, "r") as raw_input:
+        expected = [l.strip() for l in raw_input.readlines()]
+    assert list(MappedLines(path)) == expected
+
+
+def test_mapped_lines_are_reiterable(tmp_path):
+    """Checks that the same MappedLines can be looped over more than once."""
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n")
+    lines = MappedLines(path)
+    assert list(lines) == list(lines) == ["1", "2"]
+
+
+def test_stopping_early_closes_cleanly(tmp_path):
+    """
+    Checks that a consumer can break out of the loop, or close the generator, mid-file.
+    """
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n3\n")
+    views = iter_line_views(path)
+    assert bytes(next(views)) == b"1"
+    views.close()
+    for line in MappedLines(path):
+        break
+    assert line == "1"
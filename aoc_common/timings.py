@@ -0,0 +1,163 @@
+"""
+Machine-readable benchmark exports, for the runner's benchmark --export and report
+commands.
+
+An export holds one benchmark run: its git revision, Python version and machine, then
+for every day and phase the repeat samples in seconds and the peak memory allocated in
+one run. Phases are split into part (none for parsing), phase ("parse" or "solve") and
+engine.
+
+JSON exports keep each phase's samples together:
+
+    {"revision": "...", "python": "3.11.7", ..., "timings": [
+        {"day": 5, "part": 2, "phase": "solve", "engine": "python",
+         "samples": [0.41, 0.40], "peak_bytes": 1048576, "error": null}, ...]}
+
+CSV exports have one row per sample, numbered from 0 in the sample column, with the
+run's details repeated on every row. A phase that failed has a single row with an error
+and no samples. A phase whose peak memory couldn't be measured has no peak_bytes.
+"""
+
+import csv
+import json
+
+from pathlib import Path
+
+from aoc_common.engines import DEFAULT_ENGINE
+
+RUN_FIELDS = ("revision", "python", "machine", "timestamp", "warmup", "repeat")
+CSV_FIELDS = RUN_FIELDS + (
+    "day",
+    "part",
+    "phase",
+    "engine",
+    "sample",
+    "seconds",
+    "peak_bytes",
+    "error",
+)
+FORMATS = ("json", "csv")
+
+
+def split_phase(name: str) -> tuple:
+    """Splits a benchmark phase name like "part_1:numpy" into (part, phase, engine)."""
+    if name == "parse":
+        return None, "parse", None
+    part, _, engine = name.partition(":")
+    return int(part.removeprefix("part_")), "solve", engine or DEFAULT_ENGINE
+
+
+def join_phase(part: int, phase: str, engine: str) -> str:
+    """
+    The benchmark phase name for a part, phase and engine; the inverse of split_phase.
+    """
+    if phase == "parse":
+        return "parse"
+    return f"part_{part}" if engine == DEFAULT_ENGINE else f"part_{part}:{engine}"
+
+
+def timing_entries(record: dict, peaks: dict = None) -> list:
+    """
+    One entry per day and phase of a history record. peaks maps day to phase to the peak
+    bytes allocated, for the phases that were measured.
+    """
+    peaks = peaks or {}
+    entries = []
+    for day, phases in record["results"].items():
+        for name, samples in phases.items():
+            part, phase, engine = split_phase(name)
+            failed = isinstance(samples, dict)
+            entries.append(
+                {
+                    "day": int(day),
+                    "part": part,
+                    "phase": phase,
+                    "engine": engine,
+                    "samples": [] if failed else samples,
+                    "peak_bytes": peaks.get(int(day), {}).get(name),
+                    "error": samples["error"] if failed else None,
+                }
+            )
+    return entries
+
+
+def output_format(path: Path, requested: str = None) -> str:
+    """The requested format, or the one named by the file's suffix."""
+    chosen = requested or Path(path).suffix.lstrip(".").lower()
+    if chosen not in FORMATS:
+        raise ValueError(
+            f"can't tell the export format of {path}; use one of {', '.join(FORMATS)}"
+        )
+    return chosen
+
+
+def write_timings(
+    record: dict, peaks: dict, path: Path, requested_format: str = None
+) -> None:
+    """
+    Writes a benchmark run to path as JSON or CSV (default: by the file's suffix).
+    Raises ValueError, leaving path untouched, if the format can't be told.
+    """
+    export_format = output_format(path, requested_format)
+    run = {field: record[field] for field in RUN_FIELDS}
+    entries = timing_entries(record, peaks)
+    with open(path, "w", newline="") as export_file:
+        if export_format == "json":
+            json.dump({**run, "timings": entries}, export_file, indent=1)
+            export_file.write("\n")
+            return
+        writer = csv.DictWriter(export_file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for entry in entries:
+            row = {**run, **{k: v for k, v in entry.items() if k != "samples"}}
+            if not entry["samples"]:
+                writer.writerow(row)
+            for index, seconds in enumerate(entry["samples"]):
+                writer.writerow({**row, "sample": index, "seconds": seconds})
+
+
+def _optional_int(value: str):
+    return int(value) if value not in ("", None) else None
+
+
+def load_timings(path: Path) -> dict:
+    """
+    Reads an export back, in either format. Returns the run's details, with its timings
+    as {(day, phase name): entry}, where phase names are as the benchmark prints them.
+    """
+    path = Path(path)
+    with open(path, "r", newline="") as export_file:
+        if output_format(path) == "json":
+            run = json.load(export_file)
+            entries = run.pop("timings")
+        else:
+            run = {}
+            merged = {}
+            for row in csv.DictReader(export_file):
+                run = {field: row[field] for field in RUN_FIELDS}
+                run["warmup"] = int(run["warmup"])
+                run["repeat"] = int(run["repeat"])
+                key = (row["day"], row["part"], row["phase"], row["engine"])
+                entry = merged.setdefault(
+                    key,
+                    {
+                        "day": int(row["day"]),
+                        "part": _optional_int(row["part"]),
+                        "phase": row["phase"],
+                        "engine": row["engine"] or None,
+                        "samples": [],
+                        "peak_bytes": _optional_int(row["peak_bytes"]),
+                        "error": row["error"] or None,
+                    },
+                )
+                if row["seconds"]:
+                    entry["samples"].append(float(row["seconds"]))
+            entries = list(merged.values())
+    run["timings"] = {
+        (
+            entry["day"],
+            join_phase(entry["part"], entry["phase"], entry["engine"]),
+        ): entry
+        for entry in entries
+    }
+    return run
@@ -0,0 +1,58 @@
+import pytest
+
+from aoc_common import history, timings
+
+RESULTS = {
+    5: {"parse": [0.1, 0.2], "part_2": [0.5, 0.4, 0.6], "part_2:numpy": [0.05]},
+    7: {"part_1": ValueError("bad")},
+}
+PEAKS = {5: {"parse": 1024, "part_2": 2048}}
+
+
+def test_split_phase():
+    assert timings.split_phase("parse") == (None, "parse", None)
+    assert timings.split_phase("part_2") == (2, "solve", "python")
+    assert timings.split_phase("part_1:numpy") == (1, "solve", "numpy")
+    assert timings.join_phase(1, "solve", "numpy") == "part_1:numpy"
+
+
+@pytest.mark.parametrize("suffix", ["json", "csv"])
+def test_export_round_trip(tmp_path, suffix):
+    """
+    Checks that samples, peaks, errors and run details survive writing and reading back.
+    """
+    record = history.build_record(RESULTS, warmup=1, repeat=3)
+    path = tmp_path / f"timings.{suffix}"
+    timings.write_timings(record, PEAKS, path)
+    loaded = timings.load_timings(path)
+    assert loaded["revision"] == record["revision"]
+    assert loaded["python"] == record["python"]
+    assert loaded["repeat"] == 3
+    entries = loaded["timings"]
+    assert set(entries) == {
+        (5, "parse"),
+        (5, "part_2"),
+        (5, "part_2:numpy"),
+        (7, "part_1"),
+    }
+    assert entries[(5, "part_2")]["samples"] == [0.5, 0.4, 0.6]
+    assert entries[(5, "part_2")]["peak_bytes"] == 2048
+    assert entries[(5, "part_2:numpy")]["peak_bytes"] is None
+    assert entries[(5, "parse")]["part"] is None
+    assert entries[(7, "part_1")]["error"] == "ValueError: bad"
+    assert entries[(7, "part_1")]["samples"] == []
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        timings.output_format(tmp_path / "timings.txt")
+
+
+def test_unknown_format_leaves_file(tmp_path):
+    """Checks that an export in an unknown format fails before the file is truncated."""
+    path = tmp_path / "timings.txt"
+    path.write_text("keep\n")
+    record = history.build_record(RESULTS, warmup=1, repeat=3)
+    with pytest.raises(ValueError):
+        timings.write_timings(record, PEAKS, path)
+    assert path.read_text() == "keep\n"
@@ -0,0 +1,59 @@
+"""
+Process-wide logging setup and cheap trace points for hot loops.
+
+install() attaches a single handler to the "aoc_logger" logger, however many day modules
+are loaded in the process, and turns tracing on when the level is DEBUG. logging itself
+is only imported by install(), so modules can import this one without slowing their
+startup.
+
+Trace points in loops are guarded so that they cost a single check when tracing is off,
+and are removed entirely under python -O:
+
+    trace_every = tracing.sample_every()
+    for step in ...:
+        if __debug__ and trace_every and step % trace_every == 0:
+            tracing.trace("step %d at %s", step, position)
+
+Arguments are only formatted for records that are actually emitted.
+"""
+
+import os
+
+LOGGER_NAME = "aoc_logger"
+DEFAULT_EVERY = 1000
+EVERY_VARIABLE = "AOC_TRACE_EVERY"
+
+enabled = False
+every = 0
+_logger = None
+
+
+def install(level: str, trace_every: int = None) -> None:
+    """
+    Sets the aoc_logger level, attaching its handler on the first call only.
+    Sampled trace points fire every trace_every iterations, defaulting to the
+    AOC_TRACE_EVERY environment variable, or DEFAULT_EVERY.
+    """
+    import logging
+
+    global enabled, every, _logger
+    if _logger is None:
+        _logger = logging.getLogger(LOGGER_NAME)
+        handler = logging.StreamHandler()
+        handler.setLevel("DEBUG")
+        _logger.addHandler(handler)
+    _logger.setLevel(level.upper())
+    enabled = _logger.isEnabledFor(logging.DEBUG)
+    if trace_every is None:
+        trace_every = int(os.environ.get(EVERY_VARIABLE, DEFAULT_EVERY))
+    every = max(1, trace_every) if enabled else 0
+
+
+def sample_every() -> int:
+    """How often sampled trace points fire, in iterations, or 0 if tracing is off."""
+    return every
+
+
+def trace(message: str, *args) -> None:
+    """Logs a debug record. Callers should check enabled, or sample_every(), first."""
+    _logger.debug(message, *args)
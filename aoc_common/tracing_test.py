@@ -0,0 +1,36 @@
+import logging
+
+import pytest
+
+from aoc_common import tracing
+
+
+@pytest.fixture
+def logger():
+    yield logging.getLogger(tracing.LOGGER_NAME)
+    tracing.install("WARNING")
+
+
+def test_install_attaches_one_handler(logger):
+    """Checks that installing repeatedly doesn't add more handlers."""
+    tracing.install("DEBUG")
+    handlers = list(logger.handlers)
+    tracing.install("INFO")
+    tracing.install("DEBUG")
+    assert logger.handlers == handlers
+
+
+def test_sampling_follows_level(logger):
+    """Checks that sampled trace points only fire at DEBUG."""
+    tracing.install("DEBUG", trace_every=100)
+    assert tracing.enabled and tracing.sample_every() == 100
+    tracing.install("INFO", trace_every=100)
+    assert not tracing.enabled and tracing.sample_every() == 0
+
+
+def test_trace_emits_at_debug(logger, caplog):
+    """Checks that trace records reach the aoc_logger with their arguments formatted."""
+    tracing.install("DEBUG")
+    with caplog.at_level(logging.DEBUG, logger=tracing.LOGGER_NAME):
+        tracing.trace("at %s after %d steps", "ZZZ", 6)
+    assert caplog.messages == ["at ZZZ after 6 steps"]
@@ -0,0 +1,173 @@
+"""
+Warm re-solving for the runner's watch command.
+
+A WarmSession keeps one process alive across edits. On each refresh it re-executes the
+day module, then solves the requested parts on the input it already parsed, unless the
+input file or the parser changed since. The parser counts as changed if parse_input, or
+any function, class or constant of the module that it refers to (directly or through
+those functions), compiles differently, so edits to the solvers alone, or moving code
+around, keep the parse.
+"""
+
+import contextlib
+import hashlib
+import importlib
+import sys
+import time
+import types
+
+from pathlib import Path
+
+from aoc_common import watchdog
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+
+WATCHED_PATTERNS = ("*.py", "*.txt")
+
+
+def snapshot(folder: Path, patterns: tuple = WATCHED_PATTERNS) -> dict:
+    """The (mtime, size) of each file in folder matching patterns, keyed by path."""
+    state = {}
+    for pattern in patterns:
+        for path in Path(folder).glob(pattern):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def load_source(module_path: Path) -> types.ModuleType:
+    """
+    Executes a module from its source file, registered under the file's stem.
+    Skips __pycache__, whose freshness check can miss a same-size edit within a second.
+    """
+    module_path = Path(module_path)
+    module = types.ModuleType(module_path.stem)
+    module.__file__ = str(module_path)
+    sys.modules[module.__name__] = module
+    exec(compile(module_path.read_text(), str(module_path), "exec"), module.__dict__)
+    return module
+
+
+def _code_digest(code: types.CodeType, digest) -> None:
+    """
+    Hashes what a code object does, leaving out line numbers and local variable names.
+    """
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_digest(const, digest)
+        else:
+            digest.update(repr(const).encode())
+
+
+def parser_digest(module: types.ModuleType, name: str = "parse_input") -> str:
+    """Digest of the module's parser and everything in the module it refers to."""
+    digest = hashlib.sha256()
+    seen = set()
+    pending = [name]
+    while pending:
+        name = pending.pop()
+        if name in seen or not hasattr(module, name):
+            continue
+        seen.add(name)
+        value = getattr(module, name)
+        digest.update(name.encode())
+        if isinstance(value, types.FunctionType):
+            functions = [value]
+        elif isinstance(value, type) and value.__module__ == module.__name__:
+            functions = [
+                v for v in vars(value).values() if isinstance(v, types.FunctionType)
+            ]
+        elif isinstance(value, (types.ModuleType, type, types.BuiltinFunctionType)):
+            continue
+        else:
+            digest.update(repr(value).encode())
+            continue
+        for function in functions:
+            if function.__module__ != module.__name__:
+                continue
+            _code_digest(function.__code__, digest)
+            pending.extend(_names(function.__code__))
+    return digest.hexdigest()
+
+
+def _names(code: types.CodeType) -> list:
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names.extend(_names(const))
+    return names
+
+
+def _solve(solver, input_data) -> tuple:
+    """
+    Returns (answer, seconds, top-level modules the solve imported for the first time).
+    """
+    before = set(sys.modules)
+    answer, seconds = watchdog.timed_call(solver, input_data)
+    imported = {name.partition(".")[0] for name in set(sys.modules) - before}
+    return answer, seconds, sorted(imported)
+
+
+class WarmSession:
+    def __init__(
+        self,
+        load,
+        mode: str = "check",
+        parts: tuple = (1, 2),
+        engine: str = DEFAULT_ENGINE,
+        limits: dict = None,
+    ):
+        """
+        load() returns a freshly executed day module. limits maps "part_1" and "part_2"
+        to their watchdog limits. Limited solves run in a forked child, so modules a
+        solver imports lazily (like numpy) are imported here too, to keep later solves
+        warm.
+        """
+        self.load = load
+        self.mode = mode
+        self.parts = parts
+        self.engine = engine
+        self.limits = limits or {}
+        self.parsed = None
+        self.parsed_key = None
+
+    def refresh(self) -> dict:
+        """
+        Reloads the day module and solves each part, parsing the input again only if
+        needed. Returns {"reparsed": bool, "parse_time": seconds, "parts": {part:
+        result}}, where each result has "answer" and "solve_time", or "error". Errors
+        loading the module or parsing the input are raised.
+        """
+        module = self.load()
+        data_path = {"check": module.SAMPLE_PATH, "solve": module.INPUT_PATH}[self.mode]
+        stat = data_path.stat()
+        key = (str(data_path), stat.st_mtime_ns, stat.st_size, parser_digest(module))
+        reparsed = key != self.parsed_key
+        parse_time = 0.0
+        if reparsed:
+            start = time.perf_counter()
+            self.parsed = module.parse_input(data_path)
+            parse_time = time.perf_counter() - start
+            self.parsed_key = key
+
+        results = {}
+        engine_solvers = solvers(module.ENGINES, self.engine)
+        for part in self.parts:
+            part_limits = self.limits.get(f"part_{part}", watchdog.Limits())
+            try:
+                answer, seconds, imported = watchdog.run_limited(
+                    _solve, engine_solvers[part], self.parsed, limits=part_limits
+                )
+            except Exception as exc:
+                results[part] = {"error": f"{type(exc).__name__}: {exc}"}
+                continue
+            results[part] = {"answer": answer, "solve_time": seconds}
+            for name in imported:
+                if name not in sys.modules:
+                    with contextlib.suppress(ImportError):
+                        importlib.import_module(name)
+        return {"reparsed": reparsed, "parse_time": parse_time, "parts": results}
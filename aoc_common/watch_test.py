@@ -0,0 +1,107 @@
+import pytest
+
+from aoc_common import watch
+
+MODULE_SOURCE = """
+from pathlib import Path
+
+SAMPLE_PATH = Path(__file__).with_name("sample.txt")
+INPUT_PATH = SAMPLE_PATH
+SEPARATOR = "\\n"
+
+
+def split(text):
+    return [int(l) for l in text.split(SEPARATOR) if l]
+
+
+def parse_input(data_path):
+    return split(data_path.read_text())
+
+
+def part_1(input_data):
+    return sum(input_data)
+
+
+def part_2(input_data):
+    return max(input_data)
+
+
+ENGINES = {"python": {1: part_1, 2: part_2}}
+"""
+
+
+@pytest.fixture
+def day_folder(tmp_path):
+    (tmp_path / "day.py").write_text(MODULE_SOURCE)
+    (tmp_path / "sample.txt").write_text("1\n2\n3\n")
+    return tmp_path
+
+
+def loader(folder):
+    return lambda: watch.load_source(folder / "day.py")
+
+
+def edit(path, old, new):
+    path.write_text(path.read_text().replace(old, new))
+
+
+def test_parser_digest_ignores_solver_edits(day_folder):
+    """
+    Checks that the digest follows the parser and its helpers, but not the solvers.
+    """
+    load = loader(day_folder)
+    original = watch.parser_digest(load())
+    edit(day_folder / "day.py", "return sum(input_data)", "return sum(input_data) + 1")
+    assert watch.parser_digest(load()) == original
+    edit(day_folder / "day.py", "[int(l) for", "[2 * int(l) for")
+    assert watch.parser_digest(load()) != original
+
+
+def test_parser_digest_follows_constants(day_folder):
+    load = loader(day_folder)
+    original = watch.parser_digest(load())
+    edit(day_folder / "day.py", 'SEPARATOR = "\\n"', 'SEPARATOR = ","')
+    assert watch.parser_digest(load()) != original
+
+
+def test_refresh_reuses_parse_until_input_changes(day_folder):
+    """
+    Checks that a solver edit reuses the parsed input, and an input edit parses it
+    again.
+    """
+    session = watch.WarmSession(loader(day_folder))
+    first = session.refresh()
+    assert first["reparsed"]
+    assert {part: result["answer"] for part, result in first["parts"].items()} == {
+        1: 6,
+        2: 3,
+    }
+
+    edit(day_folder / "day.py", "return max(input_data)", "return min(input_data)")
+    second = session.refresh()
+    assert not second["reparsed"]
+    assert second["parts"][2]["answer"] == 1
+
+    (day_folder / "sample.txt").write_text("5\n")
+    assert session.refresh()["reparsed"]
+
+
+def test_refresh_reports_solver_errors(day_folder):
+    edit(day_folder / "day.py", "return sum(input_data)", "return 1 / 0")
+    result = watch.WarmSession(loader(day_folder), parts=(1,)).refresh()
+    assert result["parts"][1]["error"].startswith("ZeroDivisionError")
+
+
+def test_load_source_sees_same_size_edit(day_folder):
+    """Checks that an edit keeping the file's size is picked up straight away."""
+    load = loader(day_folder)
+    assert load().part_2([1, 2]) == 2
+    edit(day_folder / "day.py", "return max(input_data)", "return min(input_data)")
+    assert load().part_2([1, 2]) == 1
+
+
+def test_snapshot_sees_edits(day_folder):
+    before = watch.snapshot(day_folder)
+    assert set(path.name for path in before) == {"day.py", "sample.txt"}
+    (day_folder / "sample.txt").write_text("1\n2\n3\n4\n")
+    assert watch.snapshot(day_folder) != before
@@ -0,0 +1,153 @@
+"""
+Wall-time and resident memory limits for a single call, enforced from outside the call.
+
+run_limited() forks a child process to make the call, and watches it from the parent. A
+child that runs past its time limit, or whose resident set grows past its memory limit,
+is killed, and LimitExceeded is raised with a structured description of what happened.
+Forking means the call and its arguments (like an already parsed input) don't need to be
+pickled; only the result is sent back.
+
+Memory is the growth of the child's resident set, read from /proc, above the parent's
+resident set at the moment of the fork. A forked child starts out mapping everything the
+parent holds (a daemon's cached inputs, say), so its total resident set says more about
+the parent than about the call. Memory is only enforced on Linux. Where fork isn't
+available, calls run in-process without limits.
+"""
+
+import json
+import os
+import time
+
+from dataclasses import asdict, dataclass
+
+POLL_SECONDS = 0.02
+GRACE_SECONDS = 1.0
+
+
+@dataclass
+class Limits:
+    time_s: float = None
+    rss_mib: float = None
+
+    def __bool__(self):
+        return self.time_s is not None or self.rss_mib is not None
+
+
+class LimitExceeded(Exception):
+    """Raised when a limited call is killed, or its process dies without returning."""
+
+    def __init__(
+        self, status: str, elapsed: float, peak_rss_mib: float, limits: Limits
+    ):
+        self.status = status
+        self.elapsed = elapsed
+        self.peak_rss_mib = peak_rss_mib
+        self.limits = limits
+        super().__init__(json.dumps(self.as_dict()))
+
+    def __reduce__(self):
+        return type(self), (self.status, self.elapsed, self.peak_rss_mib, self.limits)
+
+    def as_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "elapsed": round(self.elapsed, 3),
+            "peak_rss_mib": round(self.peak_rss_mib, 1),
+            "limits": asdict(self.limits),
+        }
+
+
+def rss_mib(pid: int) -> float:
+    """The resident set size of a process in MiB, or 0.0 if it can't be read."""
+    try:
+        with open(f"/proc/{pid}/statm", "r") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0.0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _child(connection, func, args, kwargs) -> None:
+    try:
+        result = ("ok", func(*args, **kwargs))
+    except BaseException as exc:
+        result = ("error", exc)
+    try:
+        connection.send(result)
+    except Exception as exc:
+        connection.send(
+            ("error", RuntimeError(f"result could not be sent back: {exc}"))
+        )
+    connection.close()
+
+
+def _stop(process) -> None:
+    process.terminate()
+    process.join(GRACE_SECONDS)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def timed_call(func, *args, **kwargs) -> tuple:
+    """
+    Returns (func(*args, **kwargs), seconds taken), so timings can exclude the fork.
+    """
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run_limited(func, *args, limits: Limits, **kwargs):
+    """
+    Returns func(*args, **kwargs), run in a child process under the given limits.
+    Exceptions raised by func are re-raised here. Raises LimitExceeded with status
+    "timeout" or "oom" if the child is killed for going over a limit, or "crashed" if it
+    dies on its own. The memory limit, and the peak reported, count only what the
+    child's resident set grew by over what this process held when it forked.
+    """
+    import multiprocessing
+
+    if not limits or "fork" not in multiprocessing.get_all_start_methods():
+        return func(*args, **kwargs)
+
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_child, args=(sender, func, args, kwargs), daemon=True
+    )
+    baseline = rss_mib(os.getpid())
+    start = time.perf_counter()
+    process.start()
+    sender.close()
+    peak = 0.0
+    status = None
+    try:
+        while True:
+            if receiver.poll(POLL_SECONDS):
+                outcome, value = receiver.recv()
+                break
+            elapsed = time.perf_counter() - start
+            peak = max(peak, rss_mib(process.pid) - baseline)
+            if limits.time_s is not None and elapsed > limits.time_s:
+                status = "timeout"
+            elif limits.rss_mib is not None and peak > limits.rss_mib:
+                status = "oom"
+            elif not process.is_alive() and not receiver.poll(0):
+                status = "crashed"
+            if status is not None:
+                break
+    except EOFError:
+        status = "crashed"
+    finally:
+        if status is not None:
+            _stop(process)
+        else:
+            process.join()
+        receiver.close()
+
+    if status is not None:
+        raise LimitExceeded(status, time.perf_counter() - start, peak, limits)
+    if outcome == "error":
+        raise value
+    return value
@@ -0,0 +1,77 @@
+import os
+import pickle
+import time
+
+import pytest
+
+from aoc_common import watchdog
+
+
+def sleep_for(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def allocate(mib):
+    block = bytearray(mib * 1024 * 1024)
+    time.sleep(0.5)
+    return len(block)
+
+
+def fail():
+    raise ValueError("bad input")
+
+
+def test_run_limited_returns_result():
+    """Checks that a call within its limits returns normally."""
+    assert (
+        watchdog.run_limited(sleep_for, 0.01, limits=watchdog.Limits(time_s=5)) == 0.01
+    )
+
+
+def test_run_limited_reraises_errors():
+    """Checks that an exception raised by the call reaches the caller."""
+    with pytest.raises(ValueError, match="bad input"):
+        watchdog.run_limited(fail, limits=watchdog.Limits(time_s=5))
+
+
+def test_run_limited_times_out():
+    """Checks that a call over its time limit is killed and reported as a timeout."""
+    start = time.perf_counter()
+    with pytest.raises(watchdog.LimitExceeded) as info:
+        watchdog.run_limited(sleep_for, 30, limits=watchdog.Limits(time_s=0.2))
+    assert info.value.status == "timeout"
+    assert time.perf_counter() - start < 5
+
+
+def test_run_limited_stops_memory_growth():
+    """
+    Checks that a call whose resident set grows past its limit is reported as out of
+    memory.
+    """
+    if watchdog.rss_mib(os.getpid()) == 0:
+        pytest.skip("resident set size isn't readable on this platform")
+    with pytest.raises(watchdog.LimitExceeded) as info:
+        watchdog.run_limited(allocate, 200, limits=watchdog.Limits(rss_mib=50))
+    assert info.value.status == "oom"
+
+
+def test_run_limited_ignores_parent_memory():
+    """
+    Checks that memory the parent already holds doesn't count against the child's limit.
+    """
+    if watchdog.rss_mib(os.getpid()) == 0:
+        pytest.skip("resident set size isn't readable on this platform")
+    held = bytearray(300 * 1024 * 1024)
+    held[::4096] = b"x" * len(held[::4096])
+    assert (
+        watchdog.run_limited(sleep_for, 0.1, limits=watchdog.Limits(rss_mib=200)) == 0.1
+    )
+    del held
+
+
+def test_limit_exceeded_pickles():
+    """Checks that the error survives being sent between processes."""
+    error = watchdog.LimitExceeded("timeout", 1.5, 20.0, watchdog.Limits(time_s=1))
+    copy = pickle.loads(pickle.dumps(error))
+    assert copy.as_dict() == error.as_dict()
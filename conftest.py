@@ -0,0 +1,8 @@
+collect_ignore = ["templates"]
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "perf: time and memory budget checks, configured in config.toml [perf]",
+    )
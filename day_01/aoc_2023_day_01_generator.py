@@ -0,0 +1,48 @@
+# Advent of Code 2023
+# Day 01
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the number of calibration lines.
+PUZZLE_SIZE = 1000
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Lines of letters, spelled-out digits and digits. Every line has at least one digit.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        pieces = [rng.choice("123456789")]
+        for _ in range(rng.randint(2, 10)):
+            roll = rng.random()
+            if roll < 0.2:
+                pieces.append(rng.choice("123456789"))
+            elif roll < 0.4:
+                pieces.append(rng.choice(WORDS))
+            else:
+                pieces.append("".join(rng.choices(LETTERS, k=rng.randint(1, 4))))
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
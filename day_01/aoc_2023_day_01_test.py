@@ -4,18 +4,43 @@ import pytest
 from pathlib import Path
 
 problem_file = importlib.import_module(Path(__file__).stem[:-5])
+generator = importlib.import_module(f"{Path(__file__).stem[:-5]}_generator")
 
+from aoc_common import differential, perf_budget
 
-@pytest.fixture
+DAY = int(Path(__file__).stem[:-5].rsplit("_", 1)[1])
+VARIANT_ENGINES = [e for e in problem_file.ENGINES if e != differential.DEFAULT_ENGINE]
+
+
+@pytest.fixture(scope="session")
 def sample_input():
     return problem_file.parse_input(problem_file.SAMPLE_PATH)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def problem_input():
+    if not problem_file.INPUT_PATH.exists():
+        pytest.skip("no puzzle input downloaded for this day")
     return problem_file.parse_input(problem_file.INPUT_PATH)
 
 
+@pytest.fixture(scope="session")
+def generated_input(tmp_path_factory):
+    data_path = tmp_path_factory.mktemp("generated") / "generated.txt"
+    data_path.write_text(generator.generate(50, seed=0))
+    return problem_file.parse_input(data_path)
+
+
+@pytest.fixture(scope="session")
+def large_input(tmp_path_factory):
+    size = perf_budget.generated_size(
+        generator.PUZZLE_SIZE, perf_budget.part_budget(DAY)
+    )
+    data_path = tmp_path_factory.mktemp("generated") / "large.txt"
+    data_path.write_text(generator.generate(size, seed=0))
+    return problem_file.parse_input(data_path)
+
+
 def test_input_extant(sample_input, problem_input):
     """Checks that input parsing returns something."""
     assert sample_input is not None
@@ -50,3 +75,38 @@ def test_part_2_sample(sample_input):
 def test_part_2_problem(problem_input):
     """Checks part 2 against a known answer, using problem input."""
     assert problem_file.part_2(problem_input) == 0
+
+
+def test_generated_input_solves(generated_input):
+    """Checks that both parts run to completion on a small generated input."""
+    assert problem_file.part_1(generated_input) is not None
+    assert problem_file.part_2(generated_input) is not None
+
+
+@pytest.mark.parametrize("part", [1, 2])
+@pytest.mark.parametrize("engine", VARIANT_ENGINES)
+def test_engine_matches_reference(tmp_path, engine, part):
+    """
+    Checks another engine against the reference engine on generated inputs of growing
+    size.
+    """
+    report = differential.check_engine(problem_file, generator, part, engine, tmp_path)
+    assert report.mismatch is None, report.describe()
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("part", [1, 2])
+@pytest.mark.parametrize("input_name", ["problem_input", "large_input"])
+def test_part_within_budget(request, input_name, part):
+    """
+    Checks that a part stays within its time and memory budget from config.toml [perf].
+    """
+    budget = perf_budget.part_budget(DAY, part)
+    if input_name == "problem_input" and budget.skip_full:
+        pytest.skip(budget.skip_full)
+    solver = getattr(problem_file, f"part_{part}")
+    elapsed, peak_mib = perf_budget.measure_part(
+        solver, request.getfixturevalue(input_name)
+    )
+    assert elapsed <= budget.time_s
+    assert peak_mib <= budget.memory_mib
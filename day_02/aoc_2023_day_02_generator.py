@@ -0,0 +1,41 @@
+# Advent of Code 2023
+# Day 02
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the number of games.
+PUZZLE_SIZE = 100
+
+COLOURS = ["red", "green", "blue"]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Games of one to six draws, each showing some of the three cube colours."""
+    rng = random.Random(seed)
+    lines = []
+    for game in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(COLOURS, rng.randint(1, 3))
+            draws.append(
+                ", ".join(f"{rng.randint(1, 20)} {colour}" for colour in colours)
+            )
+        lines.append(f"Game {game}: " + "; ".join(draws))
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
@@ -2,14 +2,22 @@
 # Day 03
 # Jim Kaufman
 
-import argparse
-import logging
 import sys
+from functools import lru_cache
 from collections import defaultdict
-import regex as re
+import re
+import string
 
 from pathlib import Path
 
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+from aoc_common.grid import Grid
+from aoc_common.input_cache import cached_parse
+
 PARENT_FOLDER = Path(__file__).parent
 BASE_FILE_NAME = Path(__file__).stem
 INPUT_FILE_NAME = f"{BASE_FILE_NAME}_input.txt"
@@ -19,96 +27,57 @@ INPUT_PATH = PARENT_FOLDER / INPUT_FILE_NAME
 SAMPLE_PATH = PARENT_FOLDER / SAMPLE_FILE_NAME
 
 
-logger = logging.getLogger("aoc_logger")
-log_handler = logging.StreamHandler()
-log_handler.setLevel("DEBUG")
-logger.addHandler(log_handler)
+# ---=== PROBLEM CODE BELOW ===---
 
+DIGITS = "0123456789"
+NUMBER = re.compile(r"\d+")
 
-# ---=== PROBLEM CODE BELOW ===---
 
-symbols = set()
-stars = defaultdict()
-
-def create_grid(lines: list[str]) -> dict[tuple[int, int]: str]:
-    grid = defaultdict(lambda: '.')
-    for y, line in enumerate(lines):
-        for x, val in enumerate(line):
-            grid[(x, y)] = val
-
-    return grid
-
-def scan_grid_for_parts(lines: list) -> dict[tuple[int, int]: str]:
-        part_numbers = defaultdict(int)
-        for y, line in enumerate(lines):
-            for x, val in enumerate(line):
-                if not (val.isalpha() or val.isdigit() or val == '.'):
-                    symbols.add(val)
-                if val == '*':
-                    stars[x,y] = []
-            matches = re.finditer('\d+', line)
-            for match in matches:
-                part_numbers[(match.start(), y)] = match[0]
-        return part_numbers
-
-
-def check_for_adjacent_symbol(lines: list[str], partdict: dict[(int, int): str]) -> list:
-    grid = create_grid(lines)
-    parts = []
-    for i, j in partdict.keys():
-        found = False
-        for l in range(len(partdict[(i,j)])):
-            if found:
-                break
-            for x, y in [(i+l-1, j), (i+l+1, j), (i+l, j-1), (i+l, j+1), (i+l-1, j-1), (i+l-1, j+1), (i+l+1, j-1), (i+l+1, j+1)]:
-                if grid[(x,y)] in symbols:
-                    parts.append(int(partdict[(i, j)]))
-                    found = True
-                    break
-    return parts
-
-def scan_grid_for_stars(lines: list[str], partdict: dict[(int, int): str]) -> dict:
-    grid = create_grid(lines)
-    gears = defaultdict(int)
-    for i, j in partdict.keys():
-        found = False
-        for l in range(len(partdict[(i,j)])):
-            if found:
-                break
-            for x, y in [(i+l-1, j), (i+l+1, j), (i+l, j-1), (i+l, j+1), (i+l-1, j-1), (i+l-1, j+1), (i+l+1, j-1), (i+l+1, j+1)]:
-                if grid[(x,y)] == '*':
-                    val = stars[(x, y)]
-                    partno = partdict[(i, j)]
-                    val.append(partno)
-                    gears[(x, y)] = val
-                    found = True
-                    break
-    return gears
-
-def parse_input(data_path: Path) -> list:
+def find_numbers(grid: Grid) -> list[tuple[int, int, int, int]]:
+    """Every part number in the schematic, as (value, row, start column, stop column)."""
+    numbers = []
+    for row in range(grid.height):
+        for match in NUMBER.finditer(grid.row_text(row)):
+            numbers.append((int(match[0]), row, match.start(), match.end()))
+    return numbers
+
+
+def symbol_mask(grid: Grid):
+    """True for every cell that isn't a digit, a letter or '.'."""
+    return ~grid.mask(DIGITS + string.ascii_letters + ".")
+
+
+def parse_input(data_path: Path) -> Grid:
     """
     Reads and formats input.
     Should return the input data in a format where it is ready to be worked on.
     """
-    with open(data_path, "r") as raw_input:
-        return [l.strip() for l in raw_input.readlines()]
+    return Grid.from_file(data_path)
 
 
-def part_1(input_data: list):
+def part_1(input_data: Grid):
     """Solution code for Part 1. Should return the solution."""
-    part_no_dict = scan_grid_for_parts(input_data)
-    part_nos = check_for_adjacent_symbol(input_data, part_no_dict)
-    return sum(part_nos)
+    near_symbol = input_data.adjacent_to(symbol_mask(input_data))
+    return sum(
+        value
+        for value, row, start, stop in find_numbers(input_data)
+        if near_symbol[row, start:stop].any()
+    )
 
 
-def part_2(input_data: list):
+def part_2(input_data: Grid):
     """Solution code for Part 2. Should return the solution."""
-    part_no_dict = scan_grid_for_parts(input_data)
-    gear_dict = scan_grid_for_stars(input_data, part_no_dict)
+    stars = input_data.mask("*")
+    gears = defaultdict(list)
+    for value, row, start, stop in find_numbers(input_data):
+        for cell in input_data.span_neighbors(row, start, stop):
+            if stars[cell]:
+                gears[cell].append(value)
+
     gear_ratio_total = 0
-    for v in gear_dict.values():
+    for v in gears.values():
         if len(v) == 2:
-            gear_ratio_total += int(v[0]) * int(v[1])
+            gear_ratio_total += v[0] * v[1]
 
     return gear_ratio_total
 
@@ -123,15 +92,72 @@ def run_direct():
 # ---=== PROBLEM CODE ABOVE ===---
 
 
-def problem_dispatch(mode: str, part: int, log_level: str = None):
+ENGINES = {"python": {1: part_1, 2: part_2}}
+
+
+@lru_cache(maxsize=None)
+def load_input(data_path: Path):
+    """
+    Parses the input at data_path once, and reuses the result for the life of the process.
+    Parsed inputs are also cached on disk, so later runs can skip parsing unchanged input.
+    """
+    return cached_parse(parse_input, data_path)
+
+
+def problem_dispatch(
+    mode: str,
+    part: int,
+    log_level: str = None,
+    profile: bool = False,
+    memory: bool = False,
+    cache: bool = False,
+    time_limit: float = None,
+    rss_limit: float = None,
+    engine: str = DEFAULT_ENGINE,
+):
     if log_level is not None:
-        logger.setLevel(log_level.upper())
-    parts = {1: part_1, 2: part_2}
-    inputs = {"check": parse_input(SAMPLE_PATH), "solve": parse_input(INPUT_PATH)}
-    return parts[part](inputs[mode])
+        from aoc_common import tracing
+
+        tracing.install(log_level)
+    if time_limit is not None or rss_limit is not None:
+        from aoc_common.watchdog import Limits, run_limited
+
+        return run_limited(
+            problem_dispatch,
+            mode,
+            part,
+            profile=profile,
+            memory=memory,
+            cache=cache,
+            engine=engine,
+            limits=Limits(time_limit, rss_limit),
+        )
+    parts = solvers(ENGINES, engine)
+    input_paths = {"check": SAMPLE_PATH, "solve": INPUT_PATH}
+    if profile:
+        from aoc_common.profiling import profile_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = profile_call(parse_input, input_paths[mode], label=f"{label}_parse")
+        return profile_call(parts[part], input_data, label=f"{label}_solve")
+    if memory:
+        from aoc_common.memory import memory_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = memory_call(parse_input, input_paths[mode], label=f"{label}_parse")
+        return memory_call(parts[part], input_data, label=f"{label}_solve")
+    if cache:
+        from aoc_common.answer_cache import cached_answer
+
+        return cached_answer(parts[part], load_input, input_paths[mode], part)
+    return parts[part](load_input(input_paths[mode]))
 
 
 def run_cli():
+    import argparse
+
+    from aoc_common.watchdog import LimitExceeded
+
     parser = argparse.ArgumentParser()
     parser.add_argument("mode", type=str, choices={"check", "solve"})
     parser.add_argument("part", type=int, choices={1, 2})
@@ -141,8 +167,61 @@ def run_cli():
         required=False,
         choices={"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"},
     )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        required=False,
+        default=DEFAULT_ENGINE,
+        choices=sorted(ENGINES),
+        help="which implementation of the part to run",
+    )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        action="store_true",
+        help="profile parsing and solving, writing .prof and .collapsed files to profiles/",
+    )
+    parser.add_argument(
+        "--memory",
+        required=False,
+        action="store_true",
+        help="report peak and net allocations, and lines behind the peak, for parsing and solving",
+    )
+    parser.add_argument(
+        "--no-cache",
+        required=False,
+        action="store_true",
+        help="recompute the answer even if it is cached (caching is always off with --log-level)",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        required=False,
+        help="kill the run after this many seconds, reporting a timeout",
+    )
+    parser.add_argument(
+        "--rss-limit",
+        type=float,
+        required=False,
+        help="kill the run if its resident memory passes this many MiB, reporting an oom",
+    )
     args = parser.parse_args()
-    print(problem_dispatch(args.mode, args.part, args.log_level))
+    try:
+        answer = problem_dispatch(
+            args.mode,
+            args.part,
+            args.log_level,
+            profile=args.profile,
+            memory=args.memory,
+            cache=not args.no_cache and args.log_level is None,
+            time_limit=args.time_limit,
+            rss_limit=args.rss_limit,
+            engine=args.engine,
+        )
+    except LimitExceeded as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(answer)
 
 
 if __name__ == "__main__":
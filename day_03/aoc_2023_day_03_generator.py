@@ -0,0 +1,46 @@
+# Advent of Code 2023
+# Day 03
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the width and height of the square schematic.
+PUZZLE_SIZE = 140
+
+SYMBOLS = "*#+$/@=%&-"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A square schematic of '.', part numbers of one to three digits, and symbols."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.1 and size - len(row) >= 4:
+                number = str(rng.randint(1, 999))
+                row.extend(number)
+                row.append(".")
+            elif roll < 0.15:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        rows.append("".join(row[:size]))
+    return "\n".join(rows) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
@@ -0,0 +1,55 @@
+# Advent of Code 2023
+# Day 04
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the number of scratchcards.
+PUZZLE_SIZE = 200
+
+WINNING_COUNT = 10
+MINE_COUNT = 25
+# Keeps the average card under one match, so copy counts don't grow exponentially.
+MATCH_CHANCE = 0.08
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Cards of 10 winning numbers and 25 numbers you have, all between 1 and 99.
+    A card never wins copies of more cards than there are after it.
+    """
+    rng = random.Random(seed)
+    width = len(str(size))
+    lines = []
+    for card in range(1, size + 1):
+        numbers = rng.sample(range(1, 100), WINNING_COUNT + MINE_COUNT)
+        winning = numbers[:WINNING_COUNT]
+        matches = min(sum(rng.random() < MATCH_CHANCE for _ in winning), size - card)
+        mine = (
+            rng.sample(winning, matches)
+            + numbers[WINNING_COUNT:][: MINE_COUNT - matches]
+        )
+        rng.shuffle(mine)
+        lines.append(
+            f"Card {card:>{width}}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in mine)
+        )
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
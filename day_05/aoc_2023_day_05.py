@@ -2,15 +2,20 @@
 # Day 05
 # Jim Kaufman
 
-import argparse
-import logging
 import sys
-import regex as re
+from functools import lru_cache
 from collections import defaultdict
-from dataclasses import dataclass
 
 from pathlib import Path
 
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common import parsing, progress, tracing
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+from aoc_common.input_cache import cached_parse
+
 PARENT_FOLDER = Path(__file__).parent
 BASE_FILE_NAME = Path(__file__).stem
 INPUT_FILE_NAME = f"{BASE_FILE_NAME}_input.txt"
@@ -20,14 +25,8 @@ INPUT_PATH = PARENT_FOLDER / INPUT_FILE_NAME
 SAMPLE_PATH = PARENT_FOLDER / SAMPLE_FILE_NAME
 
 
-logger = logging.getLogger("aoc_logger")
-log_handler = logging.StreamHandler()
-log_handler.setLevel("DEBUG")
-logger.addHandler(log_handler)
-
 # ---=== PROBLEM CODE BELOW ===---
 
-@dataclass
 class Garden:
     def __init__(self, line_number, data):
         self.line_number = line_number
@@ -45,15 +44,17 @@ class Garden:
         self.line_number += count
 
     def fill_dict(self, dictname: dict) -> dict:
+        block = []
         line = self.get_next_line()
         while not (line == '' or line is None):
-            nums = re.findall(r'\d+', line)
-            dest_map_start = int(nums[0])
-            source_map_start = int(nums[1])
-            count = int(nums[2])
-            dictname[(source_map_start, source_map_start+count-1)] = dest_map_start
+            block.append(line)
             line = self.get_next_line()
 
+        nums = parsing.ints(' '.join(block))
+        for i in range(0, len(nums), 3):
+            dest_map_start, source_map_start, count = nums[i:i+3]
+            dictname[(source_map_start, source_map_start+count-1)] = dest_map_start
+
         return dictname
 
 
@@ -93,8 +94,7 @@ def part_1(input_data: list):
         if line is None:
             break
         if line.startswith('seeds:'):
-            seeds = re.findall(r'\d+', line)
-            seeds = list(map(int, seeds))
+            seeds = parsing.ints(line)
             garden.increment_line()
         elif line.startswith('seed-to-soil map:'):
             seed_to_soil_map = garden.fill_dict(seed_to_soil_map)
@@ -144,8 +144,7 @@ def part_2(input_data: list):
         if line is None:
             break
         if line.startswith('seeds:'):
-            seeds = re.findall(r'\d+', line)
-            seeds = list(map(int, seeds))
+            seeds = parsing.ints(line)
             for i in range(0, len(seeds), 2):
                 seed_dict[seeds[i]] = seeds[i+1]
             garden.increment_line()
@@ -168,8 +167,18 @@ def part_2(input_data: list):
             garden.increment_line()
 
     lowest = []
+    trace_every = tracing.sample_every()
+    meter = progress.meter("day 05 part 2 seeds", total=sum(seed_dict.values()))
+    check_every = meter.check_every
+    done = 0
     for keys, value in seed_dict.items():
         for seed in range(keys, keys+value):
+            if check_every and (seed - keys) % check_every == 0:
+                meter.update(done + seed - keys)
+            if __debug__ and trace_every and (seed - keys) % trace_every == 0:
+                tracing.trace(
+                    "part 2: seed %d, %d of %d in range from %d", seed, seed - keys, value, keys
+                )
             soil = calculate_next_in_line(seed, seed_to_soil_map)
             fertilizer = calculate_next_in_line(soil, soil_to_fertilizer_map)
             water = calculate_next_in_line(fertilizer, fertilizer_to_water_map)
@@ -178,7 +187,9 @@ def part_2(input_data: list):
             humidity = calculate_next_in_line(temp, temp_to_humidity_map)
             location = calculate_next_in_line(humidity, humidity_to_location_map)
             lowest.append(location)
+        done += value
 
+    meter.finish(done)
     return min(lowest)
 
 
@@ -193,15 +204,70 @@ def run_direct():
 # ---=== PROBLEM CODE ABOVE ===---
 
 
-def problem_dispatch(mode: str, part: int, log_level: str = None):
+ENGINES = {"python": {1: part_1, 2: part_2}}
+
+
+@lru_cache(maxsize=None)
+def load_input(data_path: Path):
+    """
+    Parses the input at data_path once, and reuses the result for the life of the process.
+    Parsed inputs are also cached on disk, so later runs can skip parsing unchanged input.
+    """
+    return cached_parse(parse_input, data_path)
+
+
+def problem_dispatch(
+    mode: str,
+    part: int,
+    log_level: str = None,
+    profile: bool = False,
+    memory: bool = False,
+    cache: bool = False,
+    time_limit: float = None,
+    rss_limit: float = None,
+    engine: str = DEFAULT_ENGINE,
+):
     if log_level is not None:
-        logger.setLevel(log_level.upper())
-    parts = {1: part_1, 2: part_2}
-    inputs = {"check": parse_input(SAMPLE_PATH), "solve": parse_input(INPUT_PATH)}
-    return parts[part](inputs[mode])
+        tracing.install(log_level)
+    if time_limit is not None or rss_limit is not None:
+        from aoc_common.watchdog import Limits, run_limited
+
+        return run_limited(
+            problem_dispatch,
+            mode,
+            part,
+            profile=profile,
+            memory=memory,
+            cache=cache,
+            engine=engine,
+            limits=Limits(time_limit, rss_limit),
+        )
+    parts = solvers(ENGINES, engine)
+    input_paths = {"check": SAMPLE_PATH, "solve": INPUT_PATH}
+    if profile:
+        from aoc_common.profiling import profile_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = profile_call(parse_input, input_paths[mode], label=f"{label}_parse")
+        return profile_call(parts[part], input_data, label=f"{label}_solve")
+    if memory:
+        from aoc_common.memory import memory_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = memory_call(parse_input, input_paths[mode], label=f"{label}_parse")
+        return memory_call(parts[part], input_data, label=f"{label}_solve")
+    if cache:
+        from aoc_common.answer_cache import cached_answer
+
+        return cached_answer(parts[part], load_input, input_paths[mode], part)
+    return parts[part](load_input(input_paths[mode]))
 
 
 def run_cli():
+    import argparse
+
+    from aoc_common.watchdog import LimitExceeded
+
     parser = argparse.ArgumentParser()
     parser.add_argument("mode", type=str, choices={"check", "solve"})
     parser.add_argument("part", type=int, choices={1, 2})
@@ -211,8 +277,61 @@ def run_cli():
         required=False,
         choices={"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"},
     )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        required=False,
+        default=DEFAULT_ENGINE,
+        choices=sorted(ENGINES),
+        help="which implementation of the part to run",
+    )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        action="store_true",
+        help="profile parsing and solving, writing .prof and .collapsed files to profiles/",
+    )
+    parser.add_argument(
+        "--memory",
+        required=False,
+        action="store_true",
+        help="report peak and net allocations, and lines behind the peak, for parsing and solving",
+    )
+    parser.add_argument(
+        "--no-cache",
+        required=False,
+        action="store_true",
+        help="recompute the answer even if it is cached (caching is always off with --log-level)",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        required=False,
+        help="kill the run after this many seconds, reporting a timeout",
+    )
+    parser.add_argument(
+        "--rss-limit",
+        type=float,
+        required=False,
+        help="kill the run if its resident memory passes this many MiB, reporting an oom",
+    )
     args = parser.parse_args()
-    print(problem_dispatch(args.mode, args.part, args.log_level))
+    try:
+        answer = problem_dispatch(
+            args.mode,
+            args.part,
+            args.log_level,
+            profile=args.profile,
+            memory=args.memory,
+            cache=not args.no_cache and args.log_level is None,
+            time_limit=args.time_limit,
+            rss_limit=args.rss_limit,
+            engine=args.engine,
+        )
+    except LimitExceeded as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(answer)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+# Advent of Code 2023
+# Day 05
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the total width of the seed ranges, i.e. the number of seeds part 2 maps.
+PUZZLE_SIZE = 2_000_000_000
+
+SEED_RANGES = 10
+RANGES_PER_MAP = 30
+VALUE_LIMIT = 2**32
+MAP_NAMES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+
+def _split(total: int, parts: int, rng: random.Random) -> list:
+    """Splits total into parts positive widths (fewer if total is too small)."""
+    parts = max(1, min(parts, total))
+    cuts = sorted(rng.sample(range(1, total), parts - 1)) if parts > 1 else []
+    return [b - a for a, b in zip([0] + cuts, cuts + [total])]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    An almanac with ten seed ranges whose widths add up to size, and seven maps of
+    non-overlapping source ranges spread over the 32 bit value space.
+    """
+    rng = random.Random(seed)
+    seed_values = []
+    for width in _split(size, SEED_RANGES, rng):
+        seed_values.extend([rng.randrange(VALUE_LIMIT - width), width])
+    sections = ["seeds: " + " ".join(map(str, seed_values))]
+
+    for name in MAP_NAMES:
+        bounds = sorted(rng.sample(range(VALUE_LIMIT), 2 * RANGES_PER_MAP))
+        lines = [f"{name} map:"]
+        for start, end in zip(bounds[::2], bounds[1::2]):
+            length = end - start
+            lines.append(f"{rng.randrange(VALUE_LIMIT - length)} {start} {length}")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
@@ -0,0 +1,65 @@
+# Advent of Code 2023
+# Day 06
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the approximate length of the single part 2 race. Part 1's races are the
+# digit groups of that race, as in the puzzle.
+PUZZLE_SIZE = 50_000_000
+
+MAX_RACES = 4
+
+
+def _split_digits(number: int, groups: int, rng: random.Random) -> list:
+    """Splits the digits of number into groups, none of which starts with a zero."""
+    digits = str(number)
+    cut_points = [i for i in range(1, len(digits)) if digits[i] != "0"]
+    cuts = sorted(rng.sample(cut_points, min(groups - 1, len(cut_points))))
+    return [digits[a:b] for a, b in zip([0] + cuts, cuts + [len(digits)])]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Race times and record distances. Every race, including the combined part 2 race,
+    has a record that can be beaten.
+    """
+    rng = random.Random(seed)
+    while True:
+        total_time = rng.randint(max(2, size // 2), max(3, size))
+        times = _split_digits(total_time, MAX_RACES, rng)
+        distances = []
+        for time in map(int, times):
+            best = (time // 2) * (time - time // 2)
+            distances.append(
+                str(rng.randint(min(time, best - 1), best - 1)) if best > 0 else "0"
+            )
+        combined_time = int("".join(times))
+        combined_best = (combined_time // 2) * (combined_time - combined_time // 2)
+        if all(int(t) > 1 for t in times) and int("".join(distances)) < combined_best:
+            break
+    width = max(len(value) for value in times + distances) + 3
+    return (
+        "Time:    "
+        + "".join(f"{t:>{width}}" for t in times)
+        + "\n"
+        + "Distance:"
+        + "".join(f"{d:>{width}}" for d in distances)
+        + "\n"
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
@@ -2,14 +2,21 @@
 # Day 07
 # Jim Kaufman
 
-import argparse
-import logging
 import sys
+from functools import lru_cache
 from collections import Counter
 from collections import defaultdict
 
 from pathlib import Path
 
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+from aoc_common.input_cache import cached_parse
+from aoc_common.streaming import MappedLines
+
 PARENT_FOLDER = Path(__file__).parent
 BASE_FILE_NAME = Path(__file__).stem
 INPUT_FILE_NAME = f"{BASE_FILE_NAME}_input.txt"
@@ -19,12 +26,6 @@ INPUT_PATH = PARENT_FOLDER / INPUT_FILE_NAME
 SAMPLE_PATH = PARENT_FOLDER / SAMPLE_FILE_NAME
 
 
-logger = logging.getLogger("aoc_logger")
-log_handler = logging.StreamHandler()
-log_handler.setLevel("DEBUG")
-logger.addHandler(log_handler)
-
-
 # ---=== PROBLEM CODE BELOW ===---
 conversion_p1 = {
     'A': 'M',
@@ -67,6 +68,14 @@ def parse_input(data_path: Path) -> list:
         return [l.strip() for l in raw_input.readlines()]
 
 
+def stream_input(data_path: Path) -> MappedLines:
+    """
+    Streams the input one line at a time from a memory map, instead of building a list.
+    The parts only ever loop over their input, so they accept either form.
+    """
+    return MappedLines(data_path)
+
+
 def part_1(input_data: list):
     """Solution code for Part 1. Should return the solution."""
     five_bucket = []
@@ -105,28 +114,27 @@ def part_1(input_data: list):
 
     total = 0
     i = 1
-    while i <= len(input_data):
-        for a, b in one_bucket:
-            total += b*i
-            i += 1
-        for a,b in two_bucket:
-            total += b*i
-            i += 1
-        for a,b in two_pair_bucket:
-            total += b*i
-            i += 1
-        for a, b  in three_bucket:
-            total += b*i
-            i += 1
-        for a,b in full_bucket:
-            total += b*i
-            i += 1
-        for a,b in four_bucket:
-            total += b*i
-            i += 1
-        for a,b in five_bucket:
-            total += b*i
-            i += 1
+    for a, b in one_bucket:
+        total += b*i
+        i += 1
+    for a,b in two_bucket:
+        total += b*i
+        i += 1
+    for a,b in two_pair_bucket:
+        total += b*i
+        i += 1
+    for a, b  in three_bucket:
+        total += b*i
+        i += 1
+    for a,b in full_bucket:
+        total += b*i
+        i += 1
+    for a,b in four_bucket:
+        total += b*i
+        i += 1
+    for a,b in five_bucket:
+        total += b*i
+        i += 1
 
     return total
 
@@ -188,28 +196,27 @@ def part_2(input_data: list):
 
     total = 0
     i = 1
-    while i < len(input_data):
-        for a, b in one_bucket:
-            total += b*i
-            i += 1
-        for a,b in two_bucket:
-            total += b*i
-            i += 1
-        for a,b in two_pair_bucket:
-            total += b*i
-            i += 1
-        for a, b  in three_bucket:
-            total += b*i
-            i += 1
-        for a,b in full_bucket:
-            total += b*i
-            i += 1
-        for a,b in four_bucket:
-            total += b*i
-            i += 1
-        for a,b in five_bucket:
-            total += b*i
-            i += 1
+    for a, b in one_bucket:
+        total += b*i
+        i += 1
+    for a,b in two_bucket:
+        total += b*i
+        i += 1
+    for a,b in two_pair_bucket:
+        total += b*i
+        i += 1
+    for a, b  in three_bucket:
+        total += b*i
+        i += 1
+    for a,b in full_bucket:
+        total += b*i
+        i += 1
+    for a,b in four_bucket:
+        total += b*i
+        i += 1
+    for a,b in five_bucket:
+        total += b*i
+        i += 1
 
     return total
 
@@ -225,15 +232,77 @@ def run_direct():
 # ---=== PROBLEM CODE ABOVE ===---
 
 
-def problem_dispatch(mode: str, part: int, log_level: str = None):
+ENGINES = {"python": {1: part_1, 2: part_2}}
+
+
+@lru_cache(maxsize=None)
+def load_input(data_path: Path):
+    """
+    Parses the input at data_path once, and reuses the result for the life of the process.
+    Parsed inputs are also cached on disk, so later runs can skip parsing unchanged input.
+    """
+    return cached_parse(parse_input, data_path)
+
+
+def problem_dispatch(
+    mode: str,
+    part: int,
+    log_level: str = None,
+    stream: bool = False,
+    profile: bool = False,
+    memory: bool = False,
+    cache: bool = False,
+    time_limit: float = None,
+    rss_limit: float = None,
+    engine: str = DEFAULT_ENGINE,
+):
     if log_level is not None:
-        logger.setLevel(log_level.upper())
-    parts = {1: part_1, 2: part_2}
-    inputs = {"check": parse_input(SAMPLE_PATH), "solve": parse_input(INPUT_PATH)}
-    return parts[part](inputs[mode])
+        from aoc_common import tracing
+
+        tracing.install(log_level)
+    if time_limit is not None or rss_limit is not None:
+        from aoc_common.watchdog import Limits, run_limited
+
+        return run_limited(
+            problem_dispatch,
+            mode,
+            part,
+            stream=stream,
+            profile=profile,
+            memory=memory,
+            cache=cache,
+            engine=engine,
+            limits=Limits(time_limit, rss_limit),
+        )
+    parts = solvers(ENGINES, engine)
+    input_paths = {"check": SAMPLE_PATH, "solve": INPUT_PATH}
+    if profile:
+        from aoc_common.profiling import profile_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        loader = stream_input if stream else parse_input
+        input_data = profile_call(loader, input_paths[mode], label=f"{label}_parse")
+        return profile_call(parts[part], input_data, label=f"{label}_solve")
+    if memory:
+        from aoc_common.memory import memory_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        loader = stream_input if stream else parse_input
+        input_data = memory_call(loader, input_paths[mode], label=f"{label}_parse")
+        return memory_call(parts[part], input_data, label=f"{label}_solve")
+    loader = stream_input if stream else load_input
+    if cache:
+        from aoc_common.answer_cache import cached_answer
+
+        return cached_answer(parts[part], loader, input_paths[mode], part)
+    return parts[part](loader(input_paths[mode]))
 
 
 def run_cli():
+    import argparse
+
+    from aoc_common.watchdog import LimitExceeded
+
     parser = argparse.ArgumentParser()
     parser.add_argument("mode", type=str, choices={"check", "solve"})
     parser.add_argument("part", type=int, choices={1, 2})
@@ -243,8 +312,68 @@ def run_cli():
         required=False,
         choices={"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"},
     )
+    parser.add_argument(
+        "--stream",
+        required=False,
+        action="store_true",
+        help="read the input lazily through mmap, for inputs too large to load at once",
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        required=False,
+        default=DEFAULT_ENGINE,
+        choices=sorted(ENGINES),
+        help="which implementation of the part to run",
+    )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        action="store_true",
+        help="profile parsing and solving, writing .prof and .collapsed files to profiles/",
+    )
+    parser.add_argument(
+        "--memory",
+        required=False,
+        action="store_true",
+        help="report peak and net allocations, and lines behind the peak, for parsing and solving",
+    )
+    parser.add_argument(
+        "--no-cache",
+        required=False,
+        action="store_true",
+        help="recompute the answer even if it is cached (caching is always off with --log-level)",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        required=False,
+        help="kill the run after this many seconds, reporting a timeout",
+    )
+    parser.add_argument(
+        "--rss-limit",
+        type=float,
+        required=False,
+        help="kill the run if its resident memory passes this many MiB, reporting an oom",
+    )
     args = parser.parse_args()
-    print(problem_dispatch(args.mode, args.part, args.log_level))
+    try:
+        answer = problem_dispatch(
+            args.mode,
+            args.part,
+            args.log_level,
+            stream=args.stream,
+            profile=args.profile,
+            memory=args.memory,
+            cache=not args.no_cache and args.log_level is None,
+            time_limit=args.time_limit,
+            rss_limit=args.rss_limit,
+            engine=args.engine,
+        )
+    except LimitExceeded as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(answer)
 
 
 if __name__ == "__main__":
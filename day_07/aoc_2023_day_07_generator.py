@@ -0,0 +1,36 @@
+# Advent of Code 2023
+# Day 07
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the number of hands.
+PUZZLE_SIZE = 1000
+
+CARDS = "AKQJT98765432"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """Hands of five cards, each with a bid between 1 and 1000."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        hand = "".join(rng.choices(CARDS, k=5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
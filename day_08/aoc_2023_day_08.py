@@ -2,15 +2,21 @@
 # Day 08
 # Jim Kaufman
 
-import argparse
-import logging
 import sys
-import regex as re
+from functools import lru_cache
 from collections import defaultdict
 from math import lcm
 
 from pathlib import Path
 
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common import parsing, progress, tracing
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+from aoc_common.input_cache import cached_parse
+
 PARENT_FOLDER = Path(__file__).parent
 BASE_FILE_NAME = Path(__file__).stem
 INPUT_FILE_NAME = f"{BASE_FILE_NAME}_input.txt"
@@ -20,12 +26,6 @@ INPUT_PATH = PARENT_FOLDER / INPUT_FILE_NAME
 SAMPLE_PATH = PARENT_FOLDER / SAMPLE_FILE_NAME
 
 
-logger = logging.getLogger("aoc_logger")
-log_handler = logging.StreamHandler()
-log_handler.setLevel("DEBUG")
-logger.addHandler(log_handler)
-
-
 # ---=== PROBLEM CODE BELOW ===---
 
 results = []
@@ -47,11 +47,14 @@ def part_1(input_data: list):
     instructions = input_data[0]
     sequence = defaultdict()
     for line in input_data[2:]:
-        spline = re.findall(r'[A-Z]+', line)
+        spline = parsing.words(line)
         sequence[spline[0]] = (spline[1], spline[2])
 
     steps = 0
     k = 'AAA'
+    trace_every = tracing.sample_every()
+    meter = progress.meter("day 08 part 1 steps")
+    check_every = meter.check_every
     while k != 'ZZZ':
         for c in instructions[steps%len(instructions)]:
             if k == 'ZZZ':
@@ -59,7 +62,12 @@ def part_1(input_data: list):
             else:
                 k = sequence[k][0 if c=='L' else 1]
                 steps += 1
+                if check_every and steps % check_every == 0:
+                    meter.update(steps)
+                if __debug__ and trace_every and steps % trace_every == 0:
+                    tracing.trace("part 1: at %s after %d steps", k, steps)
 
+    meter.finish(steps)
     return steps
 
 
@@ -68,19 +76,29 @@ def part_2(input_data: list):
     instructions = input_data[0]
     sequence = defaultdict()
     for line in input_data[2:]:
-        spline = re.findall(r'[0-9A-Z]+', line)
+        spline = parsing.words(line, parsing.UPPER_TOKEN)
         sequence[spline[0]] = (spline[1], spline[2])
 
     keys = [k for k,v in sequence.items() if k.endswith('A')]
     steps = 0
     results = [0] * len(keys)
+    trace_every = tracing.sample_every()
+    meter = progress.meter("day 08 part 2 steps")
+    check_every = meter.check_every
     for i, pos in enumerate(keys):
         while not pos.endswith('Z'):
             results[i] += 1
             c = instructions[steps % len(instructions)]
             pos = sequence[pos][0 if c=='L' else 1]
             steps += 1
-
+            if check_every and steps % check_every == 0:
+                meter.update(steps)
+            if __debug__ and trace_every and results[i] % trace_every == 0:
+                tracing.trace(
+                    "part 2: ghost %d from %s at %s after %d steps", i, keys[i], pos, results[i]
+                )
+
+    meter.finish(steps)
     return lcm(*results)
 
 
@@ -94,15 +112,70 @@ def run_direct():
 # ---=== PROBLEM CODE ABOVE ===---
 
 
-def problem_dispatch(mode: str, part: int, log_level: str = None):
+ENGINES = {"python": {1: part_1, 2: part_2}}
+
+
+@lru_cache(maxsize=None)
+def load_input(data_path: Path):
+    """
+    Parses the input at data_path once, and reuses the result for the life of the process.
+    Parsed inputs are also cached on disk, so later runs can skip parsing unchanged input.
+    """
+    return cached_parse(parse_input, data_path)
+
+
+def problem_dispatch(
+    mode: str,
+    part: int,
+    log_level: str = None,
+    profile: bool = False,
+    memory: bool = False,
+    cache: bool = False,
+    time_limit: float = None,
+    rss_limit: float = None,
+    engine: str = DEFAULT_ENGINE,
+):
     if log_level is not None:
-        logger.setLevel(log_level.upper())
-    parts = {1: part_1, 2: part_2}
-    inputs = {"check": parse_input(SAMPLE_PATH), "solve": parse_input(INPUT_PATH)}
-    return parts[part](inputs[mode])
+        tracing.install(log_level)
+    if time_limit is not None or rss_limit is not None:
+        from aoc_common.watchdog import Limits, run_limited
+
+        return run_limited(
+            problem_dispatch,
+            mode,
+            part,
+            profile=profile,
+            memory=memory,
+            cache=cache,
+            engine=engine,
+            limits=Limits(time_limit, rss_limit),
+        )
+    parts = solvers(ENGINES, engine)
+    input_paths = {"check": SAMPLE_PATH, "solve": INPUT_PATH}
+    if profile:
+        from aoc_common.profiling import profile_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = profile_call(parse_input, input_paths[mode], label=f"{label}_parse")
+        return profile_call(parts[part], input_data, label=f"{label}_solve")
+    if memory:
+        from aoc_common.memory import memory_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = memory_call(parse_input, input_paths[mode], label=f"{label}_parse")
+        return memory_call(parts[part], input_data, label=f"{label}_solve")
+    if cache:
+        from aoc_common.answer_cache import cached_answer
+
+        return cached_answer(parts[part], load_input, input_paths[mode], part)
+    return parts[part](load_input(input_paths[mode]))
 
 
 def run_cli():
+    import argparse
+
+    from aoc_common.watchdog import LimitExceeded
+
     parser = argparse.ArgumentParser()
     parser.add_argument("mode", type=str, choices={"check", "solve"})
     parser.add_argument("part", type=int, choices={1, 2})
@@ -112,8 +185,61 @@ def run_cli():
         required=False,
         choices={"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"},
     )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        required=False,
+        default=DEFAULT_ENGINE,
+        choices=sorted(ENGINES),
+        help="which implementation of the part to run",
+    )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        action="store_true",
+        help="profile parsing and solving, writing .prof and .collapsed files to profiles/",
+    )
+    parser.add_argument(
+        "--memory",
+        required=False,
+        action="store_true",
+        help="report peak and net allocations, and lines behind the peak, for parsing and solving",
+    )
+    parser.add_argument(
+        "--no-cache",
+        required=False,
+        action="store_true",
+        help="recompute the answer even if it is cached (caching is always off with --log-level)",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        required=False,
+        help="kill the run after this many seconds, reporting a timeout",
+    )
+    parser.add_argument(
+        "--rss-limit",
+        type=float,
+        required=False,
+        help="kill the run if its resident memory passes this many MiB, reporting an oom",
+    )
     args = parser.parse_args()
-    print(problem_dispatch(args.mode, args.part, args.log_level))
+    try:
+        answer = problem_dispatch(
+            args.mode,
+            args.part,
+            args.log_level,
+            profile=args.profile,
+            memory=args.memory,
+            cache=not args.no_cache and args.log_level is None,
+            time_limit=args.time_limit,
+            rss_limit=args.rss_limit,
+            engine=args.engine,
+        )
+    except LimitExceeded as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(answer)
 
 
 if __name__ == "__main__":
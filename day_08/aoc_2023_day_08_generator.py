@@ -0,0 +1,75 @@
+# Advent of Code 2023
+# Day 08
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the number of nodes in the network.
+PUZZLE_SIZE = 750
+
+GHOSTS = 6
+INSTRUCTION_LENGTH = 280
+LETTERS = "BCDEFGHIJKLMNOPQRSTUVWXY"
+
+
+def _names(count: int, rng: random.Random) -> list:
+    """Unique upper case node names that end in neither A nor Z."""
+    length = 3
+    while len(LETTERS) ** length < 2 * count + 1:
+        length += 1
+    names = set()
+    while len(names) < count:
+        names.add("".join(rng.choices(LETTERS, k=length)))
+    return sorted(names, key=lambda _: rng.random())
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Left/right instructions and a network of ghost loops. Each loop runs from a node
+    ending in A to a node ending in Z and back round, and the first loop runs AAA to
+    ZZZ. Every step on a loop offers a left and a right node, so the instructions pick
+    the path, but each loop takes the same number of steps whichever way it goes.
+    """
+    rng = random.Random(seed)
+    instructions = "".join(rng.choices("LR", k=INSTRUCTION_LENGTH))
+    ghosts = max(1, min(GHOSTS, (size - 2) // 6))
+    loop_length = max(3, (size - 2 * ghosts) // (2 * ghosts))
+    inner = iter(_names(2 * ghosts * loop_length, rng))
+    network = {}
+    for ghost in range(ghosts):
+        prefix = LETTERS[ghost % len(LETTERS)] * 2
+        start, end = ("AAA", "ZZZ") if ghost == 0 else (f"{prefix}A", f"{prefix}Z")
+        lefts = [next(inner) for _ in range(loop_length)]
+        rights = [next(inner) for _ in range(loop_length)]
+        network[start] = (lefts[0], rights[0])
+        for step in range(loop_length - 1):
+            network[lefts[step]] = (lefts[step + 1], rights[step + 1])
+            network[rights[step]] = (lefts[step + 1], rights[step + 1])
+        network[lefts[-1]] = (end, end)
+        network[rights[-1]] = (end, end)
+        network[end] = (lefts[0], rights[0])
+    for name in _names(max(0, size - len(network)), rng):
+        if name not in network:
+            network[name] = (name, name)
+    nodes = list(network.items())
+    rng.shuffle(nodes)
+    lines = [instructions, ""] + [
+        f"{node} = ({left}, {right})" for node, (left, right) in nodes
+    ]
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
@@ -0,0 +1,44 @@
+# Advent of Code 2023
+# Day 09
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the number of sequences.
+PUZZLE_SIZE = 200
+
+SEQUENCE_LENGTH = 21
+MAX_DEGREE = 6
+
+
+def generate(size: int, seed: int = 0, length: int = SEQUENCE_LENGTH) -> str:
+    """
+    Sequences of length integers, each the values of a random polynomial of degree at
+    most six, so repeated differences always reach all zeros.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        degree = rng.randint(1, min(MAX_DEGREE, length - 1))
+        coefficients = [rng.randint(-5, 5) for _ in range(degree + 1)]
+        values = [
+            sum(c * x**i for i, c in enumerate(coefficients)) for x in range(length)
+        ]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
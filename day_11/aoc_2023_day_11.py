@@ -2,13 +2,19 @@
 # Day 11
 # Jim Kaufman
 
-import argparse
-import logging
 import sys
-from itertools import combinations
+from functools import lru_cache
 
 from pathlib import Path
 
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+from aoc_common.grid import Grid
+from aoc_common.input_cache import cached_parse
+
 PARENT_FOLDER = Path(__file__).parent
 BASE_FILE_NAME = Path(__file__).stem
 INPUT_FILE_NAME = f"{BASE_FILE_NAME}_input.txt"
@@ -18,78 +24,52 @@ INPUT_PATH = PARENT_FOLDER / INPUT_FILE_NAME
 SAMPLE_PATH = PARENT_FOLDER / SAMPLE_FILE_NAME
 
 
-logger = logging.getLogger("aoc_logger")
-log_handler = logging.StreamHandler()
-log_handler.setLevel("DEBUG")
-logger.addHandler(log_handler)
-
-
 # ---=== PROBLEM CODE BELOW ===---
 
 
-man_dist = lambda point1, point2: abs(point1[0] - point2[0]) + abs(point1[1] - point2[1])
+def expanded_coordinates(grid: Grid, scale: int) -> tuple[list[int], list[int]]:
+    """
+    The row and column of every galaxy, after each empty row and column grows to scale
+    rows or columns.
+    """
+    galaxies = grid.coordinates("#")
+    empty_rows = grid.rows_all(".").cumsum()
+    empty_cols = grid.columns_all(".").cumsum()
+    rows = galaxies[:, 0] + (scale - 1) * empty_rows[galaxies[:, 0]]
+    cols = galaxies[:, 1] + (scale - 1) * empty_cols[galaxies[:, 1]]
+    return rows.tolist(), cols.tolist()
 
-def insert_string_in_column(matrix, column_indices, string_to_insert):
-    j = 0
-    while j < len(column_indices):
-        current_index = column_indices[j]
-        for i in range(len(matrix)):
-            matrix[i] = matrix[i][:current_index+j] + string_to_insert + matrix[i][current_index +j + len(string_to_insert)-1:]
-        j += 1
-def insert_rows(matrix, insert_indices, row_value):
-    i = 0
-    while i < len(insert_indices):
-        current_index = insert_indices[i]
-        matrix.insert(current_index + i, row_value)
-        i += 1
 
-def parse_input(data_path: Path) -> list:
+def pairwise_distance_sum(values: list[int]) -> int:
     """
-    Reads and formats input.
-    Should return the input data in a format where it is ready to be worked on.
+    The sum of |a - b| over every pair of values. Once sorted, the i-th value is the larger
+    one in i pairs and the smaller one in n - 1 - i pairs.
     """
-    with open(data_path, "r") as raw_input:
-        return [l.strip() for l in raw_input.readlines()]
+    n = len(values)
+    return sum(value * (2 * i - n + 1) for i, value in enumerate(sorted(values)))
 
 
-def part_1(input_data: list):
-    """Solution code for Part 1. Should return the solution."""
-    empty_rows = [r for r, row in enumerate(input_data) if all(ch == '.' for ch in row)]
-    empty_cols = [c for c, col in enumerate(zip(*input_data)) if all(ch == '.' for ch in col)]
+def total_distance(grid: Grid, scale: int) -> int:
+    """The sum of the Manhattan distances between every pair of galaxies."""
+    rows, cols = expanded_coordinates(grid, scale)
+    return pairwise_distance_sum(rows) + pairwise_distance_sum(cols)
 
-    insert_rows(input_data, empty_rows, '.' * len(input_data[0]))
-    insert_string_in_column(input_data, empty_cols, '.')
 
-    galaxies = [(r, c) for r, row in enumerate(input_data) for c, col in enumerate(row) if input_data[r][c] == '#']
-    combs = list(combinations(galaxies, 2))
+def parse_input(data_path: Path) -> Grid:
+    """
+    Reads and formats input.
+    Should return the input data in a format where it is ready to be worked on.
+    """
+    return Grid.from_file(data_path)
 
-    total = 0
-    for combo in combs:
-        r1, c1 = combo[0]
-        r2, c2 = combo[1]
-        dist = man_dist((r1, c1), (r2, c2))
-        total += dist
 
-    return total
+def part_1(input_data: Grid):
+    """Solution code for Part 1. Should return the solution."""
+    return total_distance(input_data, 2)
 
-def part_2(input_data: list):
+def part_2(input_data: Grid):
     """Solution code for Part 2. Should return the solution."""
-    empty_rows = [r for r, row in enumerate(input_data) if all(ch == '.' for ch in row)]
-    empty_cols = [c for c, col in enumerate(zip(*input_data)) if all(ch == '.' for ch in col)]
-    galaxies = [(r, c) for r, row in enumerate(input_data) for c, col in enumerate(row) if input_data[r][c] == '#']
-    combs = list(combinations(galaxies, 2))
-
-    total = 0
-    scale = 1_000_000
-    for combo in combs:
-        r1, c1 = combo[0]
-        r2, c2 = combo[1]
-        for r in range(r1, r2):
-            total += scale if r in empty_rows else 1
-        for c in range(min(c1, c2), max(c1, c2)):
-            total += scale if c in empty_cols else 1
-
-    return total
+    return total_distance(input_data, 1_000_000)
 
 def run_direct():
     """
@@ -102,15 +82,72 @@ def run_direct():
 # ---=== PROBLEM CODE ABOVE ===---
 
 
-def problem_dispatch(mode: str, part: int, log_level: str = None):
+ENGINES = {"python": {1: part_1, 2: part_2}}
+
+
+@lru_cache(maxsize=None)
+def load_input(data_path: Path):
+    """
+    Parses the input at data_path once, and reuses the result for the life of the process.
+    Parsed inputs are also cached on disk, so later runs can skip parsing unchanged input.
+    """
+    return cached_parse(parse_input, data_path)
+
+
+def problem_dispatch(
+    mode: str,
+    part: int,
+    log_level: str = None,
+    profile: bool = False,
+    memory: bool = False,
+    cache: bool = False,
+    time_limit: float = None,
+    rss_limit: float = None,
+    engine: str = DEFAULT_ENGINE,
+):
     if log_level is not None:
-        logger.setLevel(log_level.upper())
-    parts = {1: part_1, 2: part_2}
-    inputs = {"check": parse_input(SAMPLE_PATH), "solve": parse_input(INPUT_PATH)}
-    return parts[part](inputs[mode])
+        from aoc_common import tracing
+
+        tracing.install(log_level)
+    if time_limit is not None or rss_limit is not None:
+        from aoc_common.watchdog import Limits, run_limited
+
+        return run_limited(
+            problem_dispatch,
+            mode,
+            part,
+            profile=profile,
+            memory=memory,
+            cache=cache,
+            engine=engine,
+            limits=Limits(time_limit, rss_limit),
+        )
+    parts = solvers(ENGINES, engine)
+    input_paths = {"check": SAMPLE_PATH, "solve": INPUT_PATH}
+    if profile:
+        from aoc_common.profiling import profile_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = profile_call(parse_input, input_paths[mode], label=f"{label}_parse")
+        return profile_call(parts[part], input_data, label=f"{label}_solve")
+    if memory:
+        from aoc_common.memory import memory_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = memory_call(parse_input, input_paths[mode], label=f"{label}_parse")
+        return memory_call(parts[part], input_data, label=f"{label}_solve")
+    if cache:
+        from aoc_common.answer_cache import cached_answer
+
+        return cached_answer(parts[part], load_input, input_paths[mode], part)
+    return parts[part](load_input(input_paths[mode]))
 
 
 def run_cli():
+    import argparse
+
+    from aoc_common.watchdog import LimitExceeded
+
     parser = argparse.ArgumentParser()
     parser.add_argument("mode", type=str, choices={"check", "solve"})
     parser.add_argument("part", type=int, choices={1, 2})
@@ -120,8 +157,61 @@ def run_cli():
         required=False,
         choices={"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"},
     )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        required=False,
+        default=DEFAULT_ENGINE,
+        choices=sorted(ENGINES),
+        help="which implementation of the part to run",
+    )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        action="store_true",
+        help="profile parsing and solving, writing .prof and .collapsed files to profiles/",
+    )
+    parser.add_argument(
+        "--memory",
+        required=False,
+        action="store_true",
+        help="report peak and net allocations, and lines behind the peak, for parsing and solving",
+    )
+    parser.add_argument(
+        "--no-cache",
+        required=False,
+        action="store_true",
+        help="recompute the answer even if it is cached (caching is always off with --log-level)",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        required=False,
+        help="kill the run after this many seconds, reporting a timeout",
+    )
+    parser.add_argument(
+        "--rss-limit",
+        type=float,
+        required=False,
+        help="kill the run if its resident memory passes this many MiB, reporting an oom",
+    )
     args = parser.parse_args()
-    print(problem_dispatch(args.mode, args.part, args.log_level))
+    try:
+        answer = problem_dispatch(
+            args.mode,
+            args.part,
+            args.log_level,
+            profile=args.profile,
+            memory=args.memory,
+            cache=not args.no_cache and args.log_level is None,
+            time_limit=args.time_limit,
+            rss_limit=args.rss_limit,
+            engine=args.engine,
+        )
+    except LimitExceeded as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(answer)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+# Advent of Code 2023
+# Day 11
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the width and height of the square image.
+PUZZLE_SIZE = 140
+
+GALAXY_DENSITY = 0.02
+EMPTY_LINE_CHANCE = 0.05
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    A square image of '.' and '#' galaxies, with some rows and columns left empty so
+    they expand. There are always at least two galaxies.
+    """
+    rng = random.Random(seed)
+    empty_rows = {r for r in range(size) if rng.random() < EMPTY_LINE_CHANCE}
+    empty_cols = {c for c in range(size) if rng.random() < EMPTY_LINE_CHANCE}
+    image = [["."] * size for _ in range(size)]
+    for r in range(size):
+        for c in range(size):
+            if (
+                r not in empty_rows
+                and c not in empty_cols
+                and rng.random() < GALAXY_DENSITY
+            ):
+                image[r][c] = "#"
+    image[0][0] = "#"
+    image[-1][-1] = "#"
+    return "\n".join("".join(row) for row in image) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
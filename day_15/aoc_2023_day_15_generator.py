@@ -0,0 +1,42 @@
+# Advent of Code 2023
+# Day 15
+# Jim Kaufman
+#
+# Synthetic input generator. Writes inputs in the format parse_input expects, at any
+# size.
+
+import random
+import sys
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.generation import generator_cli
+
+# Size is the number of steps in the initialization sequence.
+PUZZLE_SIZE = 4000
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """A single line of comma separated steps, each 'label=N' or 'label-'."""
+    rng = random.Random(seed)
+    labels = [
+        "".join(rng.choices(LETTERS, k=rng.randint(2, 6)))
+        for _ in range(max(1, size // 8))
+    ]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(
+            f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        )
+    return ",".join(steps) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(generator_cli(generate, PUZZLE_SIZE))
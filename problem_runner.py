@@ -0,0 +1,1414 @@
+import argparse
+import contextlib
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+import tomli
+
+from pathlib import Path
+from types import ModuleType
+
+# Only what a plain check or solve needs is imported here, to keep the runner's own
+# startup short; each command imports the rest of what it uses.
+from aoc_common import solver_daemon, watchdog
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+
+PARENT_FOLDER = Path(__file__).parent
+CONFIG_FILE = PARENT_FOLDER / "config.toml"
+DAEMON_SOCKET = PARENT_FOLDER / "solver.sock"
+DAEMON_TIMEOUT_S = 600
+DAEMON_GRACE_S = 5
+
+DEFAULT_WARMUP = 1
+DEFAULT_REPEAT = 5
+DEFAULT_ALPHA = 0.05
+DEFAULT_THRESHOLD = 0.05
+BATCH_FIELDS = ("file", "part", "status", "answer", "parse_time", "solve_time", "error")
+
+
+def get_config(config_path: Path = None) -> dict:
+    with open(config_path, "rb") as config_file:
+        config = tomli.load(config_file)
+    return config
+
+
+def problem_file_path(day: int, year: int) -> Path:
+    """Returns the path to the problem file for a given day."""
+    day_str = "{:0>2d}".format(day)
+    return PARENT_FOLDER / f"day_{day_str}" / f"aoc_{year}_day_{day_str}.py"
+
+
+def load_module(module_path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_problem_module(day: int, year: int) -> ModuleType:
+    """Imports the problem file for a given day, so it can be run in this process."""
+    return load_module(problem_file_path(day, year))
+
+
+def load_generator_module(day: int, year: int) -> ModuleType:
+    """Imports the synthetic input generator for a given day."""
+    module_path = problem_file_path(day, year)
+    return load_module(module_path.with_name(f"{module_path.stem}_generator.py"))
+
+
+def part_limits(config: dict, day: int, part: int = None) -> watchdog.Limits:
+    """
+    The watchdog limits for one run of a part from config.toml [limits], with any
+    per-day and per-part overrides applied. Without a part, only the day's overrides are
+    applied.
+    """
+    limits_config = config.get("limits", {})
+    overrides = limits_config.get("overrides", {})
+    settings = {k: v for k, v in limits_config.items() if k != "overrides"}
+    settings.update(overrides.get(str(day), {}))
+    if part is not None:
+        settings.update(overrides.get(f"{day}.{part}", {}))
+    return watchdog.Limits(**settings)
+
+
+def phase_limits(config: dict, day: int) -> dict:
+    """The watchdog limits for each benchmark phase of a day."""
+    return {
+        "parse": part_limits(config, day),
+        "part_1": part_limits(config, day, 1),
+        "part_2": part_limits(config, day, 2),
+    }
+
+
+def time_call(func, *args, warmup: int = 0, repeat: int = 1) -> list:
+    """
+    Calls func(*args) warmup times untimed, then repeat times timed. Returns the timed
+    samples.
+    """
+    for _ in range(warmup):
+        func(*args)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def percentile(samples: list, pct: float) -> float:
+    """Nearest-rank percentile of samples."""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(samples: list) -> dict:
+    """Summary statistics, in seconds, for a list of timing samples."""
+    import statistics
+
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 95),
+        "stddev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def engine_phases(module: ModuleType, engines: list = None) -> list:
+    """
+    The phases to time for a problem module: parsing, then each part with each engine.
+    Parts run by engines other than the default are named like "part_1:numpy". Engines
+    the module doesn't register are left out, and "all" stands for every engine it does.
+    """
+    registered = list(module.ENGINES)
+    if engines is None:
+        engines = [DEFAULT_ENGINE]
+    elif "all" in engines:
+        engines = registered
+    phases = ["parse"]
+    for part in (1, 2):
+        for engine in engines:
+            if engine == DEFAULT_ENGINE:
+                phases.append(f"part_{part}")
+            elif engine in registered:
+                phases.append(f"part_{part}:{engine}")
+    return phases
+
+
+def phase_solver(module: ModuleType, phase: str):
+    """The solver a phase name like "part_1" or "part_1:numpy" stands for."""
+    part, _, engine = phase.partition(":")
+    return solvers(module.ENGINES, engine or DEFAULT_ENGINE)[
+        int(part.removeprefix("part_"))
+    ]
+
+
+def benchmark_phase(
+    module: ModuleType,
+    phase: str,
+    warmup: int,
+    repeat: int,
+    limits: watchdog.Limits = None,
+    input_data=None,
+) -> list:
+    """
+    Times one phase ("parse", "part_1", "part_2", or a part with another engine, like
+    "part_1:numpy") of a problem module, using the full input. Solve phases get a
+    freshly parsed input, so a part that modifies its input can't skew another, and
+    every engine is timed on an identical parse. A solve phase given input_data (like an
+    input attached from shared memory) uses that instead. With limits, the phase runs
+    under a watchdog, whose time limit is scaled by the number of runs the phase makes;
+    going over raises watchdog.LimitExceeded.
+    """
+    if limits:
+        runs = warmup + repeat + (phase != "parse")
+        time_s = None if limits.time_s is None else limits.time_s * runs
+        run_limits = watchdog.Limits(time_s, limits.rss_mib)
+        return watchdog.run_limited(
+            benchmark_phase,
+            module,
+            phase,
+            warmup,
+            repeat,
+            input_data=input_data,
+            limits=run_limits,
+        )
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if phase == "parse":
+            return time_call(
+                module.parse_input, module.INPUT_PATH, warmup=warmup, repeat=repeat
+            )
+        if input_data is None:
+            input_data = module.parse_input(module.INPUT_PATH)
+        return time_call(
+            phase_solver(module, phase), input_data, warmup=warmup, repeat=repeat
+        )
+
+
+def phase_peak(module: ModuleType, phase: str, limits: watchdog.Limits = None) -> int:
+    """
+    The peak bytes allocated by one run of a phase, on the full input. Measured in a run
+    of its own, so tracemalloc's overhead stays out of the timings.
+    """
+    from aoc_common.memory import measure_memory
+
+    if limits:
+        return watchdog.run_limited(phase_peak, module, phase, limits=limits)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if phase == "parse":
+            _, report = measure_memory(module.parse_input, module.INPUT_PATH, top=0)
+        else:
+            input_data = module.parse_input(module.INPUT_PATH)
+            _, report = measure_memory(phase_solver(module, phase), input_data, top=0)
+    return report.peak
+
+
+def benchmark_problem(
+    module: ModuleType,
+    warmup: int,
+    repeat: int,
+    limits: dict = None,
+    engines: list = None,
+) -> dict:
+    """
+    Times parse_input, and part_1 and part_2 with each of engines, separately, each
+    under its limits from the limits dict, if given. Returns a dict of phase name to
+    timing samples, or to the exception that phase raised.
+    """
+    limits = limits or {}
+    results = {}
+    for phase in engine_phases(module, engines):
+        part_limits = limits.get(phase.partition(":")[0])
+        try:
+            results[phase] = benchmark_phase(module, phase, warmup, repeat, part_limits)
+        except Exception as exc:
+            results[phase] = exc
+            if phase == "parse":
+                break
+    return results
+
+
+def _benchmark_task(
+    day: int,
+    year: int,
+    phase: str,
+    warmup: int,
+    repeat: int,
+    limits: watchdog.Limits = None,
+    shared: "shared_input.SharedInput" = None,
+) -> list:
+    """
+    Process pool entry point. Imports a day's module in the worker and times one phase,
+    on the day's input attached from shared memory, if it was published.
+    """
+    from aoc_common import shared_input
+
+    input_data = None
+    if shared is not None and phase != "parse":
+        input_data = shared_input.attach(shared)
+    module = load_problem_module(day, year)
+    return benchmark_phase(module, phase, warmup, repeat, limits, input_data)
+
+
+def _publish_input(
+    stack: contextlib.ExitStack, module: ModuleType, limits: watchdog.Limits = None
+) -> "shared_input.SharedInput":
+    """
+    Parses a day's full input once, under its parse limits, and publishes it in shared
+    memory until stack closes. Returns None if parsing or publishing fails, so workers
+    fall back to parsing for themselves.
+    """
+    from aoc_common import shared_input
+
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            input_data = watchdog.run_limited(
+                module.parse_input,
+                module.INPUT_PATH,
+                limits=limits or watchdog.Limits(),
+            )
+        return stack.enter_context(shared_input.published(input_data))
+    except Exception:
+        return None
+
+
+def benchmark_parallel(
+    problems: list,
+    year: int,
+    warmup: int,
+    repeat: int,
+    jobs: int,
+    limits: dict = None,
+    phases: dict = None,
+    share_inputs: bool = True,
+):
+    """
+    Times every (day, phase) pair as an independent task on a pool of worker processes.
+    limits maps each day to its phase limits, as given by phase_limits, and phases maps
+    each day to the phases to time (default: parse and both parts with the default
+    engine). With share_inputs, each day's input is parsed once here and published in
+    shared memory, and solve tasks attach to it rather than parsing it again. Yields
+    (day, phase, samples or exception) in a stable day/phase order as results arrive. A
+    failing or crashed task is reported in place without affecting the others.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    limits = limits or {}
+    phases = phases or {}
+    with contextlib.ExitStack() as stack, ProcessPoolExecutor(max_workers=jobs) as pool:
+        shared = {}
+        if share_inputs:
+            for day in problems:
+                module = load_problem_module(day, year)
+                shared[day] = _publish_input(
+                    stack, module, limits.get(day, {}).get("parse")
+                )
+        futures = {
+            (day, phase): pool.submit(
+                _benchmark_task,
+                day,
+                year,
+                phase,
+                warmup,
+                repeat,
+                limits.get(day, {}).get(phase.partition(":")[0]),
+                shared.get(day),
+            )
+            for day in problems
+            for phase in phases.get(day, ("parse", "part_1", "part_2"))
+        }
+        for (day, phase), future in futures.items():
+            try:
+                yield day, phase, future.result()
+            except Exception as exc:
+                yield day, phase, exc
+
+
+def _format_phase(day: int, phase: str, samples, width: int = 7) -> str:
+    if isinstance(samples, watchdog.LimitExceeded):
+        return (
+            f"Day {day:>2} {phase:<{width}} {samples.status}"
+            f" after {samples.elapsed:.1f} s"
+            f" (peak {samples.peak_rss_mib:.0f} MiB)"
+        )
+    if isinstance(samples, Exception):
+        return (
+            f"Day {day:>2} {phase:<{width}} failed: {type(samples).__name__}: {samples}"
+        )
+    stats = summarize(samples)
+    columns = "".join(
+        f"{stats[k] * 1000:>12.3f}" for k in ("min", "median", "p95", "stddev")
+    )
+    return f"Day {day:>2} {phase:<{width}}{columns}"
+
+
+def benchmark(
+    config: dict,
+    warmup: int = None,
+    repeat: int = None,
+    days: list = None,
+    jobs: int = None,
+    save: bool = True,
+    engines: list = None,
+    export: Path = None,
+    export_format: str = None,
+    share_inputs: bool = True,
+) -> dict:
+    """
+    Times every problem registered as complete in the config file. Each problem module
+    is imported once, and its parse and solve phases are timed separately over several
+    repeats, after some untimed warmup runs. Parts are timed with each of engines
+    (default: only the default engine) that a day registers, side by side. With jobs >
+    1, phases are spread across that many worker processes, which attach to each day's
+    parsed input in shared memory unless share_inputs is False. Each phase runs under
+    the watchdog limits from config.toml [limits], if any. Unless save is False, the run
+    is appended to the benchmark history. With export, it's also written there as JSON
+    or CSV, with the peak memory of each phase measured in one extra run. A phase whose
+    peak can't be measured is exported without one. The export format is checked before
+    anything runs. Returns {day: {phase: samples or exception}}.
+    """
+    from aoc_common import history, timings
+
+    if export is not None:
+        export_format = timings.output_format(export, export_format)
+    bench_config = config["benchmark"]
+    problems = days or bench_config["registered_problems"]
+    year = config["setup"]["year"]
+    warmup = bench_config.get("warmup", DEFAULT_WARMUP) if warmup is None else warmup
+    repeat = bench_config.get("repeat", DEFAULT_REPEAT) if repeat is None else repeat
+
+    start_time = time.perf_counter()
+    modules = {day: load_problem_module(day, year) for day in problems}
+    phases = {day: engine_phases(modules[day], engines) for day in problems}
+    width = max(len(phase) for day_phases in phases.values() for phase in day_phases)
+    print(f"\nAdvent of Code {year} Benchmark (warmup {warmup}, repeat {repeat})\n")
+    header = "".join(f"{h + ' (ms)':>12}" for h in ("min", "median", "p95", "stddev"))
+    print(f"{'':{width + 7}}" + header)
+    limits = {day: phase_limits(config, day) for day in problems}
+    results = {}
+    if jobs is not None and jobs > 1:
+        parallel = benchmark_parallel(
+            problems, year, warmup, repeat, jobs, limits, phases, share_inputs
+        )
+        for day, phase, samples in parallel:
+            results.setdefault(day, {})[phase] = samples
+            print(_format_phase(day, phase, samples, width))
+    else:
+        for day in problems:
+            results[day] = benchmark_problem(
+                modules[day], warmup, repeat, limits[day], engines
+            )
+            for phase, samples in results[day].items():
+                print(_format_phase(day, phase, samples, width))
+    print(f"\nTotal: {'{:.3f}'.format(time.perf_counter() - start_time)}")
+    record = history.build_record(results, warmup, repeat)
+    if save:
+        history.append_run(record)
+        revision = record["revision"][:12]
+        print(f"Saved as revision {revision} in {history.HISTORY_FILE.name}")
+    if export is not None:
+        peaks = {}
+        for day, day_results in results.items():
+            for phase, samples in day_results.items():
+                if not isinstance(samples, list):
+                    continue
+                day_limits = limits[day].get(phase.partition(":")[0])
+                try:
+                    peak = phase_peak(modules[day], phase, day_limits)
+                except Exception as exc:
+                    print(
+                        f"Day {day:>2} {phase}: no peak memory,"
+                        f" {type(exc).__name__}: {exc}"
+                    )
+                    peak = None
+                peaks.setdefault(day, {})[phase] = peak
+        timings.write_timings(record, peaks, export, export_format)
+        print(f"Exported timings to {export}")
+    return results
+
+
+def compare(
+    config: dict,
+    baseline_revision: str,
+    candidate_revision: str = None,
+    alpha: float = None,
+    threshold: float = None,
+) -> bool:
+    """
+    Compares the latest benchmark of candidate_revision (default: the latest benchmark)
+    against the latest benchmark of baseline_revision, on this machine and Python
+    version. Prints a row per day and phase, and returns False if any phase regressed.
+    """
+    import platform
+
+    from aoc_common import history
+
+    compare_config = config.get("compare", {})
+    alpha = compare_config.get("alpha", DEFAULT_ALPHA) if alpha is None else alpha
+    threshold = (
+        compare_config.get("threshold", DEFAULT_THRESHOLD)
+        if threshold is None
+        else threshold
+    )
+    runs = history.load_runs()
+    machine = history.machine_fingerprint()
+    python = platform.python_version()
+    candidate = history.find_run(runs, candidate_revision, machine, python)
+    earlier_runs = [run for run in runs if run is not candidate]
+    baseline = history.find_run(earlier_runs, baseline_revision, machine, python)
+    if candidate is None or baseline is None:
+        missing = (
+            baseline_revision if baseline is None else candidate_revision or "latest"
+        )
+        raise SystemExit(
+            f"No benchmark of revision {missing} on this machine and Python version."
+        )
+
+    print(f"\nBaseline  {baseline['revision'][:12]}  ({baseline['timestamp']})")
+    print(f"Candidate {candidate['revision'][:12]}  ({candidate['timestamp']})\n")
+    rows = history.compare_runs(baseline, candidate, alpha, threshold)
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"Day {row['day']:>2} {row['phase']:<7}"
+            f"{row['baseline'] * 1000:>12.3f}{row['candidate'] * 1000:>12.3f} ms"
+            f"{row['ratio']:>8.2f}x  p={row['p_value']:.3f}{flag}"
+        )
+    return not any(row["regression"] for row in rows)
+
+
+def timing_report(
+    baseline_path: Path,
+    candidate_path: Path,
+    confidence: float = 0.95,
+    resamples: int = 2000,
+) -> list:
+    """
+    Compares two timing exports, and prints a row per day and phase timed in both: the
+    median of each, the candidate's speedup (above 1 is faster) and its bootstrap
+    confidence interval. A change is only called faster or slower when the interval
+    excludes 1. Returns the rows.
+    """
+    import statistics
+
+    from aoc_common import history, timings
+
+    baseline = timings.load_timings(baseline_path)
+    candidate = timings.load_timings(candidate_path)
+    for label, run in (("Baseline ", baseline), ("Candidate", candidate)):
+        print(
+            f"{label} {run['revision'][:12]}  Python {run['python']}"
+            f"  ({run['timestamp']})"
+        )
+    if baseline["machine"] != candidate["machine"]:
+        print("Warning: the two runs were made on different machines")
+    if baseline["python"] != candidate["python"]:
+        print("Warning: the two runs used different Python versions")
+
+    width = max([len(phase) for _, phase in candidate["timings"]] + [5])
+    print(
+        f"\n{'':{width + 7}}{'base (ms)':>12}{'cand (ms)':>12}{'speedup':>10}"
+        f"  {int(confidence * 100)}% interval"
+    )
+    rows = []
+    for key in sorted(candidate["timings"], key=lambda key: (key[0], key[1])):
+        base_samples = baseline["timings"].get(key, {}).get("samples")
+        samples = candidate["timings"][key]["samples"]
+        if not base_samples or not samples:
+            continue
+        speedup, low, high = history.bootstrap_speedup(
+            base_samples, samples, confidence=confidence, resamples=resamples
+        )
+        verdict = "faster" if low > 1 else "slower" if high < 1 else "no change"
+        day, phase = key
+        rows.append(
+            {
+                "day": day,
+                "phase": phase,
+                "baseline": statistics.median(base_samples),
+                "candidate": statistics.median(samples),
+                "speedup": speedup,
+                "low": low,
+                "high": high,
+                "verdict": verdict,
+            }
+        )
+        print(
+            f"Day {day:>2} {phase:<{width}}"
+            f"{rows[-1]['baseline'] * 1000:>12.3f}{rows[-1]['candidate'] * 1000:>12.3f}"
+            f"{speedup:>9.2f}x  [{low:.2f}, {high:.2f}]  {verdict}"
+        )
+    return rows
+
+
+def complexity_report(
+    config: dict,
+    day: int,
+    part: int,
+    largest: int = None,
+    factor: float = 2.0,
+    steps: int = 6,
+    repeat: int = 3,
+) -> dict:
+    """
+    Solves one part on generated inputs of geometrically increasing size, up to largest
+    (default: the generated size from config.toml [perf] for that part). Each size is
+    timed as the best of repeat runs, and its peak allocation measured in a separate
+    run. Prints a row per size, then the fitted time and memory exponents, and returns
+    the fits.
+    """
+    import tempfile
+
+    from aoc_common import complexity, perf_budget
+    from aoc_common.memory import format_bytes, measure_memory
+
+    year = config["setup"]["year"]
+    module = load_problem_module(day, year)
+    generator = load_generator_module(day, year)
+    solver = getattr(module, f"part_{part}")
+    if largest is None:
+        budget = perf_budget.part_budget(day, part)
+        largest = perf_budget.generated_size(generator.PUZZLE_SIZE, budget)
+    sizes = complexity.geometric_sizes(largest, factor, steps)
+
+    print(f"\nDay {day} part {part} complexity (best of {repeat})\n")
+    print(f"{'size':>12}{'time (ms)':>14}{'peak':>14}")
+    times = []
+    peaks = []
+    with tempfile.TemporaryDirectory() as folder:
+        for size in sizes:
+            data_path = Path(folder) / f"size_{size}.txt"
+            data_path.write_text(generator.generate(size, seed=0))
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                input_data = module.parse_input(data_path)
+                times.append(min(time_call(solver, input_data, repeat=repeat)))
+                _, report = measure_memory(solver, input_data, top=0)
+            peaks.append(report.peak)
+            print(f"{size:>12}{times[-1] * 1000:>14.3f}{format_bytes(report.peak):>14}")
+
+    fits = {
+        "time": complexity.fit_exponent(sizes, times),
+        "memory": complexity.fit_exponent(sizes, peaks),
+    }
+    print()
+    for name, (exponent, r_squared) in fits.items():
+        label = complexity.big_o(exponent)
+        print(f"{name:<7}≈ {label:<10} (exponent {exponent:.2f}, r² {r_squared:.2f})")
+    return fits
+
+
+def differential_report(
+    config: dict,
+    day: int,
+    engines: list = None,
+    parts: list = None,
+    largest: int = None,
+    seeds: int = None,
+) -> bool:
+    """
+    Checks each engine (default: every one the day registers besides the reference)
+    against the reference engine on seeds generated inputs per size (default:
+    DEFAULT_SEEDS of aoc_common.differential), for each of parts (default: both), with
+    sizes doubling up to largest (default: the puzzle size). Prints each engine's
+    relative speed per size, and any mismatch on a minimized input. Returns False if any
+    engine disagreed with the reference.
+    """
+    import tempfile
+
+    from aoc_common import differential
+
+    seeds = seeds or differential.DEFAULT_SEEDS
+    year = config["setup"]["year"]
+    module = load_problem_module(day, year)
+    generator = load_generator_module(day, year)
+    engines = engines or [
+        engine for engine in module.ENGINES if engine != DEFAULT_ENGINE
+    ]
+    sizes = differential.default_sizes(largest or generator.PUZZLE_SIZE)
+    passed = True
+    print(f"\nDay {day} differential check ({seeds} inputs per size)\n")
+    with tempfile.TemporaryDirectory() as folder:
+        for engine in engines:
+            for part in parts or (1, 2):
+                with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(
+                    devnull
+                ):
+                    report = differential.check_engine(
+                        module,
+                        generator,
+                        part,
+                        engine,
+                        folder,
+                        sizes=sizes,
+                        seeds=seeds,
+                    )
+                print(report.describe())
+                passed = passed and report.mismatch is None
+    return passed
+
+
+def _format_solve(part: int, result: dict, previous: dict) -> str:
+    if "error" in result:
+        return f"  part {part}: failed: {result['error']}"
+    line = f"  part {part}: {result['answer']}  {result['solve_time'] * 1000:.3f} ms"
+    if previous and "answer" in previous:
+        delta = result["solve_time"] - previous["solve_time"]
+        ratio = (
+            result["solve_time"] / previous["solve_time"]
+            if previous["solve_time"]
+            else 1.0
+        )
+        line += f"  ({delta * 1000:+.3f} ms, {ratio:.2f}x)"
+        if result["answer"] != previous["answer"]:
+            line += f"  answer changed from {previous['answer']}"
+    return line
+
+
+def watch_problem(
+    config: dict,
+    day: int,
+    mode: str = "check",
+    parts: tuple = (1, 2),
+    engine: str = DEFAULT_ENGINE,
+    interval: float = 0.5,
+) -> None:
+    """
+    Solves a day's parts whenever a file in its folder changes, until interrupted.
+    The process stays warm between saves: only the day module is executed again, and the
+    parsed input is reused unless the input file or the parser changed. Each save prints
+    the answers, with solve time deltas against the previous save.
+    """
+    from aoc_common import watch
+
+    year = config["setup"]["year"]
+    module_path = problem_file_path(day, year)
+    session = watch.WarmSession(
+        lambda: watch.load_source(module_path),
+        mode,
+        parts,
+        engine,
+        phase_limits(config, day),
+    )
+    print(f"Watching {module_path.parent} for changes (Ctrl+C to stop)")
+    previous = {}
+    state = None
+    try:
+        while True:
+            current = watch.snapshot(module_path.parent)
+            if current != state:
+                state = current
+                print(f"\n[{time.strftime('%H:%M:%S')}] day {day} {mode}")
+                try:
+                    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(
+                        devnull
+                    ):
+                        refresh = session.refresh()
+                except Exception as exc:
+                    print(f"  failed: {type(exc).__name__}: {exc}")
+                else:
+                    if refresh["reparsed"]:
+                        print(
+                            f"  parsed input in {refresh['parse_time'] * 1000:.3f} ms"
+                        )
+                    else:
+                        print("  reused parsed input")
+                    for part, result in refresh["parts"].items():
+                        print(_format_solve(part, result, previous.get(part)))
+                        previous[part] = result
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def import_times(module_path: Path, repeat: int = 5) -> tuple:
+    """
+    Cold-imports a module in fresh interpreters under -X importtime, and keeps the
+    fastest run. Returns the module's cumulative import time in microseconds, and a list
+    of (cumulative microseconds, name) for the imports it made directly, slowest first.
+    """
+    code = (
+        f"import sys; sys.path.insert(0, {str(module_path.parent)!r}); "
+        f"import {module_path.stem}"
+    )
+    best = None
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        children = []
+        total = None
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            _, cumulative, name = line[len("import time:") :].split("|")
+            depth = (len(name) - len(name.lstrip())) // 2
+            if depth == 0:
+                if name.strip() == module_path.stem:
+                    total = int(cumulative)
+                    break
+                children = []
+            elif depth == 1:
+                children.append((int(cumulative), name.strip()))
+        if total is not None and (best is None or total < best[0]):
+            best = (total, sorted(children, reverse=True))
+    return best
+
+
+def startup_budget(config: dict, day: int) -> float:
+    """The import-time budget for a day, in milliseconds, from config.toml [startup]."""
+    startup_config = config.get("startup", {})
+    return startup_config.get("budgets_ms", {}).get(
+        str(day), startup_config.get("budget_ms")
+    )
+
+
+def startup_report(config: dict, days: list = None, top: int = 5) -> bool:
+    """
+    Prints the cold import time of each registered problem module, and its slowest
+    imports. Returns False if any module goes over its budget.
+    """
+    year = config["setup"]["year"]
+    within_budget = True
+    print(f"\nAdvent of Code {year} Startup\n")
+    for day in days or config["benchmark"]["registered_problems"]:
+        total, children = import_times(problem_file_path(day, year))
+        budget = startup_budget(config, day)
+        status = ""
+        if budget is not None:
+            over = total / 1000 > budget
+            within_budget = within_budget and not over
+            status = f"  (budget {budget:g} ms{', OVER' if over else ''})"
+        print(f"Day {day:>2}: {total / 1000:.2f} ms{status}")
+        for cumulative, name in children[:top]:
+            print(f"    {cumulative / 1000:>7.2f} ms  {name}")
+    return within_budget
+
+
+def run_problem(
+    day: int,
+    mode: str,
+    part: int,
+    year: int,
+    log_level: str = None,
+    quiet: bool = False,
+    profile: bool = False,
+    memory: bool = False,
+    no_cache: bool = False,
+    limits: watchdog.Limits = None,
+    engine: str = DEFAULT_ENGINE,
+) -> None:
+    """
+    Runs a specified problem. If a solver daemon is running, the problem is solved
+    there, which skips interpreter startup and reuses parsed input. Otherwise the
+    problem file runs in a new process. With profile set, the problem file writes
+    per-part profiles to the profiles/ folder. With memory set, it reports allocations
+    made while parsing and solving. The problem file reuses cached answers unless
+    no_cache is set; the daemon always solves. With limits, the problem file runs the
+    part under a watchdog. The daemon applies the limits it was started with instead,
+    but if it doesn't reply in time for a parse and a solve within limits (or
+    DAEMON_TIMEOUT_S without a time limit), or the connection fails, the problem file is
+    run as usual.
+    """
+    if log_level is None and not profile and not memory:
+        request = {"day": day, "mode": mode, "part": part, "engine": engine}
+        timeout = DAEMON_TIMEOUT_S
+        if limits and limits.time_s is not None:
+            timeout = 2 * limits.time_s + DAEMON_GRACE_S
+        try:
+            reply = solver_daemon.send_request(DAEMON_SOCKET, request, timeout=timeout)
+        except (FileNotFoundError, ConnectionRefusedError):
+            reply = None
+        except (OSError, ValueError) as exc:
+            print(
+                f"Solver daemon failed ({type(exc).__name__}), solving here",
+                file=sys.stderr,
+            )
+            reply = None
+        if reply is not None:
+            if "error" in reply:
+                print(reply["error"], file=sys.stderr)
+            elif not quiet:
+                print(reply["answer"])
+            return
+    day_str = "{:0>2d}".format(day)
+    folder_name = f"day_{day_str}"
+    file_name = f"aoc_{year}_day_{day_str}.py"
+    args = ["python3", f"{folder_name}/{file_name}", mode, str(part)]
+    if log_level is not None:
+        args.extend(["--log-level", f"{log_level}"])
+    if profile:
+        args.append("--profile")
+    if memory:
+        args.append("--memory")
+    if no_cache:
+        args.append("--no-cache")
+    if engine != DEFAULT_ENGINE:
+        args.extend(["--engine", engine])
+    if limits and limits.time_s is not None:
+        args.extend(["--time-limit", str(limits.time_s)])
+    if limits and limits.rss_mib is not None:
+        args.extend(["--rss-limit", str(limits.rss_mib)])
+    visible = subprocess.DEVNULL if quiet else None
+    subprocess.run(args, stdout=visible)
+
+
+_batch_module = None
+
+
+def _batch_init(day: int, year: int) -> None:
+    """Process pool initializer. Imports a day's module once per worker."""
+    global _batch_module
+    _batch_module = load_problem_module(day, year)
+
+
+def combined_limits(limits: dict, phases: list) -> watchdog.Limits:
+    """
+    One set of limits for running phases back to back in one process: the sum of their
+    time limits and the largest of their memory limits. A limit that any phase lacks is
+    left off.
+    """
+    chosen = [limits.get(phase, watchdog.Limits()) for phase in phases]
+    times = [phase_limits.time_s for phase_limits in chosen]
+    sizes = [phase_limits.rss_mib for phase_limits in chosen]
+    return watchdog.Limits(
+        time_s=None if None in times else sum(times),
+        rss_mib=None if None in sizes else max(sizes),
+    )
+
+
+def _attempt(func, arg) -> tuple:
+    """Runs func(arg). Returns (status, result, seconds, error message)."""
+    start = time.perf_counter()
+    try:
+        result = func(arg)
+    except Exception as exc:
+        return (
+            "error",
+            None,
+            time.perf_counter() - start,
+            f"{type(exc).__name__}: {exc}",
+        )
+    return "ok", result, time.perf_counter() - start, None
+
+
+def _solve_phases(
+    module: ModuleType, data_path: Path, parts: tuple, engine: str
+) -> tuple:
+    """
+    Parses data_path, then solves each part, in this process. Returns (an outcome, as
+    returned by _attempt, for the parse and then each part, leaving out the parsed
+    input, and the top-level modules imported for the first time along the way). A
+    failed parse is given as every part's outcome too.
+    """
+    before = set(sys.modules)
+    status, input_data, parse_time, error = _attempt(module.parse_input, data_path)
+    if status != "ok":
+        outcomes = [(status, None, parse_time, error)] + [
+            (status, None, None, error)
+        ] * len(parts)
+    else:
+        engine_solvers = solvers(module.ENGINES, engine)
+        outcomes = [(status, None, parse_time, error)]
+        for part in parts:
+            outcomes.append(_attempt(engine_solvers[part], input_data))
+    imported = {name.partition(".")[0] for name in set(sys.modules) - before}
+    return outcomes, sorted(imported)
+
+
+def _run_file(
+    module: ModuleType, data_path: Path, parts: tuple, engine: str, limits
+) -> tuple:
+    """
+    Runs _solve_phases under limits, turning a failure of the run into every outcome.
+    """
+    count = len(parts) + 1
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            return watchdog.run_limited(
+                _solve_phases, module, data_path, parts, engine, limits=limits
+            )
+    except watchdog.LimitExceeded as exc:
+        return [(exc.status, None, None, str(exc))] * count, []
+    except Exception as exc:
+        return [("error", None, None, f"{type(exc).__name__}: {exc}")] * count, []
+
+
+def solve_file(
+    module: ModuleType,
+    data_path: Path,
+    parts: tuple,
+    limits: dict = None,
+    engine: str = DEFAULT_ENGINE,
+) -> list:
+    """
+    Parses one input file once, then solves each requested part of it with engine. With
+    limits from the limits dict (as given by phase_limits), the parse and the parts run
+    together in one child process, under their limits combined, so the parsed input
+    never has to be sent between processes. Without limits, they run in this process.
+    Modules the run imports lazily (like numpy) are imported here too, so later files
+    start warm, and the file is solved again so its own timings don't include those
+    imports. Returns a row dict per part. A failure is recorded in that row's status and
+    error fields. A parse failure is recorded against every part, and so is going over
+    the combined limits, as the child is stopped whichever phase it was in.
+    """
+    phases = ["parse"] + [f"part_{part}" for part in parts]
+    file_limits = combined_limits(limits or {}, phases)
+    outcomes, imported = _run_file(module, data_path, parts, engine, file_limits)
+    if imported:
+        for name in imported:
+            if name not in sys.modules:
+                with contextlib.suppress(ImportError):
+                    importlib.import_module(name)
+        outcomes, _ = _run_file(module, data_path, parts, engine, file_limits)
+    _, _, parse_time, _ = outcomes[0]
+    rows = []
+    for part, (status, answer, solve_time, error) in zip(parts, outcomes[1:]):
+        row = dict.fromkeys(BATCH_FIELDS)
+        row.update(
+            file=str(data_path),
+            part=part,
+            status=status,
+            parse_time=parse_time,
+            solve_time=solve_time,
+            error=error,
+        )
+        if status == "ok":
+            row["answer"] = str(answer)
+        rows.append(row)
+    return rows
+
+
+def _batch_task(data_path: Path, parts: tuple, limits: dict, engine: str) -> list:
+    """Process pool entry point. Solves one file with the worker's module."""
+    return solve_file(_batch_module, data_path, parts, limits, engine)
+
+
+def expand_inputs(patterns: list) -> list:
+    """
+    Turns directories, glob patterns and file paths into a list of input files.
+    A directory contributes every .txt file in it, in name order.
+    """
+    import glob
+
+    paths = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.extend(sorted(path.glob("*.txt")))
+        elif glob.has_magic(pattern):
+            paths.extend(Path(match) for match in sorted(glob.glob(pattern)))
+        else:
+            paths.append(path)
+    return paths
+
+
+def batch(
+    config: dict,
+    day: int,
+    patterns: list,
+    parts: tuple = (1, 2),
+    jobs: int = None,
+    output_format: str = "csv",
+    output=None,
+    engine: str = DEFAULT_ENGINE,
+) -> bool:
+    """
+    Parses and solves every input file matched by patterns with one day's module and
+    engine. With jobs > 1, files are spread across that many worker processes, each of
+    which imports the module once. Each file is parsed and solved under the watchdog
+    limits from config.toml [limits] for its phases combined, if any, so one runaway
+    file can't stall the rest. Raises ValueError, before solving anything, if the day
+    has no such engine. Rows are written to output (default stdout) as CSV or JSON lines
+    as soon as each file is done, in input order. Returns False if any file or part
+    failed.
+    """
+    import csv
+    import json
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    year = config["setup"]["year"]
+    module = load_problem_module(day, year)
+    solvers(module.ENGINES, engine)
+    output = sys.stdout if output is None else output
+    paths = expand_inputs(patterns)
+    limits = phase_limits(config, day)
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=BATCH_FIELDS)
+        writer.writeheader()
+        write_row = writer.writerow
+    else:
+        write_row = lambda row: output.write(json.dumps(row) + "\n")
+
+    succeeded = True
+    if jobs is not None and jobs > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=jobs, initializer=_batch_init, initargs=(day, year)
+        )
+        with pool:
+            count = len(paths)
+            results = pool.map(
+                _batch_task, paths, [parts] * count, [limits] * count, [engine] * count
+            )
+            for rows in results:
+                for row in rows:
+                    succeeded = succeeded and row["status"] == "ok"
+                    write_row(row)
+                output.flush()
+    else:
+        for data_path in paths:
+            for row in solve_file(module, data_path, parts, limits, engine):
+                succeeded = succeeded and row["status"] == "ok"
+                write_row(row)
+            output.flush()
+    return succeeded
+
+
+def benchmark_cli(config: dict, argv: list) -> None:
+    from aoc_common import timings
+
+    parser = argparse.ArgumentParser(prog="problem_runner.py benchmark")
+    parser.add_argument(
+        "days", type=int, nargs="*", help="days to run (default: all registered)"
+    )
+    parser.add_argument("--warmup", type=int, required=False)
+    parser.add_argument("--repeat", type=int, required=False)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        required=False,
+        help="number of worker processes to spread tasks over",
+    )
+    parser.add_argument(
+        "--no-save",
+        required=False,
+        action="store_true",
+        help="don't record this run in the history",
+    )
+    parser.add_argument(
+        "--engines",
+        type=str,
+        nargs="+",
+        required=False,
+        help="engines to time side by side, or all"
+        " (default: the reference engine only)",
+    )
+    parser.add_argument(
+        "--export",
+        type=Path,
+        required=False,
+        help="also write the samples and peak memory to this .json or .csv file",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=timings.FORMATS,
+        required=False,
+        help="export format",
+    )
+    parser.add_argument(
+        "--no-share-inputs",
+        required=False,
+        action="store_true",
+        help="with --jobs, have every worker parse its own input"
+        " instead of sharing one",
+    )
+    args = parser.parse_args(argv)
+    if args.export is not None:
+        try:
+            timings.output_format(args.export, args.format)
+        except ValueError as exc:
+            parser.error(str(exc))
+    benchmark(
+        config,
+        warmup=args.warmup,
+        repeat=args.repeat,
+        days=args.days,
+        jobs=args.jobs,
+        save=not args.no_save,
+        engines=args.engines,
+        export=args.export,
+        export_format=args.format,
+        share_inputs=not args.no_share_inputs,
+    )
+
+
+def batch_cli(config: dict, argv: list) -> None:
+    parser = argparse.ArgumentParser(prog="problem_runner.py batch")
+    parser.add_argument("day", type=int, choices=range(101))
+    parser.add_argument(
+        "inputs", type=str, nargs="+", help="input files, directories or globs"
+    )
+    parser.add_argument("--parts", type=int, nargs="+", choices=(1, 2), default=[1, 2])
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        required=False,
+        help="number of worker processes to spread files over",
+    )
+    parser.add_argument("--format", type=str, choices=("csv", "jsonl"), default="csv")
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default=DEFAULT_ENGINE,
+        help="which implementation of the parts to run",
+    )
+    args = parser.parse_args(argv)
+    try:
+        succeeded = batch(
+            config,
+            args.day,
+            args.inputs,
+            tuple(args.parts),
+            args.jobs,
+            args.format,
+            engine=args.engine,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    if not succeeded:
+        raise SystemExit(1)
+
+
+def compare_cli(config: dict, argv: list) -> None:
+    parser = argparse.ArgumentParser(prog="problem_runner.py compare")
+    parser.add_argument(
+        "baseline", type=str, help="git revision (or prefix) to compare against"
+    )
+    parser.add_argument(
+        "--candidate",
+        type=str,
+        required=False,
+        help="revision to check (default: latest run)",
+    )
+    parser.add_argument(
+        "--alpha", type=float, required=False, help="significance level"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        required=False,
+        help="smallest slowdown to flag, as a fraction",
+    )
+    args = parser.parse_args(argv)
+    if not compare(config, args.baseline, args.candidate, args.alpha, args.threshold):
+        raise SystemExit(1)
+
+
+def cli(config):
+    year = config["setup"]["year"]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("day", type=int, choices=range(101))
+    parser.add_argument("mode", type=str, choices={"check", "solve"})
+    parser.add_argument("part", type=int, choices={1, 2})
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        required=False,
+        choices={"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"},
+    )
+    parser.add_argument("--quiet", required=False, action="store_true")
+    parser.add_argument("--profile", required=False, action="store_true")
+    parser.add_argument("--memory", required=False, action="store_true")
+    parser.add_argument(
+        "--no-cache",
+        required=False,
+        action="store_true",
+        help="recompute cached answers",
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default=DEFAULT_ENGINE,
+        help="which implementation of the part to run",
+    )
+    args = parser.parse_args()
+    run_problem(
+        args.day,
+        args.mode,
+        args.part,
+        year,
+        log_level=args.log_level,
+        quiet=args.quiet,
+        profile=args.profile,
+        memory=args.memory,
+        no_cache=args.no_cache,
+        limits=part_limits(config, args.day, args.part),
+        engine=args.engine,
+    )
+
+
+def daemon_cli(config: dict, argv: list) -> None:
+    parser = argparse.ArgumentParser(prog="problem_runner.py daemon")
+    parser.add_argument(
+        "--stop", required=False, action="store_true", help="stop a running daemon"
+    )
+    args = parser.parse_args(argv)
+    if args.stop:
+        solver_daemon.send_request(DAEMON_SOCKET, {"command": "shutdown"})
+        return
+    year = config["setup"]["year"]
+    modules = {
+        day: load_problem_module(day, year)
+        for day in config["benchmark"]["registered_problems"]
+    }
+    print(f"Solver daemon serving days {sorted(modules)} on {DAEMON_SOCKET}")
+    limits = {day: phase_limits(config, day) for day in modules}
+    solver_daemon.SolverDaemon(modules, limits=limits).serve(DAEMON_SOCKET)
+
+
+def complexity_cli(config: dict, argv: list) -> None:
+    parser = argparse.ArgumentParser(prog="problem_runner.py complexity")
+    parser.add_argument("day", type=int, choices=range(101))
+    parser.add_argument("part", type=int, choices={1, 2})
+    parser.add_argument(
+        "--largest",
+        type=int,
+        required=False,
+        help="largest input size, in generator units",
+    )
+    parser.add_argument("--factor", type=float, default=2.0, help="ratio between sizes")
+    parser.add_argument("--steps", type=int, default=6, help="number of sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per size")
+    args = parser.parse_args(argv)
+    complexity_report(
+        config,
+        args.day,
+        args.part,
+        largest=args.largest,
+        factor=args.factor,
+        steps=args.steps,
+        repeat=args.repeat,
+    )
+
+
+def differential_cli(config: dict, argv: list) -> None:
+    from aoc_common import differential
+
+    parser = argparse.ArgumentParser(prog="problem_runner.py differential")
+    parser.add_argument("day", type=int, choices=range(101))
+    parser.add_argument(
+        "--engines",
+        type=str,
+        nargs="+",
+        required=False,
+        help="engines to check (default: all)",
+    )
+    parser.add_argument(
+        "--parts",
+        type=int,
+        nargs="+",
+        choices={1, 2},
+        required=False,
+        help="default: both",
+    )
+    parser.add_argument(
+        "--largest",
+        type=int,
+        required=False,
+        help="largest input size, in generator units",
+    )
+    parser.add_argument(
+        "--seeds", type=int, default=differential.DEFAULT_SEEDS, help="inputs per size"
+    )
+    args = parser.parse_args(argv)
+    report = differential_report(
+        config,
+        args.day,
+        engines=args.engines,
+        parts=args.parts,
+        largest=args.largest,
+        seeds=args.seeds,
+    )
+    if not report:
+        raise SystemExit(1)
+
+
+def watch_cli(config: dict, argv: list) -> None:
+    parser = argparse.ArgumentParser(prog="problem_runner.py watch")
+    parser.add_argument("day", type=int, choices=range(101))
+    parser.add_argument(
+        "mode", type=str, nargs="?", default="check", choices={"check", "solve"}
+    )
+    parser.add_argument(
+        "--parts",
+        type=int,
+        nargs="+",
+        choices={1, 2},
+        default=[1, 2],
+        help="default: both",
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default=DEFAULT_ENGINE,
+        help="which implementation of the parts to run",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.5, help="seconds between polls"
+    )
+    args = parser.parse_args(argv)
+    watch_problem(
+        config,
+        args.day,
+        mode=args.mode,
+        parts=tuple(args.parts),
+        engine=args.engine,
+        interval=args.interval,
+    )
+
+
+def report_cli(config: dict, argv: list) -> None:
+    parser = argparse.ArgumentParser(prog="problem_runner.py report")
+    parser.add_argument("baseline", type=Path, help="timing export of the baseline")
+    parser.add_argument("candidate", type=Path, help="timing export of the candidate")
+    parser.add_argument(
+        "--confidence", type=float, default=0.95, help="confidence level"
+    )
+    parser.add_argument(
+        "--resamples", type=int, default=2000, help="bootstrap resamples"
+    )
+    args = parser.parse_args(argv)
+    timing_report(args.baseline, args.candidate, args.confidence, args.resamples)
+
+
+def startup_cli(config: dict, argv: list) -> None:
+    parser = argparse.ArgumentParser(prog="problem_runner.py startup")
+    parser.add_argument(
+        "days", type=int, nargs="*", help="days to run (default: all registered)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=5, help="number of slowest imports to list"
+    )
+    args = parser.parse_args(argv)
+    if not startup_report(config, days=args.days, top=args.top):
+        raise SystemExit(1)
+
+
+COMMANDS = {
+    "batch": batch_cli,
+    "benchmark": benchmark_cli,
+    "compare": compare_cli,
+    "complexity": complexity_cli,
+    "daemon": daemon_cli,
+    "differential": differential_cli,
+    "report": report_cli,
+    "startup": startup_cli,
+    "watch": watch_cli,
+}
+
+
+if __name__ == "__main__":
+    config = get_config(CONFIG_FILE)
+    if len(sys.argv) == 1:
+        benchmark(config)
+    elif sys.argv[1] in COMMANDS:
+        COMMANDS[sys.argv[1]](config, sys.argv[2:])
+    else:
+        cli(config)
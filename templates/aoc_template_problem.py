@@ -0,0 +1,198 @@
+import sys
+from functools import lru_cache
+
+from pathlib import Path
+
+REPO_FOLDER = Path(__file__).parent.parent
+if str(REPO_FOLDER) not in sys.path:
+    sys.path.append(str(REPO_FOLDER))
+
+from aoc_common.engines import DEFAULT_ENGINE, solvers
+from aoc_common.input_cache import cached_parse
+
+PARENT_FOLDER = Path(__file__).parent
+BASE_FILE_NAME = Path(__file__).stem
+INPUT_FILE_NAME = f"{BASE_FILE_NAME}_input.txt"
+SAMPLE_FILE_NAME = f"{BASE_FILE_NAME}_sample.txt"
+
+INPUT_PATH = PARENT_FOLDER / INPUT_FILE_NAME
+SAMPLE_PATH = PARENT_FOLDER / SAMPLE_FILE_NAME
+
+
+# ---=== PROBLEM CODE BELOW ===---
+
+
+def parse_input(data_path: Path) -> list:
+    """
+    Reads and formats input.
+    Should return the input data in a format where it is ready to be worked on.
+    """
+    with open(data_path, "r") as raw_input:
+        return [l.strip() for l in raw_input.readlines()]
+
+
+def part_1(input_data: list):
+    """Solution code for Part 1. Should return the solution."""
+    pass
+
+
+def part_2(input_data: list):
+    """Solution code for Part 2. Should return the solution."""
+    pass
+
+
+def run_direct():
+    """
+    This function runs if this file is executed directly, rather than using the
+    justfile interface. Useful for quick debugging and checking your work.
+    """
+    print(parse_input(SAMPLE_PATH))
+
+
+# ---=== PROBLEM CODE ABOVE ===---
+
+
+ENGINES = {"python": {1: part_1, 2: part_2}}
+
+
+@lru_cache(maxsize=None)
+def load_input(data_path: Path):
+    """
+    Parses the input at data_path once, and reuses the result for the life of the
+    process. Parsed inputs are also cached on disk, so later runs can skip parsing
+    unchanged input.
+    """
+    return cached_parse(parse_input, data_path)
+
+
+def problem_dispatch(
+    mode: str,
+    part: int,
+    log_level: str = None,
+    profile: bool = False,
+    memory: bool = False,
+    cache: bool = False,
+    time_limit: float = None,
+    rss_limit: float = None,
+    engine: str = DEFAULT_ENGINE,
+):
+    if log_level is not None:
+        from aoc_common import tracing
+
+        tracing.install(log_level)
+    if time_limit is not None or rss_limit is not None:
+        from aoc_common.watchdog import Limits, run_limited
+
+        return run_limited(
+            problem_dispatch,
+            mode,
+            part,
+            profile=profile,
+            memory=memory,
+            cache=cache,
+            engine=engine,
+            limits=Limits(time_limit, rss_limit),
+        )
+    parts = solvers(ENGINES, engine)
+    input_paths = {"check": SAMPLE_PATH, "solve": INPUT_PATH}
+    if profile:
+        from aoc_common.profiling import profile_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = profile_call(
+            parse_input, input_paths[mode], label=f"{label}_parse"
+        )
+        return profile_call(parts[part], input_data, label=f"{label}_solve")
+    if memory:
+        from aoc_common.memory import memory_call
+
+        label = f"{BASE_FILE_NAME}_part_{part}"
+        input_data = memory_call(parse_input, input_paths[mode], label=f"{label}_parse")
+        return memory_call(parts[part], input_data, label=f"{label}_solve")
+    if cache:
+        from aoc_common.answer_cache import cached_answer
+
+        return cached_answer(parts[part], load_input, input_paths[mode], part)
+    return parts[part](load_input(input_paths[mode]))
+
+
+def run_cli():
+    import argparse
+
+    from aoc_common.watchdog import LimitExceeded
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("mode", type=str, choices={"check", "solve"})
+    parser.add_argument("part", type=int, choices={1, 2})
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        required=False,
+        choices={"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"},
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        required=False,
+        default=DEFAULT_ENGINE,
+        choices=sorted(ENGINES),
+        help="which implementation of the part to run",
+    )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        action="store_true",
+        help="profile parsing and solving,"
+        " writing .prof and .collapsed files to profiles/",
+    )
+    parser.add_argument(
+        "--memory",
+        required=False,
+        action="store_true",
+        help="report peak and net allocations, and lines behind the peak,"
+        " for parsing and solving",
+    )
+    parser.add_argument(
+        "--no-cache",
+        required=False,
+        action="store_true",
+        help="recompute the answer even if it is cached"
+        " (caching is always off with --log-level)",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        required=False,
+        help="kill the run after this many seconds, reporting a timeout",
+    )
+    parser.add_argument(
+        "--rss-limit",
+        type=float,
+        required=False,
+        help="kill the run if its resident memory passes this many MiB,"
+        " reporting an oom",
+    )
+    args = parser.parse_args()
+    try:
+        answer = problem_dispatch(
+            args.mode,
+            args.part,
+            args.log_level,
+            profile=args.profile,
+            memory=args.memory,
+            cache=not args.no_cache and args.log_level is None,
+            time_limit=args.time_limit,
+            rss_limit=args.rss_limit,
+            engine=args.engine,
+        )
+    except LimitExceeded as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(answer)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 1:
+        raise SystemExit(run_direct())
+    else:
+        raise SystemExit(run_cli())